@@ -1,3 +1,8 @@
+from itertools import groupby
+from operator import gt
+from typing import Iterable, Self
+
+
 class AVLTree:
     class __Node:
         def __init__(self, value: int):
@@ -5,6 +10,7 @@ class AVLTree:
             self.left = None
             self.right = None
             self.height = 1
+            self.size = 1
             self.balance = 0
 
         def __repr__(self) -> str:
@@ -13,14 +19,92 @@ class AVLTree:
     def __init__(self) -> None:
         self.root = None
 
+    @classmethod
+    def from_sorted(cls, values: Iterable[int]) -> Self:
+        # O(n): корень - середина отрезка, половины - поддеревья, повороты не нужны
+        values = list(values)
+        if any(map(gt, values, values[1:])):
+            raise ValueError('Values must be sorted')
+
+        tree = cls()
+        tree.root = tree.__build([value for value, _ in groupby(values)])
+        return tree
+
+    @classmethod
+    def bulk_load(cls, values: Iterable[int]) -> Self:
+        return cls.from_sorted(sorted(values))
+
     def insert(self, value: int) -> None:
-        self.root = self.__insert(self.root, value)
+        path = []
+        node = self.root
+        while node is not None:
+            if value == node.value:
+                node.value = value
+                return
+            path.append(node)
+            node = node.left if value < node.value else node.right
+
+        if not path:
+            self.root = self.__Node(value)
+            return
+
+        if value < path[-1].value:
+            path[-1].left = self.__Node(value)
+        else:
+            path[-1].right = self.__Node(value)
+        self.__rebalance_path(path, 1)
 
     def delete(self, value: int) -> None:
-        self.root = self.__delete(self.root, value)
+        path = []
+        node = self.root
+        while node is not None and node.value != value:
+            path.append(node)
+            node = node.left if value < node.value else node.right
+
+        if node is None:
+            return
+
+        if node.left is not None and node.right is not None:
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.value = successor.value
+            node = successor
+
+        child = node.left if node.left is not None else node.right
+        if not path:
+            self.root = child
+        elif path[-1].left is node:
+            path[-1].left = child
+        else:
+            path[-1].right = child
+        self.__rebalance_path(path, -1)
 
     def search(self, value: int) -> __Node | None:
-        return self.__search(self.root, value)
+        node = self.root
+        while node is not None:
+            if value == node.value:
+                return node.value
+            node = node.left if value < node.value else node.right
+        return None
+
+    def __build(self, values: list[int]) -> __Node | None:
+        def build(low: int, high: int) -> AVLTree.__Node | None:
+            if low >= high:
+                return None
+            middle = (low + high) // 2
+            node = self.__Node(values[middle])
+            node.left = build(low, middle)
+            node.right = build(middle + 1, high)
+            # поддерево из k узлов, построенное делением пополам, имеет высоту k.bit_length()
+            node.size = high - low
+            node.height = node.size.bit_length()
+            node.balance = (high - middle - 1).bit_length() - (middle - low).bit_length()
+            return node
+
+        return build(0, len(values))
 
     @staticmethod
     def __height(node) -> int:
@@ -29,32 +113,39 @@ class AVLTree:
         return node.height
 
     @staticmethod
-    def __min_value_node(node: __Node) -> __Node:
-        current = node
-        while current.left is not None:
-            current = current.left
-        return current
+    def __size(node) -> int:
+        if node is None:
+            return 0
+        return node.size
 
     def __update_height(self, node: __Node) -> None:
         if node is not None:
             left_height = self.__height(node.left)
             right_height = self.__height(node.right)
             node.height = max(left_height, right_height) + 1
+            node.size = self.__size(node.left) + self.__size(node.right) + 1
             node.balance = right_height - left_height
 
-    def __insert(self, node: __Node, value: int) -> __Node:
-        if node is None:
-            return self.__Node(value)
-
-        if value < node.value:
-            node.left = self.__insert(node.left, value)
-        elif value > node.value:
-            node.right = self.__insert(node.right, value)
-        else:
-            node.value = value
-            return node
-
-        return self.__balance_node(node)
+    def __rebalance_path(self, path: list[__Node], delta: int) -> None:
+        # балансировка снизу вверх по пути поиска вместо раскрутки рекурсии; выше первого узла,
+        # чья высота не изменилась, меняются только размеры поддеревьев
+        for index in range(len(path) - 1, -1, -1):
+            node = path[index]
+            height = node.height
+            new_node = self.__balance_node(node)
+
+            if new_node is not node:
+                if index == 0:
+                    self.root = new_node
+                elif path[index - 1].left is node:
+                    path[index - 1].left = new_node
+                else:
+                    path[index - 1].right = new_node
+
+            if new_node.height == height:
+                for ancestor in path[:index]:
+                    ancestor.size += delta
+                return
 
     def __balance_node(self, node: __Node) -> __Node:
         self.__update_height(node)
@@ -95,44 +186,92 @@ class AVLTree:
 
         return y
 
-    def __delete(self, node: __Node, value: int) -> __Node | None:
-        if node is None:
-            return node
-
-        if value < node.value:
-            node.left = self.__delete(node.left, value)
-        elif value > node.value:
-            node.right = self.__delete(node.right, value)
-        else:
-            if node.left is None:
-                return node.right
-            elif node.right is None:
-                return node.left
-
-            temp = self.__min_value_node(node.right)
-            node.value = temp.value
-            node.right = self.__delete(node.right, temp.value)
-
-        return self.__balance_node(node)
+    def rank(self, value: int) -> int:
+        # количество элементов меньше value
+        result = 0
+        node = self.root
+        while node is not None:
+            if value <= node.value:
+                node = node.left
+            else:
+                result += self.__size(node.left) + 1
+                node = node.right
+        return result
 
-    def __search(self, node: __Node, value: int) -> __Node | None:
-        if node is None or node.value == value:
-            return node.value if node else None
+    def select(self, index: int) -> int:
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("Index out of range")
+
+        node = self.root
+        while True:
+            left_size = self.__size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index == left_size:
+                return node.value
+            else:
+                index -= left_size + 1
+                node = node.right
+
+    def count_range(self, low: int, high: int) -> int:
+        # элементы из полуинтервала [low, high)
+        return max(self.rank(high) - self.rank(low), 0)
+
+    def median(self) -> float:
+        count = len(self)
+        if not count:
+            raise ValueError('Cannot find median of empty tree')
+        if count % 2:
+            return self.select(count // 2)
+        return (self.select(count // 2 - 1) + self.select(count // 2)) / 2
+
+    def inorder_traversal(self, morris: bool = False) -> list[int]:
+        if morris:
+            return self._morris_traversal(self.root)
 
-        if value < node.value:
-            return self.__search(node.left, value)
-        return self.__search(node.right, value)
+        result = []
+        append = result.append
+        stack = []
+        push, pop = stack.append, stack.pop
+        node = self.root
+        while True:
+            while node is not None:
+                push(node)
+                node = node.left
+            if not stack:
+                return result
+            node = pop()
+            append(node.value)
+            node = node.right
 
-    def inorder_traversal(self) -> list[int]:
+    @staticmethod
+    def _morris_traversal(node: __Node | None) -> list[int]:
+        # без стека: правый указатель предшественника временно ведёт обратно в узел и снимается при возврате
         result = []
-        self._inorder_traversal(self.root, result)
+        while node is not None:
+            if node.left is None:
+                result.append(node.value)
+                node = node.right
+                continue
+
+            predecessor = node.left
+            while predecessor.right is not None and predecessor.right is not node:
+                predecessor = predecessor.right
+
+            if predecessor.right is None:
+                predecessor.right = node
+                node = node.left
+            else:
+                predecessor.right = None
+                result.append(node.value)
+                node = node.right
         return result
 
-    def _inorder_traversal(self, node: __Node, result: list[int]):
-        if node:
-            self._inorder_traversal(node.left, result)
-            result.append(node.value)
-            self._inorder_traversal(node.right, result)
+    def __len__(self) -> int:
+        return self.__size(self.root)
 
     def __str__(self) -> str:
         result = self.inorder_traversal()
@@ -153,3 +292,7 @@ if __name__ == "__main__":
     search_node = avl.search(30)
 
     print(avl)
+    print(f"bulk_load([5, 3, 9, 1, 3]): {AVLTree.bulk_load([5, 3, 9, 1, 3])}, "
+          f"высота from_sorted(range(1000)): {AVLTree.from_sorted(range(1000)).root.height}")
+    print(f"Элементов: {len(avl)}, меньше 55: {avl.rank(55)}, третий по величине: {avl.select(2)}, "
+          f"в [20, 60): {avl.count_range(20, 60)}, медиана: {avl.median()}")
@@ -8,15 +8,11 @@ class AdditionalBinaryTreeFunctions(BinarySearchTree):
 
     def preorder_traversal(self) -> list:
         # Прямой обход (корень -> левый -> правый)
-        result = []
-        self._preorder_recursive(self._root, result)
-        return result
+        return self._preorder(self._root)
 
     def postorder_traversal(self) -> list:
         # Обратный обход (левый -> правый -> корень)
-        result = []
-        self._postorder_recursive(self._root, result)
-        return result
+        return self._postorder(self._root)
 
     def level_order_traversal(self) -> list:
         # Обход в ширину (по уровням)
@@ -38,7 +34,7 @@ class AdditionalBinaryTreeFunctions(BinarySearchTree):
         return result
 
     def height(self) -> int:
-        return self._height_recursive(self._root)
+        return self._height(self._root)
 
     def size(self) -> int:
         return self._size
@@ -82,40 +78,75 @@ class AdditionalBinaryTreeFunctions(BinarySearchTree):
 
         return parent.value if parent is not None else None
 
-    def _preorder_recursive(self, node: BinarySearchTree._Node, result: list) -> None:
-        if node is not None:
+    @staticmethod
+    def _preorder(node: BinarySearchTree._Node) -> list:
+        result = []
+        stack = [node] if node is not None else []
+
+        while stack:
+            node = stack.pop()
             result.append(node.value)
-            self._preorder_recursive(node.left, result)
-            self._preorder_recursive(node.right, result)
 
-    def _postorder_recursive(self, node: BinarySearchTree._Node, result: list) -> None:
-        if node is not None:
-            self._postorder_recursive(node.left, result)
-            self._postorder_recursive(node.right, result)
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+
+        return result
+
+    @staticmethod
+    def _postorder(node: BinarySearchTree._Node) -> list:
+        # корень -> правый -> левый в обратном порядке
+        result = []
+        stack = [node] if node is not None else []
+
+        while stack:
+            node = stack.pop()
             result.append(node.value)
 
-    def _height_recursive(self, node: BinarySearchTree._Node) -> int:
-        if node is None:
-            return 0
+            if node.left is not None:
+                stack.append(node.left)
+            if node.right is not None:
+                stack.append(node.right)
 
-        return 1 + max(self._height_recursive(node.left), self._height_recursive(node.right))
+        result.reverse()
+        return result
+
+    def _height(self, node: BinarySearchTree._Node) -> int:
+        heights = self._subtree_heights(node)
+        return heights[node] if node is not None else 0
 
     def _check_balanced(self, node: BinarySearchTree._Node) -> int:
         if node is None:
             return 0
 
-        left_height = self._check_balanced(node.left)
-        if left_height == -1:
-            return -1
+        heights = self._subtree_heights(node)
+        for cur_node in heights:
+            if abs(heights.get(cur_node.left, 0) - heights.get(cur_node.right, 0)) > 1:
+                return -1
+
+        return heights[node]
+
+    @staticmethod
+    def _subtree_heights(node: BinarySearchTree._Node) -> dict:
+        # высоты всех поддеревьев за один обход: дети всегда обрабатываются раньше родителя
+        heights = {}
+        stack = [node] if node is not None else []
+        order = []
+
+        while stack:
+            node = stack.pop()
+            order.append(node)
 
-        right_height = self._check_balanced(node.right)
-        if right_height == -1:
-            return -1
+            if node.left is not None:
+                stack.append(node.left)
+            if node.right is not None:
+                stack.append(node.right)
 
-        if abs(left_height - right_height) > 1:
-            return -1
+        for node in reversed(order):
+            heights[node] = 1 + max(heights.get(node.left, 0), heights.get(node.right, 0))
 
-        return max(left_height, right_height) + 1
+        return heights
 
 
 if __name__ == "__main__":
@@ -50,7 +50,7 @@ class BinarySearchTree:
         if self.is_empty():
             raise ValueError('Cannot fined anything in empty binary tree')
 
-        return self._search_recursive(self._root, value)
+        return self._search(self._root, value)
 
     def delete(self, value: int) -> None:
         node_to_delete = self.search(value)
@@ -80,39 +80,71 @@ class BinarySearchTree:
 
     # tree traversal
 
-    def inorder_traversal(self) -> list:
+    def inorder_traversal(self, morris: bool = False) -> list:
+        if morris:
+            return self._morris_inorder(self._root)
+
         result = []
-        self._inorder_recursive(self._root, result)
+        append = result.append
+        stack = []
+        push, pop = stack.append, stack.pop
+        node = self._root
 
-        return result
+        while True:
+            while node is not None:
+                push(node)
+                node = node.left
+
+            if not stack:
+                return result
+
+            node = pop()
+            append(node.value)
+            node = node.right
 
     # protected methods
 
-    def _inorder_recursive(self, node: _Node, result: list):
-        if node is not None:
-            self._inorder_recursive(node.left, result)
-            result.append(node.value)
-            self._inorder_recursive(node.right, result)
+    @staticmethod
+    def _morris_inorder(node: _Node or None) -> list:
+        # O(1) памяти: правый указатель предшественника временно ведёт обратно в узел и снимается при возврате
+        result = []
 
-    def _search_recursive(self, node: _Node or None, value: int) -> _Node or None:
-        if node is None or node.value == value:
-            return node
+        while node is not None:
+            if node.left is None:
+                result.append(node.value)
+                node = node.right
+                continue
 
-        if value < node.value:
-            return self._search_recursive(node.left, value)
-        else:
-            return self._search_recursive(node.right, value)
+            predecessor = node.left
+            while predecessor.right is not None and predecessor.right is not node:
+                predecessor = predecessor.right
+
+            if predecessor.right is None:
+                predecessor.right = node
+                node = node.left
+            else:
+                predecessor.right = None
+                result.append(node.value)
+                node = node.right
+
+        return result
+
+    @staticmethod
+    def _search(node: _Node or None, value: int) -> _Node or None:
+        while node is not None and node.value != value:
+            node = node.left if value < node.value else node.right
+
+        return node
 
     def _delete_node(self, node: _Node):
-        if node.is_leaf():
-            self._replace_node_in_parent(node, None)
-        elif node.has_one_child():
-            child = node.left if node.left is not None else node.right
-            self._replace_node_in_parent(node, child)
-        else:
+        if not node.is_leaf() and not node.has_one_child():
+            # у преемника нет левого ребёнка, поэтому он удаляется как лист или узел с одним ребёнком
             successor = self._find_min(node.right)
             node.value = successor.value
-            self._delete_node(successor)
+            node = successor
+
+        child = node.left if node.left is not None else node.right
+        self._replace_node_in_parent(node, child)
 
     def _replace_node_in_parent(self, node: _Node, new_node: _Node or None) -> None:
         if node.parent is None:
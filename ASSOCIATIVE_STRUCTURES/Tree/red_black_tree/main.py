@@ -1,4 +1,5 @@
-from typing import Literal, Optional
+from operator import gt
+from typing import Iterable, Iterator, Literal, Optional, Self
 
 Colors = Literal['RED', 'BLACK']
 
@@ -11,14 +12,32 @@ class RedBlackTree:
             self.left = None
             self.right = None
             self.parent = None
+            self.size = 1
 
         def __repr__(self) -> str:
             return f'node({self.value})'
 
     def __init__(self) -> None:
         self.__NIL = self.__Node(None, 'BLACK')
+        self.__NIL.size = 0
         self.__root = self.__NIL
 
+    @classmethod
+    def from_sorted(cls, values: Iterable[int]) -> Self:
+        # O(n): дерево строится делением отрезка пополам, поэтому все уровни, кроме последнего, заполнены.
+        # Чёрные все узлы, кроме последнего уровня: красные листья не нарушают чёрную высоту
+        values = list(values)
+        if any(map(gt, values, values[1:])):
+            raise ValueError('Values must be sorted')
+
+        tree = cls()
+        tree.__root = tree.__build(values)
+        return tree
+
+    @classmethod
+    def bulk_load(cls, values: Iterable[int]) -> Self:
+        return cls.from_sorted(sorted(values))
+
     def insert(self, value: Optional[int] = None) -> None:
         new_node = self.__Node(value, 'RED')
         new_node.left = self.__NIL
@@ -29,6 +48,7 @@ class RedBlackTree:
 
         while current != self.__NIL:
             parent = current
+            current.size += 1
             if new_node.value < current.value:
                 current = current.left
             else:
@@ -60,8 +80,13 @@ class RedBlackTree:
         node = self.search(value)
         if node is None:
             return
+        self.__delete_node(node)
 
+    def __delete_node(self, node: __Node) -> None:
         original_color = node.color
+        if node.left == self.__NIL or node.right == self.__NIL:
+            self.__decrement_sizes(node.parent)
+
         if node.left == self.__NIL:
             x = node.right
             self.__transplant(node, node.right)
@@ -71,6 +96,9 @@ class RedBlackTree:
         else:
             successor = self.__minimum(node.right)
             original_color = successor.color
+            # преемник уходит со своего места и занимает место node вместе с размером её поддерева
+            self.__decrement_sizes(successor.parent)
+            successor.size = node.size
             x = successor.right
 
             if successor.parent == node:
@@ -94,19 +122,135 @@ class RedBlackTree:
         if node is None:
             node = self.__root
 
-        if node != self.__NIL:
-            self.inorder_traversal(node.left, result)
+        stack = []
+        while stack or node != self.__NIL:
+            while node != self.__NIL:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
             result.append((node.value, node.color))
-            self.inorder_traversal(node.right, result)
+            node = node.right
 
         return result
 
+    def rank(self, value: int) -> int:
+        # количество элементов меньше value
+        result = 0
+        node = self.__root
+        while node != self.__NIL:
+            if value <= node.value:
+                node = node.left
+            else:
+                result += node.left.size + 1
+                node = node.right
+        return result
+
+    def select(self, index: int) -> int:
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("Index out of range")
+
+        node = self.__root
+        while True:
+            left_size = node.left.size
+            if index < left_size:
+                node = node.left
+            elif index == left_size:
+                return node.value
+            else:
+                index -= left_size + 1
+                node = node.right
+
+    def count_range(self, low: int, high: int) -> int:
+        # элементы из полуинтервала [low, high)
+        return max(self.rank(high) - self.rank(low), 0)
+
+    def median(self) -> float:
+        count = len(self)
+        if not count:
+            raise ValueError('Cannot find median of empty tree')
+        if count % 2:
+            return self.select(count // 2)
+        return (self.select(count // 2 - 1) + self.select(count // 2)) / 2
+
+    def irange(self, low: Optional[int] = None, high: Optional[int] = None, reverse: bool = False) -> Iterator[int]:
+        # значения из [low, high) лениво: спуск кладёт в стек только узлы внутри ближней границы
+        stack = []
+        node = self.__root
+        while node != self.__NIL:
+            if not reverse and low is not None and node.value < low:
+                node = node.right
+            elif reverse and high is not None and node.value >= high:
+                node = node.left
+            else:
+                stack.append(node)
+                node = node.right if reverse else node.left
+
+        while stack:
+            node = stack.pop()
+            if not reverse and high is not None and node.value >= high:
+                return
+            if reverse and low is not None and node.value < low:
+                return
+
+            yield node.value
+
+            node = node.left if reverse else node.right
+            while node != self.__NIL:
+                stack.append(node)
+                node = node.right if reverse else node.left
+
+    def floor(self, value: int) -> Optional[int]:
+        return self.__bound(value, below=True, inclusive=True)
+
+    def ceiling(self, value: int) -> Optional[int]:
+        return self.__bound(value, below=False, inclusive=True)
+
+    def lower(self, value: int) -> Optional[int]:
+        return self.__bound(value, below=True, inclusive=False)
+
+    def higher(self, value: int) -> Optional[int]:
+        return self.__bound(value, below=False, inclusive=False)
+
+    def delete_range(self, low: Optional[int] = None, high: Optional[int] = None) -> int:
+        # разрез по двум границам и склейка крайних частей: O(log n), середина отбрасывается целиком
+        nil = self.__NIL
+        root = self.__root
+        height = self.__black_height(root)
+
+        left, left_height, rest, rest_height = (
+            (nil, 0, root, height) if low is None else self.__split(root, height, low))
+        middle, _, right, right_height = (
+            (rest, rest_height, nil, 0) if high is None else self.__split(rest, rest_height, high))
+
+        if left == nil or right == nil:
+            root = right if left == nil else left
+        else:
+            # минимум правой части становится связующим узлом
+            self.__root = right
+            right.parent = nil
+            link = self.__minimum(right)
+            self.__delete_node(link)
+            right = self.__root
+            root, _ = self.__join(left, left_height, link, right, self.__black_height(right))
+
+        root.parent = nil
+        root.color = 'BLACK'
+        self.__root = root
+        return middle.size
+
     def height(self, node: Optional[__Node] = None) -> int:
         if node is None:
             node = self.__root
-        if node == self.__NIL:
-            return 0
-        return 1 + max(self.height(node.left), self.height(node.right))
+
+        height = 0
+        level = [node] if node != self.__NIL else []
+        while level:
+            height += 1
+            level = [child for cur_node in level for child in (cur_node.left, cur_node.right) if child != self.__NIL]
+        return height
 
     def __left_rotate(self, x: __Node) -> None:
         y = x.right
@@ -127,6 +271,9 @@ class RedBlackTree:
         y.left = x
         x.parent = y
 
+        y.size = x.size
+        x.size = x.left.size + x.right.size + 1
+
     def __right_rotate(self, y: __Node) -> None:
         x = y.left
         y.left = x.right
@@ -146,7 +293,10 @@ class RedBlackTree:
         x.right = y
         y.parent = x
 
-    def __insert_fixup(self, node: __Node) -> None:
+        x.size = y.size
+        y.size = y.left.size + y.right.size + 1
+
+    def __insert_fixup(self, node: __Node) -> bool:
         while node.parent.color == 'RED':
             if node.parent == node.parent.parent.left:
                 uncle = node.parent.parent.right
@@ -181,7 +331,10 @@ class RedBlackTree:
                     node.parent.parent.color = 'RED'
                     self.__left_rotate(node.parent.parent)
 
+        # красный корень перекрашивается, и чёрная высота дерева растёт на 1 - это нужно __join
+        grew = self.__root.color == 'RED'
         self.__root.color = 'BLACK'
+        return grew
 
     def __transplant(self, u, v) -> None:
         if u.parent == self.__NIL:
@@ -192,6 +345,128 @@ class RedBlackTree:
             u.parent.right = v
         v.parent = u.parent
 
+    def __bound(self, value: int, below: bool, inclusive: bool) -> Optional[int]:
+        best = None
+        node = self.__root
+        while node != self.__NIL:
+            if node.value == value and inclusive:
+                return value
+            if (node.value < value) == below and node.value != value:
+                best = node.value
+                node = node.right if below else node.left
+            else:
+                node = node.left if below else node.right
+        return best
+
+    def __build(self, values: list[int]) -> __Node:
+        nil = self.__NIL
+        red_depth = len(values).bit_length() - 1
+
+        def build(low: int, high: int, parent: RedBlackTree.__Node, depth: int) -> RedBlackTree.__Node:
+            if low >= high:
+                return nil
+            middle = (low + high) // 2
+            node = self.__Node(values[middle], 'RED' if depth == red_depth and depth else 'BLACK')
+            node.parent = parent
+            node.left = build(low, middle, node, depth + 1)
+            node.right = build(middle + 1, high, node, depth + 1)
+            node.size = high - low
+            return node
+
+        return build(0, len(values), nil, 0)
+
+    def __black_height(self, node: __Node) -> int:
+        # чёрных узлов на пути вниз, считая сам node и не считая NIL
+        height = 0
+        while node != self.__NIL:
+            height += node.color == 'BLACK'
+            node = node.left
+        return height
+
+    def __join(self, left: __Node, left_height: int, middle: __Node, right: __Node,
+               right_height: int) -> tuple[__Node, int]:
+        # все значения left <= middle <= все значения right; возвращает (корень, чёрная высота).
+        # middle красным встаёт по краю более высокого дерева на место чёрного поддерева той же
+        # чёрной высоты, что у низкого, и возможный двойной красный чинит обычная балансировка вставки
+        nil = self.__NIL
+        if left_height != right_height:
+            # корни обоих деревьев чёрные: под красным middle не окажется красного ребёнка,
+            # а у красного родителя middle всегда есть дед
+            if left.color == 'RED':
+                left.color = 'BLACK'
+                left_height += 1
+            if right.color == 'RED':
+                right.color = 'BLACK'
+                right_height += 1
+
+        if left_height == right_height:
+            middle.left, middle.right, middle.parent = left, right, nil
+            middle.color = 'BLACK'
+            middle.size = left.size + right.size + 1
+            for child in (left, right):
+                if child != nil:
+                    child.parent = middle
+            return middle, left_height + 1
+
+        return self.__join_unequal(left, left_height, middle, right, right_height)
+
+    def __join_unequal(self, left: __Node, left_height: int, middle: __Node, right: __Node,
+                       right_height: int) -> tuple[__Node, int]:
+        nil = self.__NIL
+        to_right = left_height > right_height
+        tall, short, height, target = (left, right, left_height, right_height) if to_right else \
+            (right, left, right_height, left_height)
+
+        parent = nil
+        node = tall
+        while node.color == 'RED' or height > target:
+            height -= node.color == 'BLACK'
+            node.size += short.size + 1
+            parent = node
+            node = node.right if to_right else node.left
+
+        middle.color = 'RED'
+        middle.parent = parent
+        middle.left, middle.right = (node, short) if to_right else (short, node)
+        middle.size = node.size + short.size + 1
+        for child in (node, short):
+            if child != nil:
+                child.parent = middle
+        if to_right:
+            parent.right = middle
+        else:
+            parent.left = middle
+
+        # повороты и балансировка работают с __root - на время склейки это корень высокого дерева
+        tall.parent = nil
+        self.__root = tall
+        grew = self.__insert_fixup(middle)
+        return self.__root, max(left_height, right_height) + grew
+
+    def __split(self, node: __Node, height: int, value: int) -> tuple[__Node, int, __Node, int]:
+        # (значения < value, их чёрная высота, значения >= value, их чёрная высота): куски по сторонам
+        # пути поиска склеиваются снизу вверх, сумма разностей высот при склейках - O(log n)
+        path = []
+        while node != self.__NIL:
+            path.append((node, height))
+            height -= node.color == 'BLACK'
+            node = node.right if node.value < value else node.left
+
+        left = right = self.__NIL
+        left_height = right_height = 0
+        for node, height in reversed(path):
+            child_height = height - (node.color == 'BLACK')
+            if node.value < value:
+                left, left_height = self.__join(node.left, child_height, node, left, left_height)
+            else:
+                right, right_height = self.__join(right, right_height, node, node.right, child_height)
+        return left, left_height, right, right_height
+
+    def __decrement_sizes(self, node: __Node) -> None:
+        while node != self.__NIL:
+            node.size -= 1
+            node = node.parent
+
     def __minimum(self, node) -> __Node:
         while node.left != self.__NIL:
             node = node.left
@@ -250,6 +525,9 @@ class RedBlackTree:
 
         x.color = 'BLACK'
 
+    def __len__(self) -> int:
+        return self.__root.size
+
     def __str__(self) -> str:
         return f'red_black_tree({self.inorder_traversal()})'
 
@@ -267,8 +545,17 @@ if __name__ == "__main__":
     print("In-order обход:", rb_tree.inorder_traversal())
 
     print("Высота дерева:", rb_tree.height())
+    print(f"Элементов: {len(rb_tree)}, меньше 30: {rb_tree.rank(30)}, пятый по величине: {rb_tree.select(4)}, "
+          f"в [15, 40): {rb_tree.count_range(15, 40)}, медиана: {rb_tree.median()}")
 
     rb_tree.delete(25)
     print("После удаления 25:", rb_tree.inorder_traversal())
 
+    print(f"[15, 40): {list(rb_tree.irange(15, 40))}, floor(26) = {rb_tree.floor(26)}, "
+          f"ceiling(26) = {rb_tree.ceiling(26)}, lower(30) = {rb_tree.lower(30)}, higher(30) = {rb_tree.higher(30)}")
+    print(f"delete_range(15, 40) удалил {rb_tree.delete_range(15, 40)}: {[value for value, _ in rb_tree.inorder_traversal()]}")
+
     print(rb_tree)
+
+    bulk = RedBlackTree.bulk_load([7, 3, 9, 1, 5, 3])
+    print(f"bulk_load: {bulk}, высота from_sorted(range(1000)): {RedBlackTree.from_sorted(range(1000)).height()}")
@@ -0,0 +1,128 @@
+import struct
+from hashlib import blake2b
+from math import ceil, log
+from typing import Any
+
+_MAGIC = b'BLOOM001'
+_HEADER = struct.Struct('<8sQI')
+_MASK = (1 << 64) - 1
+
+
+class BloomFilter:
+    # k позиций получаются двойным хешированием одного 64-битного хеша: h1 + i * h2
+    def __init__(self, expected_items: int, false_positive_rate: float = 0.01) -> None:
+        if expected_items < 1:
+            raise ValueError('Expected items count must be positive')
+        if not 0 < false_positive_rate < 1:
+            raise ValueError('False positive rate must be between 0 and 1')
+
+        self.bits = max(ceil(-expected_items * log(false_positive_rate) / log(2) ** 2), 8)
+        self.hashes = max(round(self.bits / expected_items * log(2)), 1)
+        self.__array = bytearray((self.bits + 7) // 8)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'BloomFilter':
+        magic, bits, hashes = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError('Data does not contain a bloom filter')
+
+        bloom = cls.__new__(cls)
+        bloom.bits, bloom.hashes = bits, hashes
+        bloom.__array = bytearray(data[_HEADER.size:])
+        return bloom
+
+    def add(self, item: Any) -> None:
+        self.add_hash(self.__hash(item))
+
+    def add_hash(self, full_hash: int) -> None:
+        array, bits = self.__array, self.bits
+        position, step = full_hash & 0xFFFFFFFF, (full_hash >> 32) | 1
+
+        for _ in range(self.hashes):
+            bit = position % bits
+            array[bit >> 3] |= 1 << (bit & 7)
+            position += step
+
+    def contains_hash(self, full_hash: int) -> bool:
+        array, bits = self.__array, self.bits
+        position, step = full_hash & 0xFFFFFFFF, (full_hash >> 32) | 1
+
+        for _ in range(self.hashes):
+            bit = position % bits
+            if not array[bit >> 3] & (1 << (bit & 7)):
+                return False
+            position += step
+
+        return True
+
+    def union(self, other: 'BloomFilter') -> 'BloomFilter':
+        return self.__combine(other, lambda left, right: left | right)
+
+    def intersection(self, other: 'BloomFilter') -> 'BloomFilter':
+        return self.__combine(other, lambda left, right: left & right)
+
+    def approximate_count(self) -> float:
+        # оценка Свами-Бапата по количеству установленных битов
+        ones = sum(bin(byte).count('1') for byte in self.__array)
+        if ones >= self.bits:
+            return float('inf')
+        return -self.bits / self.hashes * log(1 - ones / self.bits)
+
+    def false_positive_rate(self) -> float:
+        ones = sum(bin(byte).count('1') for byte in self.__array)
+        return (ones / self.bits) ** self.hashes
+
+    def to_bytes(self) -> bytes:
+        return _HEADER.pack(_MAGIC, self.bits, self.hashes) + bytes(self.__array)
+
+    def __combine(self, other: 'BloomFilter', operation: Any) -> 'BloomFilter':
+        if self.bits != other.bits or self.hashes != other.hashes:
+            raise ValueError('Bloom filters must have the same size and number of hashes')
+
+        result = BloomFilter.__new__(BloomFilter)
+        result.bits, result.hashes = self.bits, self.hashes
+        result.__array = bytearray(operation(left, right) for left, right in zip(self.__array, other.__array))
+        return result
+
+    @staticmethod
+    def __hash(item: Any) -> int:
+        # для str и bytes хеш не зависит от PYTHONHASHSEED, чтобы сериализованный фильтр работал в других процессах
+        if isinstance(item, str):
+            item = item.encode()
+        if isinstance(item, bytes):
+            return int.from_bytes(blake2b(item, digest_size=8).digest(), 'little')
+
+        value = (hash(item) * 0x9E3779B97F4A7C15) & _MASK
+        return value ^ (value >> 29)
+
+    def __contains__(self, item: Any) -> bool:
+        return self.contains_hash(self.__hash(item))
+
+    def __or__(self, other: 'BloomFilter') -> 'BloomFilter':
+        return self.union(other)
+
+    def __and__(self, other: 'BloomFilter') -> 'BloomFilter':
+        return self.intersection(other)
+
+    def __str__(self) -> str:
+        return f'bloom_filter(bits={self.bits}, hashes={self.hashes}, ~{self.approximate_count():.0f} items)'
+
+
+if __name__ == "__main__":
+    bloom = BloomFilter(1000, 0.01)
+    for i in range(1000):
+        bloom.add(f"key{i}")
+
+    false_positives = sum(f"other{i}" in bloom for i in range(10000))
+
+    print(bloom)
+    print(f"key1 в фильтре? {'key1' in bloom}")
+    print(f"Доля ложных срабатываний: {false_positives / 10000:.4f} (оценка {bloom.false_positive_rate():.4f})")
+
+    other = BloomFilter(1000, 0.01)
+    other.add("key1")
+    other.add("extra")
+
+    restored = BloomFilter.from_bytes((bloom | other).to_bytes())
+    print(f"Объединение содержит extra? {'extra' in restored}")
+    print(f"Пересечение содержит key1? {'key1' in (bloom & other)}, key2? {'key2' in (bloom & other)}")
@@ -0,0 +1,66 @@
+import sys
+from random import Random
+from threading import Barrier, Lock, Thread
+from time import perf_counter
+
+from ASSOCIATIVE_STRUCTURES.concurrent_hash_table.main import ConcurrentHashTable
+from ASSOCIATIVE_STRUCTURES.hash_table.main import HashTable
+
+KEYS = 100_000
+OPERATIONS = 200_000
+WRITE_SHARE = 0.1
+
+
+class GlobalLockHashTable:
+    # то, что было до шардирования: одна HashTable под одной блокировкой
+    def __init__(self) -> None:
+        self.__table = HashTable(KEYS * 2)
+        self.__lock = Lock()
+
+    def put(self, key: int, value: int) -> None:
+        with self.__lock:
+            self.__table.put(key, value)
+
+    def get(self, key: int) -> int:
+        with self.__lock:
+            return self.__table.get(key)
+
+
+def run(table: GlobalLockHashTable | ConcurrentHashTable, threads: int) -> float:
+    for key in range(KEYS):
+        table.put(key, key)
+
+    barrier = Barrier(threads + 1)
+    per_thread = OPERATIONS // threads
+
+    def worker(seed: int) -> None:
+        random = Random(seed)
+        plan = [(random.randrange(KEYS), random.random() < WRITE_SHARE) for _ in range(per_thread)]
+        barrier.wait()
+        for key, is_write in plan:
+            if is_write:
+                table.put(key, key)
+            else:
+                table.get(key)
+
+    workers = [Thread(target=worker, args=(seed,)) for seed in range(threads)]
+    for thread in workers:
+        thread.start()
+
+    barrier.wait()
+    start = perf_counter()
+    for thread in workers:
+        thread.join()
+
+    return per_thread * threads / (perf_counter() - start)
+
+
+if __name__ == "__main__":
+    gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'включён' if gil_enabled else 'выключен (free-threaded)'}")
+    print(f"{'потоков':>8} {'глобальная блокировка, оп/с':>30} {'шарды, оп/с':>15}")
+
+    for threads in (1, 2, 4, 8, 16):
+        global_lock = run(GlobalLockHashTable(), threads)
+        sharded = run(ConcurrentHashTable(KEYS * 2, shards=64), threads)
+        print(f"{threads:>8} {global_lock:>30,.0f} {sharded:>15,.0f}")
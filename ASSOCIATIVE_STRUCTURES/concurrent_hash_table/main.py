@@ -0,0 +1,130 @@
+from random import getrandbits
+from threading import RLock
+from typing import Any, Callable, Iterator
+
+from ASSOCIATIVE_STRUCTURES.hash_table.main import HashTable, mix_hash
+
+_MISSING = object()
+# соль, из которой при заданном seed выводится seed выбора шарда
+_SHARD_SALT = 0x5851F42D4C957F2D
+
+
+class ConcurrentHashTable:
+    # Ключи разбиты по шардам, у каждого шарда своя HashTable и своя блокировка,
+    # поэтому потоки, работающие с разными шардами, не ждут друг друга
+    def __init__(self, size: int = 64, shards: int = 16, **table_options: Any) -> None:
+        if shards < 1:
+            raise ValueError('Shards count must be positive')
+
+        shard_size = max(size // shards, 1)
+        self.__tables = [HashTable(shard_size, **table_options) for _ in range(shards)]
+        self.__locks = [RLock() for _ in range(shards)]
+        # шард выбирается той же хеш-функцией, что и ячейка в таблице; seed берётся производный:
+        # с общим seed у ключей одного шарда совпадали бы младшие биты и в самой таблице
+        self.__hash_function = table_options.get('hash_function', hash)
+        seed = table_options.get('seed')
+        self.__seed = getrandbits(64) if seed is None else mix_hash(seed, _SHARD_SALT)
+
+    @property
+    def shards(self) -> int:
+        return len(self.__tables)
+
+    def put(self, key: Any, value: Any) -> None:
+        shard = self.__shard(key)
+        with self.__locks[shard]:
+            self.__tables[shard].put(key, value)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        shard = self.__shard(key)
+        with self.__locks[shard]:
+            return self.__tables[shard].get(key, default)
+
+    def delete(self, key: Any) -> bool:
+        shard = self.__shard(key)
+        with self.__locks[shard]:
+            return self.__tables[shard].delete(key)
+
+    def get_or_insert(self, key: Any, value: Any) -> Any:
+        # атомарно: возвращает текущее значение или вставляет value
+        shard = self.__shard(key)
+        with self.__locks[shard]:
+            table = self.__tables[shard]
+            current = table.get(key, _MISSING)
+            if current is _MISSING:
+                table.put(key, value)
+                return value
+            return current
+
+    def compute_if_absent(self, key: Any, factory: Callable[[Any], Any]) -> Any:
+        # factory вызывается под блокировкой шарда не больше одного раза на ключ
+        shard = self.__shard(key)
+        with self.__locks[shard]:
+            table = self.__tables[shard]
+            current = table.get(key, _MISSING)
+            if current is _MISSING:
+                current = factory(key)
+                table.put(key, current)
+            return current
+
+    def load_factor(self) -> float:
+        return len(self) / sum(table.size for table in self.__tables)
+
+    def keys(self) -> Iterator[Any]:
+        for key, value in self.items():
+            yield key
+
+    def values(self) -> Iterator[Any]:
+        for key, value in self.items():
+            yield value
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        # слабо согласованный обход: каждый шард копируется под своей блокировкой,
+        # изменения в ещё не пройденных шардах будут видны, в пройденных - нет
+        for lock, table in zip(self.__locks, self.__tables):
+            with lock:
+                snapshot = list(table.items())
+            yield from snapshot
+
+    def __shard(self, key: Any) -> int:
+        return mix_hash(self.__hash_function(key), self.__seed) % len(self.__tables)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.put(key, value)
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(f"Key '{key}' not found")
+        return value
+
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.keys()
+
+    def __len__(self) -> int:
+        return sum(len(table) for table in self.__tables)
+
+    def __str__(self) -> str:
+        items = (f"{key}: {value}" for key, value in self.items())
+        return "concurrent_hash_table(" + ", ".join(items) + ")"
+
+
+if __name__ == "__main__":
+    from concurrent.futures import ThreadPoolExecutor
+
+    cht = ConcurrentHashTable(shards=4)
+
+    def worker(worker_id: int) -> None:
+        for i in range(1000):
+            cht.put(f"worker{worker_id}:{i}", i)
+            cht.compute_if_absent(f"shared{i % 10}", lambda key: worker_id)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(worker, range(8)))
+
+    print(f"Количество элементов: {len(cht)}")
+    print(f"Коэффициент заполнения: {cht.load_factor():.2f}")
+    print(f"shared0 -> {cht['shared0']}")
+    print(f"get_or_insert -> {cht.get_or_insert('new', 1)}, {cht.get_or_insert('new', 2)}")
@@ -0,0 +1,46 @@
+from random import Random
+from time import perf_counter_ns
+
+from ASSOCIATIVE_STRUCTURES.cuckoo_hash_table.main import CuckooHashTable
+from ASSOCIATIVE_STRUCTURES.hash_table.main import HashTable
+
+KEYS = 200_000
+LOOKUPS = 200_000
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+def latencies(table: HashTable | CuckooHashTable, keys: list[str]) -> list[int]:
+    # замер каждого поиска отдельно: нас интересует хвост распределения, а не среднее
+    result = []
+    for key in keys:
+        start = perf_counter_ns()
+        table.get(key)
+        result.append(perf_counter_ns() - start)
+    result.sort()
+    return result
+
+
+def report(name: str, samples: list[int]) -> None:
+    columns = [f"{samples[min(int(len(samples) * p / 100), len(samples) - 1)]:>8}" for p in PERCENTILES]
+    print(f"{name:<28}" + "".join(columns) + f"{samples[-1]:>10}")
+
+
+if __name__ == "__main__":
+    random = Random(1)
+    keys = [f"key{i}" for i in range(KEYS)]
+    hits = [random.choice(keys) for _ in range(LOOKUPS)]
+    misses = [f"missing{i}" for i in range(LOOKUPS)]
+
+    chained = HashTable(16)
+    cuckoo = CuckooHashTable(16)
+    for key in keys:
+        chained.put(key, key)
+        cuckoo.put(key, key)
+
+    print(f"{KEYS} ключей; chained: load factor {chained.load_factor():.2f}, "
+          f"cuckoo: load factor {cuckoo.load_factor():.2f}, рехеширований {cuckoo.rehashes}")
+    print(f"{'задержка поиска, нс':<28}" + "".join(f"{'p' + str(p):>8}" for p in PERCENTILES) + f"{'max':>10}")
+
+    for title, lookups in (("попадания", hits), ("промахи", misses)):
+        report(f"chained, {title}", latencies(chained, lookups))
+        report(f"cuckoo, {title}", latencies(cuckoo, lookups))
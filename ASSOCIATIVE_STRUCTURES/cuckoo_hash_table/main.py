@@ -0,0 +1,249 @@
+from math import ceil
+from random import Random, getrandbits
+from typing import Any, Callable, Iterator
+
+from ASSOCIATIVE_STRUCTURES.hash_table.main import mix_hash
+
+_MISSING = object()
+_EMPTY = object()
+_MAX_LOAD_FACTOR = 0.9
+# столько раз подряд рехеширование пробует новые seed'ы; ключи с равным hash() попадают в одну корзину
+# при любых seed'ах, и если их больше, чем помещается в корзины и тайник, повторы бесполезны
+_MAX_REHASH_ATTEMPTS = 4
+
+
+class CuckooHashTable:
+    # Каждый ключ может лежать только в одной корзине каждой из таблиц или в маленьком тайнике,
+    # поэтому поиск проверяет не больше tables * bucket_size + stash_size ячеек
+    def __init__(self, size: int = 16, tables: int = 2, bucket_size: int = 4, max_displacements: int = 500,
+                 stash_size: int = 4, hash_function: Callable[[Any], int] = hash) -> None:
+        if tables < 2:
+            raise ValueError('Cuckoo hashing needs at least two tables')
+        if bucket_size < 1 or stash_size < 0 or max_displacements < 1:
+            raise ValueError('Bucket size and displacement limit must be positive, stash size non-negative')
+
+        self.tables = tables
+        self.bucket_size = bucket_size
+        self.max_displacements = max_displacements
+        self.stash_size = stash_size
+        self.count = 0
+        self.rehashes = 0
+        self.__hash_function = hash_function
+        self.__random = Random()
+        self.__allocate(max(ceil(size / (tables * bucket_size)), 1))
+
+    @property
+    def size(self) -> int:
+        return self.tables * self.__buckets * self.bucket_size
+
+    def put(self, key: Any, value: Any) -> None:
+        base_hash = self.__hash_function(key)
+        location = self.__locate(base_hash, key)
+
+        if location is not None:
+            table, index = location
+            if table < 0:
+                self.__stash[index] = (base_hash, key, value)
+            else:
+                self.__values[table][index] = value
+            return
+
+        if self.count + 1 > self.size * _MAX_LOAD_FACTOR:
+            self.__rehash(self.__buckets * 2)
+
+        self.count += 1
+        self.__place(base_hash, key, value)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        base_hash = self.__hash_function(key)
+        bucket_size, buckets = self.bucket_size, self.__buckets
+
+        for seed, hashes, keys, values in self.__layout:
+            start = mix_hash(base_hash, seed) % buckets * bucket_size
+            # сначала дешёвая проверка хешей корзины на уровне C, ключи сравниваем только при совпадении
+            if base_hash in hashes[start:start + bucket_size]:
+                for index in range(start, start + bucket_size):
+                    cur_key = keys[index]
+                    if hashes[index] == base_hash and (cur_key is key or cur_key == key):
+                        return values[index]
+
+        for cur_hash, cur_key, cur_value in self.__stash:
+            if cur_hash == base_hash and (cur_key is key or cur_key == key):
+                return cur_value
+
+        return default
+
+    def delete(self, key: Any) -> bool:
+        location = self.__locate(self.__hash_function(key), key)
+        if location is None:
+            return False
+
+        table, index = location
+        if table < 0:
+            del self.__stash[index]
+        else:
+            self.__store(table, index, None, _EMPTY, None)
+            self.__drain_stash()
+
+        self.count -= 1
+        return True
+
+    def load_factor(self) -> float:
+        return self.count / self.size
+
+    def keys(self) -> Iterator[Any]:
+        for key, value in self.items():
+            yield key
+
+    def values(self) -> Iterator[Any]:
+        for key, value in self.items():
+            yield value
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        for base_hash, key, value in self.__entries():
+            yield key, value
+
+    def __allocate(self, buckets: int) -> None:
+        slots = buckets * self.bucket_size
+        self.__buckets = buckets
+        self.__seeds = [getrandbits(64) for _ in range(self.tables)]
+        self.__hashes = [[None] * slots for _ in range(self.tables)]
+        self.__keys = [[_EMPTY] * slots for _ in range(self.tables)]
+        self.__values = [[None] * slots for _ in range(self.tables)]
+        self.__stash = []
+        self.__layout = list(zip(self.__seeds, self.__hashes, self.__keys, self.__values))
+
+    def __entries(self) -> Iterator[tuple[int, Any, Any]]:
+        for hashes, keys, values in zip(self.__hashes, self.__keys, self.__values):
+            for entry in zip(hashes, keys, values):
+                if entry[1] is not _EMPTY:
+                    yield entry
+        yield from self.__stash
+
+    def __bucket_start(self, table: int, base_hash: int) -> int:
+        return mix_hash(base_hash, self.__seeds[table]) % self.__buckets * self.bucket_size
+
+    def __locate(self, base_hash: int, key: Any) -> tuple[int, int] | None:
+        # (таблица, ячейка) или (-1, позиция в тайнике)
+        for table in range(self.tables):
+            start = self.__bucket_start(table, base_hash)
+            hashes, keys = self.__hashes[table], self.__keys[table]
+            for index in range(start, start + self.bucket_size):
+                cur_key = keys[index]
+                if hashes[index] == base_hash and (cur_key is key or cur_key == key):
+                    return table, index
+
+        for index, (cur_hash, cur_key, cur_value) in enumerate(self.__stash):
+            if cur_hash == base_hash and (cur_key is key or cur_key == key):
+                return -1, index
+
+        return None
+
+    def __store(self, table: int, index: int, base_hash: int | None, key: Any, value: Any) -> None:
+        self.__hashes[table][index] = base_hash
+        self.__keys[table][index] = key
+        self.__values[table][index] = value
+
+    def __try_free_slot(self, base_hash: int, key: Any, value: Any) -> bool:
+        for table in range(self.tables):
+            start = self.__bucket_start(table, base_hash)
+            keys = self.__keys[table]
+            for index in range(start, start + self.bucket_size):
+                if keys[index] is _EMPTY:
+                    self.__store(table, index, base_hash, key, value)
+                    return True
+        return False
+
+    def __displace(self, base_hash: int, key: Any, value: Any) -> tuple[int, Any, Any] | None:
+        # случайное блуждание: вытесняем случайный элемент из своей корзины и ищем место уже ему;
+        # возвращает элемент, которому места так и не нашлось
+        for _ in range(self.max_displacements):
+            if self.__try_free_slot(base_hash, key, value):
+                return None
+
+            table = self.__random.randrange(self.tables)
+            index = self.__bucket_start(table, base_hash) + self.__random.randrange(self.bucket_size)
+            evicted = (self.__hashes[table][index], self.__keys[table][index], self.__values[table][index])
+            self.__store(table, index, base_hash, key, value)
+            base_hash, key, value = evicted
+
+        return base_hash, key, value
+
+    def __place(self, base_hash: int, key: Any, value: Any) -> None:
+        homeless = self.__displace(base_hash, key, value)
+        if homeless is None:
+            return
+
+        # в тайнике есть место, или он уже переполнен после неудачного рехеширования -
+        # тогда новые попытки его не разгрузят
+        if len(self.__stash) != self.stash_size:
+            self.__stash.append(homeless)
+            return
+
+        # блуждание зациклилось, а тайник полон: новые хеш-функции, а при высокой загрузке и больший размер
+        self.__rehash(self.__buckets * 2 if self.load_factor() > 0.5 else self.__buckets, homeless)
+
+    def __rehash(self, buckets: int, extra: tuple[int, Any, Any] | None = None) -> None:
+        entries = list(self.__entries())
+        if extra is not None:
+            entries.append(extra)
+
+        for attempt in range(_MAX_REHASH_ATTEMPTS):
+            # на последней попытке тайник служит списком переполнения: ключи не теряются,
+            # а таблица не растёт без конца
+            last = attempt == _MAX_REHASH_ATTEMPTS - 1
+            self.rehashes += 1
+            self.__allocate(buckets)
+            for entry in entries:
+                homeless = self.__displace(*entry)
+                if homeless is not None:
+                    if len(self.__stash) >= self.stash_size and not last:
+                        break
+                    self.__stash.append(homeless)
+            else:
+                return
+            # больший размер помогает только при высокой загрузке, иначе хватает новых seed'ов
+            if len(entries) > self.tables * buckets * self.bucket_size // 2:
+                buckets *= 2
+
+    def __drain_stash(self) -> None:
+        stash, self.__stash = self.__stash, []
+        for entry in stash:
+            if not self.__try_free_slot(*entry):
+                self.__stash.append(entry)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.put(key, value)
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(f"Key '{key}' not found")
+        return value
+
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.keys()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __str__(self) -> str:
+        items = (f"{key}: {value}" for key, value in self.items())
+        return "cuckoo_hash_table(" + ", ".join(items) + ")"
+
+
+if __name__ == "__main__":
+    cuckoo = CuckooHashTable(8)
+
+    for i in range(20):
+        cuckoo.put(f"key{i}", i)
+    cuckoo["key3"] = 33
+    cuckoo.delete("key4")
+
+    print(f"Таблица: {cuckoo}")
+    print(f"Размер: {cuckoo.size}, элементов: {len(cuckoo)}, коэффициент заполнения: {cuckoo.load_factor():.2f}")
+    print(f"key3 -> {cuckoo['key3']}, key4 -> {cuckoo.get('key4', 'Не найдено')}")
+    print(f"Рехеширований: {cuckoo.rehashes}")
@@ -0,0 +1,219 @@
+from array import array
+from itertools import chain
+from math import ceil
+from random import getrandbits
+from time import perf_counter
+from typing import Any, Callable, Iterable, Iterator
+
+from ASSOCIATIVE_STRUCTURES.hash_table.main import _MASK, mix_hash
+
+# CHD (compress, hash, displace): ключи раскладываются по r ~ n / λ корзинам по старшим битам хеша
+# (h * r >> 64, иначе при r = 2 ** k ключи корзины совпадали бы в младших битах f1), и для каждой корзины
+# подбирается пара (d0, d1), при которой (f1 + d0 * f2 + d1) % n отправляет все её ключи в свободные ячейки
+# (f1 - младшие 32 бита хеша, f2 - старшие). Пара хранится одним числом d1 * _FACTORS + d0.
+# Корзины из одного ключа ставятся прямо в оставшиеся ячейки и хранят номер ячейки как -(ячейка + 1).
+# Если раскладка не удалась, пробуем новую соль, а каждые четыре попытки уменьшаем λ: одиночек больше,
+# а многоключевые корзины размещаются в менее заполненную таблицу (ценой лишних бит на ключ).
+# Ключи с одинаковым hash() не разделит никакая соль, поэтому в таблицу идёт первый из них,
+# а остальные - в словарь переполнения по хешу, который проверяется только при промахе.
+_BUCKET_LOAD = 4
+_MIN_BUCKET_LOAD = 0.5
+_MAX_ATTEMPTS = 32
+_FACTORS = 64
+_LOW = (1 << 32) - 1
+
+
+class FrozenHashTable:
+    # Неизменяемая таблица с минимальной совершенной хеш-функцией: n ключей занимают ровно n ячеек,
+    # поиск - одно чтение смещения и одна ячейка, без цепочек и пробирования
+    def __init__(self, items: Iterable[tuple[Any, Any]], hash_function: Callable[[Any], int] = hash) -> None:
+        start = perf_counter()
+        items = list(items.items() if hasattr(items, 'items') else items)
+
+        self.__hash_function = hash_function
+        items, self.__overflow = self.__split_equal_hashes(items)
+        self.__slot_count = len(items)
+        self.count = len(items) + sum(len(group) for group in self.__overflow.values())
+
+        for attempt in range(_MAX_ATTEMPTS):
+            self.__seed = getrandbits(64)
+            if self.__build(items, max(_BUCKET_LOAD / 2 ** (attempt // 4), _MIN_BUCKET_LOAD)):
+                break
+        else:
+            raise ValueError(f'Could not place {len(items)} keys with distinct hashes '
+                             f'into a perfect hash in {_MAX_ATTEMPTS} attempts')
+
+        self.build_time = perf_counter() - start
+        # только сама функция: массив смещений, ключи и значения хранятся отдельно
+        self.bits_per_key = self.__displacements.itemsize * 8 * len(self.__displacements) / max(self.count, 1)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        count = self.__slot_count
+        if not count:
+            return default
+
+        base_hash = self.__hash_function(key)
+        full_hash = mix_hash(base_hash, self.__seed)
+        displacement = self.__displacements[full_hash * self.__bucket_count >> 64]
+        if displacement < 0:
+            slot = -displacement - 1
+        else:
+            shift, factor = divmod(displacement, _FACTORS)
+            slot = ((full_hash & _LOW) + factor * (full_hash >> 32) + shift) % count
+
+        cur_key = self.__keys[slot]
+        if self.__hashes[slot] == full_hash and (cur_key is key or cur_key == key):
+            return self.__values[slot]
+
+        if self.__overflow:
+            for cur_key, cur_value in self.__overflow.get(base_hash & _MASK, ()):
+                if cur_key is key or cur_key == key:
+                    return cur_value
+        return default
+
+    def load_factor(self) -> float:
+        return 1.0 if self.count else 0.0
+
+    def keys(self) -> Iterator[Any]:
+        for key, value in self.items():
+            yield key
+
+    def values(self) -> Iterator[Any]:
+        for key, value in self.items():
+            yield value
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        return chain(zip(self.__keys, self.__values), *self.__overflow.values())
+
+    def __split_equal_hashes(self, items: list[tuple[Any, Any]]) -> tuple[list[tuple[Any, Any]], dict[int, list]]:
+        # (по одному ключу на каждый хеш, остальные ключи с тем же хешем); повтор самого ключа
+        # заменяет значение, как в dict
+        first = {}
+        primary = []
+        overflow = {}
+
+        for key, value in items:
+            base_hash = self.__hash_function(key) & _MASK
+            item_id = first.get(base_hash)
+            if item_id is None:
+                first[base_hash] = len(primary)
+                primary.append((key, value))
+                continue
+
+            cur_key = primary[item_id][0]
+            if cur_key is key or cur_key == key:
+                primary[item_id] = (key, value)
+                continue
+
+            group = overflow.setdefault(base_hash, [])
+            for position, (cur_key, cur_value) in enumerate(group):
+                if cur_key is key or cur_key == key:
+                    group[position] = (key, value)
+                    break
+            else:
+                group.append((key, value))
+
+        return primary, overflow
+
+    def __build(self, items: list[tuple[Any, Any]], bucket_load: float) -> bool:
+        count = len(items)
+        hashes = [mix_hash(self.__hash_function(key), self.__seed) for key, value in items]
+        bucket_count = max(ceil(count / bucket_load), 1)
+
+        buckets = [[] for _ in range(bucket_count)]
+        for item_id, full_hash in enumerate(hashes):
+            buckets[full_hash * bucket_count >> 64].append(item_id)
+
+        displacements = array('i' if count * _FACTORS < 1 << 31 else 'q', [0]) * bucket_count
+        slots = [-1] * count
+        taken = bytearray(count)
+
+        # большие корзины размещаем первыми, пока свободных ячеек много
+        order = sorted(range(bucket_count), key=lambda bucket: len(buckets[bucket]), reverse=True)
+        singles = 0
+
+        for position, bucket in enumerate(order):
+            members = buckets[bucket]
+            if len(members) < 2:
+                singles = position
+                break
+
+            placement = self.__place([hashes[item_id] for item_id in members], taken)
+            if placement is None:
+                return False
+            displacement, candidate = placement
+
+            displacements[bucket] = displacement
+            for item_id, slot in zip(members, candidate):
+                taken[slot] = 1
+                slots[item_id] = slot
+        else:
+            singles = bucket_count
+
+        free_slots = (slot for slot in range(count) if not taken[slot])
+        for bucket in order[singles:]:
+            if buckets[bucket]:
+                slot = next(free_slots)
+                displacements[bucket] = -slot - 1
+                slots[buckets[bucket][0]] = slot
+
+        self.__displacements = displacements
+        self.__bucket_count = bucket_count
+        self.__hashes = array('Q', [0]) * count
+        self.__keys = [None] * count
+        self.__values = [None] * count
+
+        for item_id, slot in enumerate(slots):
+            self.__hashes[slot] = hashes[item_id]
+            self.__keys[slot], self.__values[slot] = items[item_id]
+        return True
+
+    @staticmethod
+    def __place(hashes: list[int], taken: bytearray) -> tuple[int, list[int]] | None:
+        # при фиксированном d0 перебор d1 - это сдвиг всей корзины по таблице, поэтому свободную ячейку
+        # для первого ключа ищет bytearray.find, а остальные ключи проверяются только в этих позициях
+        count = len(taken)
+
+        for factor in range(min(_FACTORS, count)):
+            bases = [((full_hash & _LOW) + factor * (full_hash >> 32)) % count for full_hash in hashes]
+            if len(set(bases)) < len(bases):
+                continue
+
+            first, rest = bases[0], bases[1:]
+            shift = 0
+            while True:
+                position = (first + shift) % count
+                free = taken.find(0, position)
+                if free == -1:
+                    free = taken.find(0) + count
+                shift += free - position
+                if shift >= count:
+                    break
+
+                for base in rest:
+                    if taken[(base + shift) % count]:
+                        break
+                else:
+                    return shift * _FACTORS + factor, [(base + shift) % count for base in bases]
+                shift += 1
+
+        return None
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self.get(key, self)
+        if value is self:
+            raise KeyError(f"Key '{key}' not found")
+        return value
+
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key, self) is not self
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.keys()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __str__(self) -> str:
+        items = (f"{key}: {value}" for key, value in self.items())
+        return "frozen_hash_table(" + ", ".join(items) + ")"
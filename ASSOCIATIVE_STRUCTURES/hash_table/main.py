@@ -1,110 +1,1182 @@
-from typing import Any
+from array import array
+from collections.abc import ItemsView, KeysView, ValuesView
+from math import ceil
+from random import getrandbits
+from sys import getsizeof
+from time import perf_counter
+from typing import Any, Callable, Iterable, Iterator, Literal
 
+from ASSOCIATIVE_STRUCTURES.bloom_filter.main import BloomFilter
+from ASSOCIATIVE_STRUCTURES.hash_table.mapped import MappedHashTable, write_table
 
-class HashTable:
+Modes = Literal['chaining', 'linear', 'robin_hood', 'ordered', 'arena']
+
+_MISSING = object()
+_EMPTY = object()
+_DELETED = object()
+_FREE = -1
+_DUMMY = -2
+_SLOT_EMPTY, _SLOT_FULL, _SLOT_DELETED = 0, 1, 2
+
+_MASK = (1 << 64) - 1
+_MAX_LOAD_FACTOR = 0.7
+# после сжатия таблица заполнена наполовину: до следующего роста или сжатия далеко
+_TARGET_LOAD_FACTOR = 0.5
+# таблицы в режиме цепочек не больше этого размера хранят записи одним плоским списком
+_INLINE_SIZE = 16
+# арена уплотняется, когда мёртвых байт больше половины и больше этого порога
+_ARENA_MIN_DEAD_BYTES = 4096
+
+
+def mix_hash(value: int, seed: int) -> int:
+    # Перемешивание Фибоначчи: близкие значения hash() расходятся по всем 64 битам
+    value = ((value ^ seed) * 0x9E3779B97F4A7C15) & _MASK
+    return value ^ (value >> 32)
+
+
+class _InlineStorage:
+    # Маленькая таблица: все тройки (хеш, ключ, значение) в одном списке, поиск - просмотр по хешам.
+    # Заводится вместо цепочек при size <= _INLINE_SIZE, после роста таблица переходит на корзины.
+    tombstones = 0
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.entries_list = []
+
+    def find(self, full_hash: int, key: Any) -> Any:
+        for cur_hash, cur_key, cur_value in self.entries_list:
+            if cur_hash == full_hash and (cur_key is key or cur_key == key):
+                return cur_value
+        return _MISSING
+
+    def insert(self, full_hash: int, key: Any, value: Any) -> bool:
+        if not self.replace(full_hash, key, value):
+            self.entries_list.append((full_hash, key, value))
+            return True
+        return False
+
+    def insert_new(self, full_hash: int, key: Any, value: Any) -> None:
+        self.entries_list.append((full_hash, key, value))
+
+    def replace(self, full_hash: int, key: Any, value: Any) -> bool:
+        entries = self.entries_list
+        for element_id, (cur_hash, cur_key, cur_value) in enumerate(entries):
+            if cur_hash == full_hash and (cur_key is key or cur_key == key):
+                entries[element_id] = (full_hash, key, value)
+                return True
+        return False
+
+    def remove(self, full_hash: int, key: Any) -> bool:
+        entries = self.entries_list
+        for element_id, (cur_hash, cur_key, cur_value) in enumerate(entries):
+            if cur_hash == full_hash and (cur_key is key or cur_key == key):
+                del entries[element_id]
+                return True
+        return False
+
+    def entries(self) -> Iterator[tuple[int, Any, Any]]:
+        return iter(self.entries_list)
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        for cur_hash, key, value in self.entries_list:
+            yield key, value
+
+    def move_buckets(self, start: int, amount: int, target: '_ChainedStorage',
+                     on_move: Callable[[int], None] | None = None) -> int:
+        # записей не больше десятка, поэтому переносим всё за один шаг
+        for full_hash, key, value in self.entries_list:
+            target.insert_new(full_hash, key, value)
+            if on_move is not None:
+                on_move(full_hash)
+        self.entries_list = []
+        return self.size
+
+    def collision_histogram(self) -> dict[int, int]:
+        # один плоский список: длина просмотра равна числу записей
+        return {len(self.entries_list): 1}
+
+    def memory_usage(self) -> int:
+        return getsizeof(self.entries_list) + sum(getsizeof(entry) for entry in self.entries_list)
+
+
+class _ChainedStorage:
+    # Цепочки: каждая корзина - список троек (хеш, ключ, значение).
+    # Корзина заводится при первой вставке, до этого на её месте общий пустой кортеж.
+    tombstones = 0
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.buckets = [()] * size
+
+    def find(self, full_hash: int, key: Any) -> Any:
+        for cur_hash, cur_key, cur_value in self.buckets[full_hash % self.size]:
+            if cur_hash == full_hash and (cur_key is key or cur_key == key):
+                return cur_value
+        return _MISSING
+
+    def insert(self, full_hash: int, key: Any, value: Any) -> bool:
+        index = full_hash % self.size
+        bucket = self.buckets[index]
+
+        for element_id, (cur_hash, cur_key, cur_value) in enumerate(bucket):
+            if cur_hash == full_hash and (cur_key is key or cur_key == key):
+                bucket[element_id] = (full_hash, key, value)
+                return False
+
+        if bucket:
+            bucket.append((full_hash, key, value))
+        else:
+            self.buckets[index] = [(full_hash, key, value)]
+        return True
+
+    def insert_new(self, full_hash: int, key: Any, value: Any) -> None:
+        index = full_hash % self.size
+        bucket = self.buckets[index]
+        if bucket:
+            bucket.append((full_hash, key, value))
+        else:
+            self.buckets[index] = [(full_hash, key, value)]
+
+    def replace(self, full_hash: int, key: Any, value: Any) -> bool:
+        # обновляет значение только у существующего ключа
+        bucket = self.buckets[full_hash % self.size]
+
+        for element_id, (cur_hash, cur_key, cur_value) in enumerate(bucket):
+            if cur_hash == full_hash and (cur_key is key or cur_key == key):
+                bucket[element_id] = (full_hash, key, value)
+                return True
+
+        return False
+
+    def remove(self, full_hash: int, key: Any) -> bool:
+        index = full_hash % self.size
+        bucket = self.buckets[index]
+
+        for element_id, (cur_hash, cur_key, cur_value) in enumerate(bucket):
+            if cur_hash == full_hash and (cur_key is key or cur_key == key):
+                if len(bucket) == 1:
+                    self.buckets[index] = ()
+                else:
+                    del bucket[element_id]
+                return True
+
+        return False
+
+    def entries(self) -> Iterator[tuple[int, Any, Any]]:
+        for bucket in self.buckets:
+            yield from bucket
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        for bucket in self.buckets:
+            for cur_hash, key, value in bucket:
+                yield key, value
+
+    def move_buckets(self, start: int, amount: int, target: '_ChainedStorage',
+                     on_move: Callable[[int], None] | None = None) -> int:
+        # переносит корзины [start, start + amount) в target и возвращает следующую позицию
+        buckets = self.buckets
+        insert_new = target.insert_new
+        end = min(start + amount, self.size)
+
+        for index in range(start, end):
+            for full_hash, key, value in buckets[index]:
+                insert_new(full_hash, key, value)
+                if on_move is not None:
+                    on_move(full_hash)
+            buckets[index] = ()
+
+        return end
+
+    def collision_histogram(self) -> dict[int, int]:
+        # длина цепочки -> количество корзин с такой длиной
+        histogram = {}
+        for bucket in self.buckets:
+            histogram[len(bucket)] = histogram.get(len(bucket), 0) + 1
+        return histogram
+
+    def memory_usage(self) -> int:
+        # список корзин, заведённые корзины и тройки в них, без ключей и значений
+        return getsizeof(self.buckets) + sum(
+            getsizeof(bucket) + sum(getsizeof(entry) for entry in bucket) for bucket in self.buckets if bucket)
+
+
+class _OpenAddressingStorage:
+    # Открытая адресация: ключи, значения и хеши лежат в параллельных массивах
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.hashes = [None] * size
+        self.keys = [_EMPTY] * size
+        self.values = [None] * size
+        self.tombstones = 0
+
+    def entries(self) -> Iterator[tuple[int, Any, Any]]:
+        for full_hash, key, value in zip(self.hashes, self.keys, self.values):
+            if key is not _EMPTY and key is not _DELETED:
+                yield full_hash, key, value
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        for key, value in zip(self.keys, self.values):
+            if key is not _EMPTY and key is not _DELETED:
+                yield key, value
+
+    def collision_histogram(self) -> dict[int, int]:
+        # длина пробирования (1 - элемент в своей ячейке) -> количество элементов
+        histogram = {}
+        size = self.size
+        for index, (full_hash, key) in enumerate(zip(self.hashes, self.keys)):
+            if key is not _EMPTY and key is not _DELETED:
+                length = (index - full_hash) % size + 1
+                histogram[length] = histogram.get(length, 0) + 1
+        return histogram
+
+    def memory_usage(self) -> int:
+        return getsizeof(self.hashes) + getsizeof(self.keys) + getsizeof(self.values)
+
+    def _store(self, index: int, full_hash: int, key: Any, value: Any) -> None:
+        self.hashes[index] = full_hash
+        self.keys[index] = key
+        self.values[index] = value
+
+
+class _LinearProbingStorage(_OpenAddressingStorage):
+    # Линейное пробирование, удалённые ячейки помечаются надгробиями
+    def find(self, full_hash: int, key: Any) -> Any:
+        index = self.__find_index(full_hash, key)
+        return _MISSING if index is None else self.values[index]
+
+    def insert(self, full_hash: int, key: Any, value: Any) -> bool:
+        hashes, keys, size = self.hashes, self.keys, self.size
+        index = full_hash % size
+        free_index = None
+
+        while True:
+            cur_key = keys[index]
+            if cur_key is _EMPTY:
+                break
+            if cur_key is _DELETED:
+                if free_index is None:
+                    free_index = index
+            elif hashes[index] == full_hash and (cur_key is key or cur_key == key):
+                self.values[index] = value
+                return False
+
+            index += 1
+            if index == size:
+                index = 0
+
+        if free_index is not None:
+            index = free_index
+            self.tombstones -= 1
+
+        self._store(index, full_hash, key, value)
+        return True
+
+    def insert_new(self, full_hash: int, key: Any, value: Any) -> None:
+        keys, size = self.keys, self.size
+        index = full_hash % size
+
+        while keys[index] is not _EMPTY:
+            index += 1
+            if index == size:
+                index = 0
+
+        self._store(index, full_hash, key, value)
+
+    def remove(self, full_hash: int, key: Any) -> bool:
+        index = self.__find_index(full_hash, key)
+        if index is None:
+            return False
+
+        self._store(index, None, _DELETED, None)
+        self.tombstones += 1
+        return True
+
+    def __find_index(self, full_hash: int, key: Any) -> int | None:
+        hashes, keys, size = self.hashes, self.keys, self.size
+        index = full_hash % size
+
+        while True:
+            cur_key = keys[index]
+            if cur_key is _EMPTY:
+                return None
+            if hashes[index] == full_hash and (cur_key is key or cur_key == key):
+                return index
+
+            index += 1
+            if index == size:
+                index = 0
+
+
+class _RobinHoodStorage(_OpenAddressingStorage):
+    # Robin Hood: "бедные" элементы (далеко от своей ячейки) вытесняют "богатых".
+    # Удаление сдвигает хвост серии назад, поэтому надгробия не нужны.
+    def find(self, full_hash: int, key: Any) -> Any:
+        index = self.__find_index(full_hash, key)
+        return _MISSING if index is None else self.values[index]
+
+    def insert(self, full_hash: int, key: Any, value: Any, displaced: bool = False) -> bool:
+        hashes, keys, values, size = self.hashes, self.keys, self.values, self.size
+        index = full_hash % size
+        distance = 0
+
+        while True:
+            cur_key = keys[index]
+            if cur_key is _EMPTY:
+                self._store(index, full_hash, key, value)
+                return True
+
+            cur_hash = hashes[index]
+            if not displaced and cur_hash == full_hash and (cur_key is key or cur_key == key):
+                values[index] = value
+                return False
+
+            cur_distance = (index - cur_hash) % size
+            if cur_distance < distance:
+                # ключа дальше быть не может: занимаем ячейку и несём вытесненный элемент дальше
+                hashes[index], full_hash = full_hash, cur_hash
+                keys[index], key = key, cur_key
+                values[index], value = value, values[index]
+                distance = cur_distance
+                displaced = True
+
+            index += 1
+            if index == size:
+                index = 0
+            distance += 1
+
+    def insert_new(self, full_hash: int, key: Any, value: Any) -> None:
+        self.insert(full_hash, key, value, displaced=True)
+
+    def remove(self, full_hash: int, key: Any) -> bool:
+        index = self.__find_index(full_hash, key)
+        if index is None:
+            return False
+
+        hashes, keys, size = self.hashes, self.keys, self.size
+        next_index = (index + 1) % size
+
+        while keys[next_index] is not _EMPTY and (next_index - hashes[next_index]) % size != 0:
+            self._store(index, hashes[next_index], keys[next_index], self.values[next_index])
+            index = next_index
+            next_index = (next_index + 1) % size
+
+        self._store(index, None, _EMPTY, None)
+        return True
+
+    def __find_index(self, full_hash: int, key: Any) -> int | None:
+        hashes, keys, size = self.hashes, self.keys, self.size
+        index = full_hash % size
+        distance = 0
+
+        while True:
+            cur_key = keys[index]
+            if cur_key is _EMPTY:
+                return None
+
+            cur_hash = hashes[index]
+            if cur_hash == full_hash and (cur_key is key or cur_key == key):
+                return index
+            if (index - cur_hash) % size < distance:
+                return None
+
+            index += 1
+            if index == size:
+                index = 0
+            distance += 1
+
+
+class _OrderedStorage:
+    # Как dict в CPython: записи лежат плотным массивом в порядке вставки, а разреженный индекс
+    # с линейным пробированием хранит их позиции. Удалённые записи оставляют дыры, которые
+    # убираются уплотнением, когда их становится больше, чем живых записей.
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.indices = [_FREE] * size
+        self.hashes = []
+        self.keys = []
+        self.values = []
+        self.tombstones = 0
+        # перед first только дыры, оставленные под вставку в начало; holes считает дыры после first
+        self.first = 0
+        self.holes = 0
+
+    def find(self, full_hash: int, key: Any) -> Any:
+        slot, position = self.__lookup(full_hash, key)
+        return _MISSING if position == -1 else self.values[position]
+
+    def insert(self, full_hash: int, key: Any, value: Any) -> bool:
+        slot, position = self.__lookup(full_hash, key)
+        if position != -1:
+            self.values[position] = value
+            return False
+
+        if self.indices[slot] == _DUMMY:
+            self.tombstones -= 1
+        self.__append(slot, full_hash, key, value)
+        return True
+
+    def insert_new(self, full_hash: int, key: Any, value: Any) -> None:
+        self.__append(self.__free_slot(full_hash), full_hash, key, value)
+
+    def remove(self, full_hash: int, key: Any) -> bool:
+        slot, position = self.__lookup(full_hash, key)
+        if position == -1:
+            return False
+
+        self.indices[slot] = _DUMMY
+        self.tombstones += 1
+        self.__clear(position)
+        return True
+
+    def move_to_end(self, full_hash: int, key: Any, last: bool = True) -> bool:
+        slot, position = self.__lookup(full_hash, key)
+        if position == -1:
+            return False
+
+        if last:
+            if position == len(self.keys) - 1:
+                return True
+            new_position = len(self.keys)
+            self.hashes.append(None)
+            self.keys.append(None)
+            self.values.append(None)
+        else:
+            if position == self.first:
+                return True
+            if self.first == 0:
+                position += self.__reserve_front()
+            self.first -= 1
+            new_position = self.first
+
+        # сначала запись на новом месте, потом дыра на старом: уплотнение в __clear видит актуальный индекс
+        self.hashes[new_position] = self.hashes[position]
+        self.keys[new_position] = self.keys[position]
+        self.values[new_position] = self.values[position]
+        self.indices[slot] = new_position
+        self.__clear(position)
+        return True
+
+    def popitem(self, last: bool = True) -> tuple[int, Any, Any]:
+        # после __clear крайние записи всегда живые
+        position = len(self.keys) - 1 if last else self.first
+        entry = (self.hashes[position], self.keys[position], self.values[position])
+
+        self.indices[self.__slot_of(entry[0], position)] = _DUMMY
+        self.tombstones += 1
+        self.__clear(position)
+        return entry
+
+    def entries(self) -> Iterator[tuple[int, Any, Any]]:
+        hashes, keys, values = self.hashes, self.keys, self.values
+        for position in range(self.first, len(keys)):
+            if keys[position] is not _DELETED:
+                yield hashes[position], keys[position], values[position]
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        keys, values = self.keys, self.values
+        for position in range(self.first, len(keys)):
+            if keys[position] is not _DELETED:
+                yield keys[position], values[position]
+
+    def collision_histogram(self) -> dict[int, int]:
+        # длина пробирования в индексе -> количество элементов
+        histogram = {}
+        size = self.size
+        for slot, position in enumerate(self.indices):
+            if position >= 0:
+                length = (slot - self.hashes[position]) % size + 1
+                histogram[length] = histogram.get(length, 0) + 1
+        return histogram
+
+    def memory_usage(self) -> int:
+        return getsizeof(self.indices) + getsizeof(self.hashes) + getsizeof(self.keys) + getsizeof(self.values)
+
+    def __lookup(self, full_hash: int, key: Any) -> tuple[int, int]:
+        # (ячейка индекса, позиция записи) или (ячейка для вставки, -1)
+        indices, hashes, keys, size = self.indices, self.hashes, self.keys, self.size
+        slot = full_hash % size
+        free_slot = -1
+
+        while True:
+            position = indices[slot]
+            if position == _FREE:
+                return (slot if free_slot == -1 else free_slot), -1
+            if position == _DUMMY:
+                if free_slot == -1:
+                    free_slot = slot
+            elif hashes[position] == full_hash and (keys[position] is key or keys[position] == key):
+                return slot, position
+
+            slot += 1
+            if slot == size:
+                slot = 0
+
+    def __free_slot(self, full_hash: int) -> int:
+        indices, size = self.indices, self.size
+        slot = full_hash % size
+        while indices[slot] != _FREE:
+            slot += 1
+            if slot == size:
+                slot = 0
+        return slot
+
+    def __slot_of(self, full_hash: int, position: int) -> int:
+        # ищем ячейку по позиции, а не по ключу: не нужно вызывать __eq__
+        indices, size = self.indices, self.size
+        slot = full_hash % size
+        while indices[slot] != position:
+            slot += 1
+            if slot == size:
+                slot = 0
+        return slot
+
+    def __append(self, slot: int, full_hash: int, key: Any, value: Any) -> None:
+        self.indices[slot] = len(self.keys)
+        self.hashes.append(full_hash)
+        self.keys.append(key)
+        self.values.append(value)
+
+    def __clear(self, position: int) -> None:
+        hashes, keys, values = self.hashes, self.keys, self.values
+        hashes[position] = values[position] = None
+        keys[position] = _DELETED
+        self.holes += 1
+
+        while len(keys) > self.first and keys[-1] is _DELETED:
+            hashes.pop()
+            keys.pop()
+            values.pop()
+            self.holes -= 1
+        while self.first < len(keys) and keys[self.first] is _DELETED:
+            self.first += 1
+            self.holes -= 1
+
+        if self.first == len(keys):
+            self.hashes, self.keys, self.values = [], [], []
+            self.first = 0
+        elif self.holes > 8 and self.holes > len(keys) - self.first - self.holes:
+            self.__compact()
+
+    def __reserve_front(self) -> int:
+        # сдвигаем записи вправо, освобождая место под вставки в начало; удвоение даёт амортизированное O(1)
+        padding = max(len(self.keys) - self.first, 8)
+        self.hashes[:0] = [None] * padding
+        self.keys[:0] = [_DELETED] * padding
+        self.values[:0] = [None] * padding
+        self.indices = [position + padding if position >= 0 else position for position in self.indices]
+        self.first += padding
+        return padding
+
+    def __compact(self) -> None:
+        entries = list(self.entries())
+        self.indices = [_FREE] * self.size
+        self.hashes, self.keys, self.values = [], [], []
+        self.tombstones = self.first = self.holes = 0
+
+        for full_hash, key, value in entries:
+            self.insert_new(full_hash, key, value)
+
+
+class _ArenaStorage:
+    # Только строковые ключи: их UTF-8 байты лежат подряд в одном bytearray, а в ячейке - смещение,
+    # длина и хеш в массивах array. На ключ не остаётся ни объекта str, ни кортежа, и сборщику мусора
+    # нечего обходить. Линейное пробирование с надгробиями, как в _LinearProbingStorage.
     def __init__(self, size: int) -> None:
         self.size = size
-        self.table = [[] for _ in range(size)]
+        self.states = bytearray(size)
+        self.hashes = array('Q', [0]) * size
+        self.offsets = array('Q', [0]) * size
+        self.lengths = array('I', [0]) * size
+        self.values = [None] * size
+        self.arena = bytearray()
+        self.tombstones = 0
+        self.dead_bytes = 0
+
+    def find(self, full_hash: int, key: Any) -> Any:
+        index = self.__find_index(full_hash, key)
+        return _MISSING if index == -1 else self.values[index]
+
+    def insert(self, full_hash: int, key: Any, value: Any) -> bool:
+        encoded = self.__encode(key)
+        states, size = self.states, self.size
+        index = full_hash % size
+        free_index = -1
+
+        while True:
+            state = states[index]
+            if state == _SLOT_EMPTY:
+                break
+            if state == _SLOT_DELETED:
+                if free_index == -1:
+                    free_index = index
+            elif self.__matches(index, full_hash, encoded):
+                self.values[index] = value
+                return False
+
+            index += 1
+            if index == size:
+                index = 0
+
+        if free_index != -1:
+            index = free_index
+            self.tombstones -= 1
+
+        self.__store(index, full_hash, encoded, value)
+        return True
+
+    def insert_new(self, full_hash: int, key: Any, value: Any) -> None:
+        states, size = self.states, self.size
+        index = full_hash % size
+
+        while states[index] != _SLOT_EMPTY:
+            index += 1
+            if index == size:
+                index = 0
+
+        self.__store(index, full_hash, self.__encode(key), value)
+
+    def remove(self, full_hash: int, key: Any) -> bool:
+        index = self.__find_index(full_hash, key)
+        if index == -1:
+            return False
+
+        self.states[index] = _SLOT_DELETED
+        self.values[index] = None
+        self.tombstones += 1
+        self.dead_bytes += self.lengths[index]
+
+        if self.dead_bytes > _ARENA_MIN_DEAD_BYTES and self.dead_bytes * 2 > len(self.arena):
+            self.compact()
+        return True
+
+    def compact(self) -> None:
+        # переписывает живые ключи в новую арену подряд, порядок ячеек не меняется
+        arena, offsets, lengths = self.arena, self.offsets, self.lengths
+        compacted = bytearray()
+
+        for index, state in enumerate(self.states):
+            if state == _SLOT_FULL:
+                offset = offsets[index]
+                offsets[index] = len(compacted)
+                compacted += arena[offset:offset + lengths[index]]
+
+        self.arena = compacted
+        self.dead_bytes = 0
+
+    def entries(self) -> Iterator[tuple[int, Any, Any]]:
+        for index, state in enumerate(self.states):
+            if state == _SLOT_FULL:
+                yield self.hashes[index], self.__key(index), self.values[index]
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        for index, state in enumerate(self.states):
+            if state == _SLOT_FULL:
+                yield self.__key(index), self.values[index]
+
+    def collision_histogram(self) -> dict[int, int]:
+        # длина пробирования (1 - элемент в своей ячейке) -> количество элементов
+        histogram = {}
+        size = self.size
+        for index, state in enumerate(self.states):
+            if state == _SLOT_FULL:
+                length = (index - self.hashes[index]) % size + 1
+                histogram[length] = histogram.get(length, 0) + 1
+        return histogram
+
+    def memory_usage(self) -> int:
+        return (getsizeof(self.states) + getsizeof(self.hashes) + getsizeof(self.offsets)
+                + getsizeof(self.lengths) + getsizeof(self.values) + getsizeof(self.arena))
+
+    @staticmethod
+    def __encode(key: Any) -> bytes:
+        if not isinstance(key, str):
+            raise ValueError(f"Arena mode supports only string keys, got {type(key).__name__}")
+        # surrogatepass: любая строка Python, даже с одиночными суррогатами, переживает круг кодирования
+        return key.encode('utf-8', 'surrogatepass')
+
+    def __key(self, index: int) -> str:
+        offset = self.offsets[index]
+        return self.arena[offset:offset + self.lengths[index]].decode('utf-8', 'surrogatepass')
+
+    def __matches(self, index: int, full_hash: int, encoded: bytes) -> bool:
+        # сначала хеш и длина, байты сравниваются на месте без копирования среза
+        return (self.hashes[index] == full_hash and self.lengths[index] == len(encoded)
+                and self.arena.startswith(encoded, self.offsets[index]))
+
+    def __store(self, index: int, full_hash: int, encoded: bytes, value: Any) -> None:
+        self.states[index] = _SLOT_FULL
+        self.hashes[index] = full_hash
+        self.offsets[index] = len(self.arena)
+        self.lengths[index] = len(encoded)
+        self.values[index] = value
+        self.arena += encoded
+
+    def __find_index(self, full_hash: int, key: Any) -> int:
+        if not isinstance(key, str):
+            return -1
+
+        encoded = key.encode('utf-8', 'surrogatepass')
+        states, size = self.states, self.size
+        index = full_hash % size
+
+        while True:
+            state = states[index]
+            if state == _SLOT_EMPTY:
+                return -1
+            if state == _SLOT_FULL and self.__matches(index, full_hash, encoded):
+                return index
+
+            index += 1
+            if index == size:
+                index = 0
+
+
+class HashTableKeysView(KeysView):
+    def __repr__(self) -> str:
+        return f'hash_table_keys({list(self)})'
+
+
+class HashTableValuesView(ValuesView):
+    def __iter__(self) -> Iterator[Any]:
+        for key, value in self._mapping._iter_items():
+            yield value
+
+    def __contains__(self, value: Any) -> bool:
+        return any(cur_value is value or cur_value == value for cur_value in self)
+
+    def __repr__(self) -> str:
+        return f'hash_table_values({list(self)})'
+
+
+class HashTableItemsView(ItemsView):
+    def __iter__(self) -> Iterator[tuple[Any, Any]]:
+        return self._mapping._iter_items()
+
+    def __repr__(self) -> str:
+        return f'hash_table_items({list(self)})'
+
+
+class HashTable:
+    __storages = {
+        'chaining': _ChainedStorage,
+        'linear': _LinearProbingStorage,
+        'robin_hood': _RobinHoodStorage,
+        'ordered': _OrderedStorage,
+        'arena': _ArenaStorage,
+    }
+
+    def __init__(self, size: int, mode: Modes = 'chaining', hash_function: Callable[[Any], int] = hash,
+                 seed: int | None = None, incremental: bool = False, rehash_step: int = 4,
+                 shrink_load_factor: float | None = 0.2, bloom_filter: bool = False,
+                 track_stats: bool = False) -> None:
+        if mode not in self.__storages:
+            raise ValueError(f"Unknown hash table mode '{mode}'")
+        if incremental and mode != 'chaining':
+            raise ValueError('Incremental rehashing is supported only in chaining mode')
+        if rehash_step < 1:
+            raise ValueError('Rehash step must be positive')
+        if shrink_load_factor is not None and not 0 < shrink_load_factor < _TARGET_LOAD_FACTOR:
+            raise ValueError(f'Shrink load factor must be between 0 and {_TARGET_LOAD_FACTOR}')
+
+        self.size = size
+        self.mode = mode
         self.count = 0
+        self.__min_size = size
+        self.__shrink_load_factor = shrink_load_factor
+        self.__hash_function = hash_function
+        self.__seed = getrandbits(64) if seed is None else seed
+        self.__storage = self.__create_storage(size)
+
+        # при инкрементальном рехешировании старая таблица живёт, пока из неё не перенесут все корзины
+        self.__incremental = incremental
+        self.__rehash_step = rehash_step
+        self.__old_storage = None
+        self.__migrated = 0
+
+        # фильтр Блума отсекает промахи до обращения к хранилищу; удалённые ключи остаются в нём
+        # до ближайшего рехеширования, что лишь повышает долю ложных срабатываний
+        self.__bloom = self.__create_bloom(size) if bloom_filter else None
+        self.__old_bloom = None
+
+        # версия меняется при любом изменении состава таблицы, итераторы по ней ловят изменения
+        self.__version = 0
+        self.__iterators = 0
+
+        # счётчики ведутся только по запросу: в выключенном состоянии это одна проверка на None
+        self.__stats = self.__empty_stats() if track_stats else None
 
     def put(self, key: Any, value: Any) -> None:
-        index = self.__hash(key)
-        bucket = self.table[index]
+        full_hash = self.__hash(key)
 
-        for element_id, (cur_key, cur_value) in enumerate(bucket):
-            if cur_key == key:
-                bucket[element_id] = (key, value)
+        if self.__old_storage is not None:
+            self.__migrate(self.__rehash_step)
+            if self.__old_storage is not None and self.__old_storage.replace(full_hash, key, value):
                 return
 
-        bucket.append((key, value))
+        if not self.__storage.insert(full_hash, key, value):
+            return
+
         self.count += 1
+        self.__version += 1
+        if self.__bloom is not None:
+            self.__bloom.add_hash(full_hash)
 
-        if self.load_factor() > 0.7:
-            self.__rehash()
+        # надгробия тоже занимают ячейки: если их много, перестраиваем таблицу без роста
+        if self.count + self.__storage.tombstones > self.size * _MAX_LOAD_FACTOR:
+            self.__rehash(self.size * 2 if self.load_factor() > 0.5 else self.size)
 
     def get(self, key: Any, default: Any = None) -> Any:
-        index = self.__hash(key)
-        bucket = self.table[index]
+        full_hash = self.__hash(key)
 
-        for cur_key, cur_value in bucket:
-            if cur_key == key:
-                return cur_value
+        if self.__old_storage is not None:
+            self.__migrate(self.__rehash_step)
+
+        if self.__bloom is not None and not self.__may_contain(full_hash):
+            value = _MISSING
+        else:
+            value = self.__storage.find(full_hash, key)
+            if value is _MISSING and self.__old_storage is not None:
+                value = self.__old_storage.find(full_hash, key)
 
-        return default
+        if self.__stats is not None:
+            self.__stats['misses' if value is _MISSING else 'hits'] += 1
+
+        return default if value is _MISSING else value
 
     def delete(self, key: Any) -> bool:
-        index = self.__hash(key)
-        bucket = self.table[index]
+        full_hash = self.__hash(key)
 
-        for element_id, (cur_key, cur_value) in enumerate(bucket):
-            if cur_key == key:
-                del bucket[element_id]
-                self.count -= 1
-                return True
+        if self.__old_storage is not None:
+            self.__migrate(self.__rehash_step)
+
+        if self.__storage.remove(full_hash, key) or (
+                self.__old_storage is not None and self.__old_storage.remove(full_hash, key)):
+            self.count -= 1
+            self.__version += 1
+            self.__shrink_if_sparse()
+            return True
 
         return False
 
     def load_factor(self):
         return self.count / self.size
 
-    def keys(self) -> list:
-        result = []
-        for bucket in self.table:
-            for key, value in bucket:
-                result.append(key)
-        return result
+    @classmethod
+    def from_items(cls, items: Iterable[tuple[Any, Any]] | Any, **kwargs: Any) -> 'HashTable':
+        items = cls.__pairs(items)
+        table = cls(max(ceil(len(items) / _MAX_LOAD_FACTOR), 1), **kwargs)
+        table.put_many(items)
+        return table
+
+    def reserve(self, count: int) -> None:
+        # готовит место под count элементов, чтобы последующие вставки обошлись без рехеширования
+        if self.__old_storage is not None:
+            self.__finish_migration()
+
+        new_size = max(ceil(count / _MAX_LOAD_FACTOR), self.size)
+        if new_size > self.size or count + self.__storage.tombstones > self.size * _MAX_LOAD_FACTOR:
+            self.__rehash(new_size, gradual=False)
+
+    def update(self, items: Iterable[tuple[Any, Any]] | Any) -> None:
+        self.put_many(items)
 
-    def values(self) -> list:
+    def put_many(self, items: Iterable[tuple[Any, Any]] | Any) -> None:
+        items = self.__pairs(items)
+        self.reserve(self.count + len(items))
+
+        hash_ = self.__hash
+        insert = self.__storage.insert
+        bloom = self.__bloom
+        added = 0
+
+        # счётчик фиксируется и при исключении посреди пакета: уже вставленные пары остаются в таблице
+        try:
+            for key, value in items:
+                full_hash = hash_(key)
+                if insert(full_hash, key, value):
+                    added += 1
+                    if bloom is not None:
+                        bloom.add_hash(full_hash)
+        finally:
+            self.count += added
+            self.__version += added
+
+    def get_many(self, keys: Iterable[Any], default: Any = None) -> list:
+        if self.__old_storage is not None:
+            self.__migrate(self.__rehash_step)
+
+        hash_ = self.__hash
+        find = self.__storage.find
+        old_storage = self.__old_storage
+        may_contain = self.__may_contain if self.__bloom is not None else None
         result = []
-        for bucket in self.table:
-            for key, value in bucket:
+        misses = 0
+
+        for key in keys:
+            full_hash = hash_(key)
+            if may_contain is not None and not may_contain(full_hash):
+                result.append(default)
+                misses += 1
+                continue
+
+            value = find(full_hash, key)
+            if value is _MISSING and old_storage is not None:
+                value = old_storage.find(full_hash, key)
+            if value is _MISSING:
+                result.append(default)
+                misses += 1
+            else:
                 result.append(value)
-        return result
 
-    def items(self) -> list:
-        result = []
-        for bucket in self.table:
-            for item in bucket:
-                result.append(item)
+        if self.__stats is not None:
+            self.__stats['hits'] += len(result) - misses
+            self.__stats['misses'] += misses
+
         return result
 
+    def delete_many(self, keys: Iterable[Any]) -> int:
+        if self.__old_storage is not None:
+            self.__migrate(self.__rehash_step)
+
+        hash_ = self.__hash
+        remove = self.__storage.remove
+        old_storage = self.__old_storage
+        removed = 0
+
+        for key in keys:
+            full_hash = hash_(key)
+            if remove(full_hash, key) or (old_storage is not None and old_storage.remove(full_hash, key)):
+                removed += 1
+
+        self.count -= removed
+        self.__version += removed
+        self.__shrink_if_sparse()
+        return removed
+
+    def move_to_end(self, key: Any, last: bool = True) -> None:
+        self.__check_ordered('move_to_end')
+        if not self.__storage.move_to_end(self.__hash(key), key, last):
+            raise KeyError(f"Key '{key}' not found")
+        self.__version += 1
+
+    def popitem(self, last: bool = True) -> tuple[Any, Any]:
+        self.__check_ordered('popitem')
+        if not self.count:
+            raise KeyError('popitem(): hash table is empty')
+
+        full_hash, key, value = self.__storage.popitem(last)
+        self.count -= 1
+        self.__version += 1
+        self.__shrink_if_sparse()
+        return key, value
+
+    def compact(self) -> None:
+        # перестраивает таблицу под минимальный размер, при котором не нужен рост
+        if self.__old_storage is not None:
+            self.__finish_migration()
+
+        self.__rehash(max(ceil(self.count / _MAX_LOAD_FACTOR), 1), gradual=False)
+
+    def save(self, path: str) -> None:
+        write_table(path, self._iter_items(), self.count)
+
+    @staticmethod
+    def open(path: str) -> MappedHashTable:
+        return MappedHashTable(path)
+
+    def freeze(self) -> 'FrozenHashTable':
+        # frozen импортирует mix_hash отсюда, поэтому импорт внутри метода
+        from ASSOCIATIVE_STRUCTURES.hash_table.frozen import FrozenHashTable
+
+        return FrozenHashTable(self._iter_items(), self.__hash_function)
+
+    def is_rehashing(self) -> bool:
+        return self.__old_storage is not None
+
+    def keys(self) -> HashTableKeysView:
+        return HashTableKeysView(self)
+
+    def values(self) -> HashTableValuesView:
+        return HashTableValuesView(self)
+
+    def items(self) -> HashTableItemsView:
+        return HashTableItemsView(self)
+
+    def collision_report(self) -> dict[str, Any]:
+        histogram = dict(sorted(self.__storage.collision_histogram().items()))
+        lengths = {length: amount for length, amount in histogram.items() if length}
+        entries = sum(length * amount for length, amount in lengths.items())
+
+        return {
+            'mode': self.mode,
+            'rehashing': self.is_rehashing(),
+            'size': self.size,
+            'count': self.count,
+            'load_factor': self.load_factor(),
+            'histogram': histogram,
+            'longest': max(lengths, default=0),
+            'average': entries / sum(lengths.values()) if lengths else 0.0,
+        }
+
+    def stats(self) -> dict[str, Any]:
+        # отчёт о коллизиях плюс счётчики; только встроенные типы, чтобы отдавать как есть в метрики
+        if self.__stats is None:
+            raise RuntimeError('Statistics are disabled, create the table with track_stats=True')
+
+        report = self.collision_report()
+        report.update(self.__stats)
+        lookups = self.__stats['hits'] + self.__stats['misses']
+        report['hit_rate'] = self.__stats['hits'] / lookups if lookups else 0.0
+        report['memory_bytes'] = self.__memory_usage()
+        return report
+
+    def reset_stats(self) -> None:
+        if self.__stats is None:
+            raise RuntimeError('Statistics are disabled, create the table with track_stats=True')
+        self.__stats = self.__empty_stats()
+
+    @staticmethod
+    def __pairs(items: Iterable[tuple[Any, Any]] | Any) -> Any:
+        if hasattr(items, 'items'):
+            items = items.items()
+        return items if hasattr(items, '__len__') else list(items)
+
+    def __check_ordered(self, method: str) -> None:
+        if self.mode != 'ordered':
+            raise ValueError(f"{method}() is supported only in ordered mode")
+
+    def __create_storage(self, size: int) -> (_InlineStorage | _ChainedStorage | _OpenAddressingStorage
+                                               | _OrderedStorage | _ArenaStorage):
+        if self.mode == 'chaining' and size <= _INLINE_SIZE:
+            return _InlineStorage(size)
+        return self.__storages[self.mode](size)
+
+    @staticmethod
+    def __create_bloom(size: int) -> BloomFilter:
+        return BloomFilter(max(ceil(size * _MAX_LOAD_FACTOR), 1))
+
+    def __may_contain(self, full_hash: int) -> bool:
+        return self.__bloom.contains_hash(full_hash) or (
+                self.__old_bloom is not None and self.__old_bloom.contains_hash(full_hash))
+
     def __hash(self, key: Any) -> int:
-        if isinstance(key, str):
-            return sum(ord(char) for char in key) % self.size
-        elif isinstance(key, (int, float)):
-            return (key * 31) % self.size
-        else:
-            return hash(key) % self.size
+        return mix_hash(self.__hash_function(key), self.__seed)
 
-    def __rehash(self) -> None:
-        old_table = self.table
-        self.size *= 2
-        self.table = [[] for _ in range(self.size)]
-        self.count = 0
+    @staticmethod
+    def __empty_stats() -> dict[str, int | float]:
+        return {'hits': 0, 'misses': 0, 'rehashes': 0, 'rehash_time': 0.0}
+
+    def __memory_usage(self) -> int:
+        # оценка накладных расходов таблицы: сами ключи и значения не учитываются
+        memory = getsizeof(self) + self.__storage.memory_usage()
+        if self.__old_storage is not None:
+            memory += self.__old_storage.memory_usage()
+        for bloom in (self.__bloom, self.__old_bloom):
+            if bloom is not None:
+                memory += (bloom.bits + 7) // 8
+        return memory
+
+    def _iter_items(self) -> Iterator[tuple[Any, Any]]:
+        # пока жив итератор, перенос корзин приостановлен, иначе элементы могли бы пропасть или повториться
+        version = self.__version
+        self.__iterators += 1
 
-        for bucket in old_table:
-            for key, value in bucket:
-                self.put(key, value)
+        try:
+            for item in self.__items():
+                if self.__version != version:
+                    raise RuntimeError('Hash table changed size during iteration')
+                yield item
+        finally:
+            self.__iterators -= 1
+
+    def __items(self) -> Iterator[tuple[Any, Any]]:
+        yield from self.__storage.items()
+        if self.__old_storage is not None:
+            yield from self.__old_storage.items()
+
+    def __rehash(self, new_size: int, gradual: bool = True) -> None:
+        if self.__old_storage is not None:
+            self.__finish_migration()
+
+        start = perf_counter() if self.__stats is not None else None
+        old_storage = self.__storage
+        self.size = new_size
+        self.__storage = self.__create_storage(new_size)
+        self.__version += 1
+
+        if self.__incremental and gradual:
+            # новый фильтр пополняется по мере переноса, старый нужен ключам, которые ещё не перенесены
+            self.__old_storage = old_storage
+            self.__migrated = 0
+            if self.__bloom is not None:
+                self.__old_bloom, self.__bloom = self.__bloom, self.__create_bloom(new_size)
+            self.__record_rehash(start, 1)
+            return
+
+        insert_new = self.__storage.insert_new
+        for full_hash, key, value in old_storage.entries():
+            insert_new(full_hash, key, value)
+
+        if self.__bloom is not None:
+            self.__bloom = self.__create_bloom(new_size)
+            for full_hash, key, value in self.__storage.entries():
+                self.__bloom.add_hash(full_hash)
+
+        self.__record_rehash(start, 1)
+
+    def __record_rehash(self, start: float | None, rehashes: int) -> None:
+        # время переноса корзин при инкрементальном рехешировании тоже считается временем рехеширования
+        if start is not None:
+            self.__stats['rehashes'] += rehashes
+            self.__stats['rehash_time'] += perf_counter() - start
+
+    def __migrate(self, amount: int) -> None:
+        if self.__iterators:
+            return
+
+        start = perf_counter() if self.__stats is not None else None
+        on_move = self.__bloom.add_hash if self.__bloom is not None else None
+        self.__migrated = self.__old_storage.move_buckets(self.__migrated, amount, self.__storage, on_move)
+        self.__record_rehash(start, 0)
+        if self.__migrated == self.__old_storage.size:
+            self.__old_storage = self.__old_bloom = None
+            self.__shrink_if_sparse()
+
+    def __shrink_if_sparse(self) -> None:
+        if (self.__shrink_load_factor is None or self.__old_storage is not None
+                or self.size <= self.__min_size or self.count >= self.size * self.__shrink_load_factor):
+            return
+
+        self.__rehash(max(ceil(self.count / _TARGET_LOAD_FACTOR), self.__min_size))
+
+    def __finish_migration(self) -> None:
+        start = perf_counter() if self.__stats is not None else None
+        on_move = self.__bloom.add_hash if self.__bloom is not None else None
+        self.__old_storage.move_buckets(self.__migrated, self.__old_storage.size, self.__storage, on_move)
+        self.__old_storage = self.__old_bloom = None
+        self.__version += 1
+        self.__record_rehash(start, 0)
 
     def __setitem__(self, key: Any, value: Any) -> None:
         self.put(key, value)
 
     def __getitem__(self, key: Any) -> Any:
-        value = self.get(key)
-        if value is None:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
             raise KeyError(f"Key '{key}' not found")
         return value
 
     def __contains__(self, key: Any) -> bool:
-        return self.get(key) is not None
+        return self.get(key, _MISSING) is not _MISSING
 
     def __str__(self) -> str:
-        items = []
-        for bucket in self.table:
-            for key, value in bucket:
-                items.append(f"{key}: {value}")
+        items = (f"{key}: {value}" for key, value in self._iter_items())
         return "hash_table(" + ", ".join(items) + ")"
 
+    def __iter__(self) -> Iterator[Any]:
+        for key, value in self._iter_items():
+            yield key
+
     def __len__(self) -> int:
         return self.count
 
@@ -143,3 +1215,89 @@ if __name__ == "__main__":
     print(f"Количество элементов: {len(small_ht)}")
     print(f"Коэффициент заполнения: {small_ht.load_factor():.2f}")
     print(f"Все элементы: {small_ht}")
+
+    for mode in ('linear', 'robin_hood'):
+        open_ht = HashTable(3, mode=mode)
+        for i in range(10):
+            open_ht.put(f"key{i}", i)
+        open_ht.delete("key3")
+
+        print(f"Открытая адресация ({mode}): {open_ht}")
+        print(f"key7 -> {open_ht['key7']}, key3 -> {open_ht.get('key3', 'удалён')}")
+
+    ordered_ht = HashTable(4, mode='ordered')
+    for fruit in ("apple", "banana", "orange", "grape"):
+        ordered_ht[fruit] = len(fruit)
+    ordered_ht.move_to_end("apple")
+    ordered_ht.move_to_end("grape", last=False)
+
+    print(f"Порядок вставки: {ordered_ht}")
+    print(f"popitem() -> {ordered_ht.popitem()}, popitem(last=False) -> {ordered_ht.popitem(last=False)}")
+
+    arena_ht = HashTable(8, mode='arena')
+    for i in range(20):
+        arena_ht[f"user:{i}"] = i
+    arena_ht.delete("user:3")
+    print(f"Строковые ключи в арене: user:7 -> {arena_ht['user:7']}, user:3 -> {arena_ht.get('user:3', 'удалён')}, "
+          f"{len(arena_ht)} элементов")
+
+    report_ht = HashTable(64)
+    for i in range(40):
+        report_ht.put(f"key{i}", i)
+
+    print(f"Распределение по корзинам: {report_ht.collision_report()}")
+
+    stats_ht = HashTable(4, track_stats=True)
+    for i in range(100):
+        stats_ht.put(i, i)
+    stats_ht.get_many(range(150))
+    stats = stats_ht.stats()
+    print(f"Статистика: попаданий {stats['hits']}, промахов {stats['misses']}, "
+          f"рехеширований {stats['rehashes']} за {stats['rehash_time'] * 1000:.2f} мс, "
+          f"самая длинная цепочка {stats['longest']}, память ~{stats['memory_bytes']} байт")
+
+    incremental_ht = HashTable(4, incremental=True, rehash_step=1)
+    for i in range(6):
+        incremental_ht.put(f"key{i}", i)
+
+    print(f"Идёт перенос корзин? {incremental_ht.is_rehashing()}, key1 -> {incremental_ht['key1']}")
+    for i in range(6, 12):
+        incremental_ht.put(f"key{i}", i)
+    print(f"Инкрементальная таблица: {incremental_ht}")
+
+    bulk_ht = HashTable.from_items((f"key{i}", i) for i in range(1000))
+    bulk_ht.update({"key1": -1, "extra": 1000})
+
+    print(f"Пакетная загрузка: размер {bulk_ht.size}, элементов {len(bulk_ht)}")
+    print(f"get_many -> {bulk_ht.get_many(['key1', 'key2', 'missing'], 'Не найдено')}")
+    print(f"delete_many -> {bulk_ht.delete_many(['key1', 'key2', 'missing'])}")
+
+    bulk_ht.delete_many([f"key{i}" for i in range(900)])
+    print(f"После удаления 900 ключей: размер {bulk_ht.size}, элементов {len(bulk_ht)}")
+    bulk_ht.compact()
+    print(f"После compact(): размер {bulk_ht.size}, коэффициент заполнения {bulk_ht.load_factor():.2f}")
+
+    from tempfile import TemporaryDirectory
+
+    with TemporaryDirectory() as directory:
+        bulk_ht.save(f"{directory}/table.bin")
+        with HashTable.open(f"{directory}/table.bin") as mapped_ht:
+            print(f"Открыто с диска: {len(mapped_ht)} элементов, key950 -> {mapped_ht['key950']}")
+
+    frozen_ht = bulk_ht.freeze()
+    print(f"Заморожено: {len(frozen_ht)} элементов, key950 -> {frozen_ht['key950']}, "
+          f"{frozen_ht.bits_per_key:.1f} бит на ключ, построение {frozen_ht.build_time * 1000:.1f} мс")
+
+    bloom_ht = HashTable.from_items(((i, i * i) for i in range(1000)), bloom_filter=True)
+    print(f"С фильтром Блума: 10 -> {bloom_ht.get(10)}, 5000 -> {bloom_ht.get(5000, 'Не найдено')}")
+
+    keys_view = ht.keys()
+    ht["kiwi"] = 50
+    print(f"Представление видит новый ключ: {'kiwi' in keys_view}, всего ключей {len(keys_view)}")
+    print(f"Общие ключи: {keys_view & {'kiwi', 'apple', 'mango'}}")
+
+    try:
+        for key in ht:
+            ht.delete(key)
+    except RuntimeError as error:
+        print(f"Изменение во время обхода: {error}")
@@ -0,0 +1,186 @@
+import mmap
+import os
+import pickle
+import struct
+from hashlib import blake2b
+from math import ceil
+from typing import Any, Iterable, Iterator
+
+# Формат файла:
+#   заголовок (64 байта): сигнатура, ёмкость, количество элементов, смещение кучи
+#   массив ячеек: хеш (8 байт), смещение записи в куче (8), длина ключа (4), длина значения (4)
+#   куча: закодированный ключ и pickle значения подряд для каждой записи
+# Пустая ячейка - нулевая длина ключа (закодированный ключ не короче одного байта).
+_MAGIC = b'HTMAP002'
+_HEADER = struct.Struct('<8sQQQ')
+_HEADER_SIZE = 64
+_SLOT = struct.Struct('<QQII')
+_PART = struct.Struct('<I')
+_MAX_LOAD_FACTOR = 0.7
+
+
+def _encode_key(key: Any) -> bytes:
+    # равные ключи должны кодироваться одинаково: 1, 1.0 и True - один и тот же ключ.
+    # Кортежи и frozenset кодируются по элементам, поэтому (1.0, 2) совпадает с (1, 2);
+    # остальные ключи идут через pickle и находятся только по тем же байтам pickle
+    if isinstance(key, float) and key.is_integer():
+        key = int(key)
+
+    if isinstance(key, str):
+        # surrogatepass: одиночные суррогаты допустимы в str, а значит и в ключах HashTable
+        return b's' + key.encode('utf-8', 'surrogatepass')
+    if isinstance(key, bytes):
+        return b'b' + key
+    if isinstance(key, int):
+        return b'i' + str(int(key)).encode()
+    if isinstance(key, float):
+        return b'f' + repr(key).encode()
+    if isinstance(key, tuple):
+        return b't' + _encode_parts(_encode_key(item) for item in key)
+    if isinstance(key, frozenset):
+        # порядок обхода множества не определён - части сортируются
+        return b'z' + _encode_parts(sorted(_encode_key(item) for item in key))
+    return b'p' + pickle.dumps(key)
+
+
+def _encode_parts(parts: Iterable[bytes]) -> bytes:
+    return b''.join(_PART.pack(len(part)) + part for part in parts)
+
+
+def _decode_parts(payload: bytes) -> Iterator[Any]:
+    position = 0
+    while position < len(payload):
+        length, = _PART.unpack_from(payload, position)
+        position += _PART.size
+        yield _decode_key(payload[position:position + length])
+        position += length
+
+
+def _decode_key(data: bytes) -> Any:
+    tag, payload = data[:1], data[1:]
+
+    if tag == b's':
+        return bytes(payload).decode('utf-8', 'surrogatepass')
+    if tag == b'b':
+        return bytes(payload)
+    if tag == b'i':
+        return int(payload)
+    if tag == b'f':
+        return float(payload)
+    if tag == b't':
+        return tuple(_decode_parts(payload))
+    if tag == b'z':
+        return frozenset(_decode_parts(payload))
+    return pickle.loads(payload)
+
+
+def _hash(encoded_key: bytes) -> int:
+    # hash() зависит от PYTHONHASHSEED, а файл читается другими процессами
+    return int.from_bytes(blake2b(encoded_key, digest_size=8).digest(), 'little')
+
+
+def write_table(path: str, items: Iterable[tuple[Any, Any]], count: int) -> None:
+    capacity = max(ceil(count / _MAX_LOAD_FACTOR), 1)
+    heap_offset = _HEADER_SIZE + capacity * _SLOT.size
+    slots = bytearray(capacity * _SLOT.size)
+    temp_path = f'{path}.tmp'
+
+    with open(temp_path, 'wb') as file:
+        file.seek(heap_offset)
+        offset = heap_offset
+
+        for key, value in items:
+            encoded_key = _encode_key(key)
+            encoded_value = pickle.dumps(value)
+            full_hash = _hash(encoded_key)
+
+            index = full_hash % capacity
+            while _SLOT.unpack_from(slots, index * _SLOT.size)[2]:
+                index = (index + 1) % capacity
+
+            _SLOT.pack_into(slots, index * _SLOT.size, full_hash, offset, len(encoded_key), len(encoded_value))
+            file.write(encoded_key)
+            file.write(encoded_value)
+            offset += len(encoded_key) + len(encoded_value)
+
+        file.seek(0)
+        file.write(_HEADER.pack(_MAGIC, capacity, count, heap_offset).ljust(_HEADER_SIZE, b'\0'))
+        file.write(slots)
+
+    os.replace(temp_path, path)
+
+
+class MappedHashTable:
+    # Таблица только для чтения поверх mmap: открытие не читает файл целиком,
+    # страницы подгружаются операционной системой при первом обращении
+    def __init__(self, path: str) -> None:
+        with open(path, 'rb') as file:
+            self.__map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.size, self.count, self.__heap_offset = _HEADER.unpack_from(self.__map)
+        if magic != _MAGIC:
+            self.__map.close()
+            raise ValueError(f"File '{path}' is not a saved hash table")
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        encoded_key = _encode_key(key)
+        full_hash = _hash(encoded_key)
+        table_map, size = self.__map, self.size
+        index = full_hash % size
+
+        while True:
+            cur_hash, offset, key_length, value_length = _SLOT.unpack_from(table_map, _HEADER_SIZE + index * _SLOT.size)
+            if not key_length:
+                return default
+            if cur_hash == full_hash and table_map[offset:offset + key_length] == encoded_key:
+                return pickle.loads(table_map[offset + key_length:offset + key_length + value_length])
+
+            index += 1
+            if index == size:
+                index = 0
+
+    def load_factor(self) -> float:
+        return self.count / self.size
+
+    def keys(self) -> Iterator[Any]:
+        for key, value in self.items():
+            yield key
+
+    def values(self) -> Iterator[Any]:
+        for key, value in self.items():
+            yield value
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        table_map = self.__map
+        for cur_hash, offset, key_length, value_length in _SLOT.iter_unpack(table_map[_HEADER_SIZE:self.__heap_offset]):
+            if key_length:
+                yield (_decode_key(table_map[offset:offset + key_length]),
+                       pickle.loads(table_map[offset + key_length:offset + key_length + value_length]))
+
+    def close(self) -> None:
+        self.__map.close()
+
+    def __enter__(self) -> 'MappedHashTable':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self.get(key, self)
+        if value is self:
+            raise KeyError(f"Key '{key}' not found")
+        return value
+
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key, self) is not self
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.keys()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __str__(self) -> str:
+        items = (f"{key}: {value}" for key, value in self.items())
+        return "mapped_hash_table(" + ", ".join(items) + ")"
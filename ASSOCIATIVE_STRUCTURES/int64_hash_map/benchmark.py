@@ -0,0 +1,57 @@
+from time import perf_counter
+
+import numpy as np
+
+from ASSOCIATIVE_STRUCTURES.hash_table.main import HashTable
+from ASSOCIATIVE_STRUCTURES.int64_hash_map.main import Int64HashMap
+
+KEYS = 1_000_000
+PROBES = 1_000_000
+SCALAR_SHARE = 10
+
+
+def measure(action) -> float:
+    start = perf_counter()
+    action()
+    return perf_counter() - start
+
+
+def scalar_put(table: Int64HashMap, keys: list[int], values: list[int]) -> None:
+    for key, value in zip(keys, values):
+        table.put(key, value)
+
+
+def scalar_get(table: Int64HashMap, keys: list[int]) -> None:
+    for key in keys:
+        table.get(key)
+
+
+if __name__ == "__main__":
+    # соединение по идентификаторам: половина запросов попадает в таблицу, половина нет
+    rng = np.random.default_rng(1)
+    ids = rng.integers(np.iinfo(np.int64).min, np.iinfo(np.int64).max, KEYS, dtype=np.int64)
+    values = np.arange(KEYS, dtype=np.int64)
+    probes = np.concatenate([rng.choice(ids, PROBES // 2),
+                             rng.integers(np.iinfo(np.int64).min, np.iinfo(np.int64).max, PROBES // 2, dtype=np.int64)])
+    id_list, value_list, probe_list = ids.tolist(), values.tolist(), probes.tolist()
+
+    table = HashTable(16)
+    put_time = measure(lambda: table.put_many(zip(id_list, value_list)))
+    get_time = measure(lambda: table.get_many(probe_list, -1))
+
+    int_map = Int64HashMap()
+    batch_put_time = measure(lambda: int_map.put_many(ids, values))
+    batch_get_time = measure(lambda: int_map.get_many(probes, -1))
+
+    # скалярные методы медленные (каждое обращение к массиву создаёт скаляр NumPy),
+    # поэтому меряем десятую часть и умножаем
+    part = KEYS // SCALAR_SHARE
+    scalar_map = Int64HashMap()
+    scalar_put_time = measure(lambda: scalar_put(scalar_map, id_list[:part], value_list[:part])) * SCALAR_SHARE
+    scalar_get_time = measure(lambda: scalar_get(int_map, probe_list[:PROBES // SCALAR_SHARE])) * SCALAR_SHARE
+
+    print(f"{KEYS:,} ключей, {PROBES:,} запросов")
+    print(f"{'':<34}{'вставка, с':>12}{'поиск, с':>12}")
+    print(f"{'HashTable put_many/get_many':<34}{put_time:>12.3f}{get_time:>12.3f}")
+    print(f"{'Int64HashMap put_many/get_many':<34}{batch_put_time:>12.3f}{batch_get_time:>12.3f}")
+    print(f"{'Int64HashMap put/get (оценка)':<34}{scalar_put_time:>12.3f}{scalar_get_time:>12.3f}")
@@ -0,0 +1,250 @@
+from typing import Any, Iterator
+
+import numpy as np
+
+_EMPTY, _FULL, _DELETED = 0, 1, 2
+_MASK = (1 << 64) - 1
+_MULTIPLIER = 0x9E3779B97F4A7C15
+_MIN_KEY, _MAX_KEY = -(1 << 63), (1 << 63) - 1
+_MAX_LOAD_FACTOR = 0.5
+
+
+class Int64HashMap:
+    # Ключи int64 и значения лежат в массивах NumPy (открытая адресация, линейное пробирование),
+    # поэтому пакетные get_many / put_many обрабатывают весь массив ключей векторно
+    def __init__(self, size: int = 16, value_dtype: Any = np.int64) -> None:
+        self.count = 0
+        self.value_dtype = np.dtype(value_dtype)
+        self.__tombstones = 0
+        self.__allocate(self.__capacity_for(size))
+
+    @property
+    def size(self) -> int:
+        return len(self.__keys)
+
+    def put(self, key: int, value: Any) -> None:
+        key = self.__check_key(key)
+        self.__reserve(self.count + 1)
+
+        slot = self.__slot(key)
+        target = -1
+        while self.__states[slot] != _EMPTY:
+            if self.__states[slot] == _FULL:
+                if self.__keys[slot] == key:
+                    self.__values[slot] = value
+                    return
+            elif target == -1:
+                target = slot
+            slot = (slot + 1) & self.__mask
+
+        if target == -1:
+            target = slot
+        else:
+            self.__tombstones -= 1
+
+        self.__states[target] = _FULL
+        self.__keys[target] = key
+        self.__values[target] = value
+        self.count += 1
+
+    def get(self, key: int, default: Any = None) -> Any:
+        slot = self.__find(self.__check_key(key))
+        return default if slot == -1 else self.__values[slot].item()
+
+    def delete(self, key: int) -> bool:
+        slot = self.__find(self.__check_key(key))
+        if slot == -1:
+            return False
+
+        self.__states[slot] = _DELETED
+        self.count -= 1
+        self.__tombstones += 1
+        return True
+
+    def put_many(self, keys: Any, values: Any) -> None:
+        keys = self.__check_keys(keys)
+        values = np.broadcast_to(np.asarray(values, dtype=self.value_dtype), keys.shape)
+        if not len(keys):
+            return
+
+        # при повторах ключа в пакете побеждает последнее значение, как при последовательных put
+        unique_keys, last = np.unique(keys[::-1], return_index=True)
+        unique_values = values[::-1][last]
+
+        slots = self.__find_many(unique_keys)
+        found = slots != -1
+        self.__values[slots[found]] = unique_values[found]
+
+        new_keys, new_values = unique_keys[~found], unique_values[~found]
+        if len(new_keys):
+            self.__reserve(self.count + len(new_keys))
+            self.__insert_new(new_keys, new_values)
+
+    def get_many(self, keys: Any, default: Any = 0) -> np.ndarray:
+        keys = self.__check_keys(keys)
+        slots = self.__find_many(keys)
+        result = np.full(keys.shape, default, dtype=self.value_dtype)
+        found = slots != -1
+        result[found] = self.__values[slots[found]]
+        return result
+
+    def contains_many(self, keys: Any) -> np.ndarray:
+        return self.__find_many(self.__check_keys(keys)) != -1
+
+    def load_factor(self) -> float:
+        return self.count / self.size
+
+    def keys(self) -> np.ndarray:
+        return self.__keys[self.__states == _FULL].copy()
+
+    def values(self) -> np.ndarray:
+        return self.__values[self.__states == _FULL].copy()
+
+    def items(self) -> Iterator[tuple[int, Any]]:
+        full = self.__states == _FULL
+        return zip(self.__keys[full].tolist(), self.__values[full].tolist())
+
+    @staticmethod
+    def __capacity_for(count: int) -> int:
+        capacity = 8
+        while count > capacity * _MAX_LOAD_FACTOR:
+            capacity *= 2
+        return capacity
+
+    def __allocate(self, capacity: int) -> None:
+        self.__mask = capacity - 1
+        self.__states = np.zeros(capacity, dtype=np.uint8)
+        self.__keys = np.zeros(capacity, dtype=np.int64)
+        self.__values = np.zeros(capacity, dtype=self.value_dtype)
+
+    @staticmethod
+    def __check_key(key: int) -> int:
+        if isinstance(key, (bool, np.bool_)) or not isinstance(key, (int, np.integer)):
+            raise ValueError(f"Int64HashMap keys must be integers, got {type(key).__name__}")
+        key = int(key)
+        if not _MIN_KEY <= key <= _MAX_KEY:
+            raise ValueError(f"Key {key} does not fit into int64")
+        return key
+
+    @staticmethod
+    def __check_keys(keys: Any) -> np.ndarray:
+        keys = np.asarray(keys)
+        if keys.ndim != 1:
+            keys = keys.reshape(-1)
+        if keys.size and not np.issubdtype(keys.dtype, np.integer):
+            raise ValueError(f"Int64HashMap keys must be integers, got {keys.dtype}")
+        if keys.dtype == np.uint64 and keys.size and keys.max() > _MAX_KEY:
+            raise ValueError("Keys do not fit into int64")
+        return keys.astype(np.int64, copy=False)
+
+    def __slot(self, key: int) -> int:
+        value = (key & _MASK) * _MULTIPLIER & _MASK
+        return (value ^ (value >> 32)) & self.__mask
+
+    def __slots(self, keys: np.ndarray) -> np.ndarray:
+        # та же функция, что и __slot: умножение uint64 в NumPy переполняется по модулю 2**64
+        value = keys.view(np.uint64) * np.uint64(_MULTIPLIER)
+        value ^= value >> np.uint64(32)
+        return (value & np.uint64(self.__mask)).astype(np.intp)
+
+    def __find(self, key: int) -> int:
+        slot = self.__slot(key)
+        while self.__states[slot] != _EMPTY:
+            if self.__states[slot] == _FULL and self.__keys[slot] == key:
+                return slot
+            slot = (slot + 1) & self.__mask
+        return -1
+
+    def __find_many(self, keys: np.ndarray) -> np.ndarray:
+        # шаг пробирования за раз для всех ещё не разрешённых ключей; итераций столько,
+        # какова самая длинная цепочка пробирования в пакете
+        result = np.full(len(keys), -1, dtype=np.intp)
+        pending = np.arange(len(keys))
+        slots = self.__slots(keys)
+
+        while len(pending):
+            states = self.__states[slots]
+            hit = (states == _FULL) & (self.__keys[slots] == keys[pending])
+            result[pending[hit]] = slots[hit]
+
+            active = (states != _EMPTY) & ~hit
+            pending = pending[active]
+            slots = (slots[active] + 1) & self.__mask
+
+        return result
+
+    def __insert_new(self, keys: np.ndarray, values: np.ndarray) -> None:
+        # ключи уникальны и отсутствуют в таблице, поэтому можно занимать и пустые, и удалённые ячейки;
+        # если несколько ключей претендуют на одну ячейку, её получает первый, остальные пробуют снова
+        pending = np.arange(len(keys))
+        slots = self.__slots(keys)
+
+        while len(pending):
+            free = self.__states[slots] != _FULL
+            candidates = np.flatnonzero(free)
+            taken, first = np.unique(slots[candidates], return_index=True)
+            winners = candidates[first]
+
+            self.__tombstones -= int(np.count_nonzero(self.__states[taken] == _DELETED))
+            self.__states[taken] = _FULL
+            self.__keys[taken] = keys[pending[winners]]
+            self.__values[taken] = values[pending[winners]]
+
+            placed = np.zeros(len(pending), dtype=bool)
+            placed[winners] = True
+            # проигравшие остаются на месте: на следующем шаге ячейка уже занята, и они сдвинутся
+            slots = np.where(free, slots, (slots + 1) & self.__mask)[~placed]
+            pending = pending[~placed]
+
+        self.count += len(keys)
+
+    def __reserve(self, count: int) -> None:
+        if count + self.__tombstones <= self.size * _MAX_LOAD_FACTOR:
+            return
+
+        full = self.__states == _FULL
+        keys, values = self.__keys[full], self.__values[full]
+
+        self.__allocate(self.__capacity_for(count))
+        self.count = 0
+        self.__tombstones = 0
+        self.__insert_new(keys, values)
+
+    def __setitem__(self, key: int, value: Any) -> None:
+        self.put(key, value)
+
+    def __getitem__(self, key: int) -> Any:
+        slot = self.__find(self.__check_key(key))
+        if slot == -1:
+            raise KeyError(f"Key '{key}' not found")
+        return self.__values[slot].item()
+
+    def __contains__(self, key: int) -> bool:
+        return self.__find(self.__check_key(key)) != -1
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.keys().tolist())
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __str__(self) -> str:
+        items = (f"{key}: {value}" for key, value in self.items())
+        return "int64_hash_map(" + ", ".join(items) + ")"
+
+
+if __name__ == "__main__":
+    table = Int64HashMap()
+
+    table.put(42, 1)
+    table[-7] = 2
+    table.put_many(np.arange(100, 110), np.arange(10) * 10)
+    table.delete(105)
+
+    print(f"Таблица: {table}")
+    print(f"Размер: {table.size}, элементов: {len(table)}, коэффициент заполнения: {table.load_factor():.2f}")
+    print(f"get(42) -> {table.get(42)}, get(105) -> {table.get(105, 'Не найдено')}")
+
+    ids = np.array([42, 100, 105, 109, 1000])
+    print(f"get_many({ids.tolist()}) -> {table.get_many(ids, default=-1).tolist()}")
+    print(f"contains_many({ids.tolist()}) -> {table.contains_many(ids).tolist()}")
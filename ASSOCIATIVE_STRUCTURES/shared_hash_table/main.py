@@ -0,0 +1,308 @@
+import struct
+import sys
+from hashlib import blake2b
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Iterator, Literal
+
+from ASSOCIATIVE_STRUCTURES.hash_table.main import mix_hash
+
+Kinds = Literal['int', 'bytes']
+
+_MAGIC = b'SHTBL001'
+_HEADER = struct.Struct('<8sQQQQBBHH')
+_HEADER_SIZE = 64
+_COUNT_OFFSET = 16
+_VERSION_OFFSET = 24
+_TOMBSTONES_OFFSET = 32
+_U64 = struct.Struct('<Q')
+
+_EMPTY, _FULL, _DELETED = 0, 1, 2
+_KIND_CODES = {'int': 0, 'bytes': 1}
+_MAX_LOAD_FACTOR = 0.7
+
+
+class SharedHashTable:
+    """
+    Хеш-таблица с открытой адресацией в multiprocessing.shared_memory для ключей и значений
+    фиксированной схемы: int (int64) или bytes (не длиннее key_size / value_size).
+
+    Модель согласованности: один писатель, много читателей. Писатель (create) окружает каждое
+    изменение seqlock-счётчиком версии: нечётная версия - идёт запись. Читатели (attach) повторяют
+    поиск, если версия была нечётной или изменилась за время поиска, поэтому никогда не видят
+    наполовину записанную ячейку. Обход items() согласован только по отдельным ячейкам.
+    Ёмкость фиксируется при создании, таблица не растёт.
+    """
+
+    def __init__(self, memory: SharedMemory, owner: bool) -> None:
+        self.__memory = memory
+        self.__buffer = memory.buf
+        self.__owner = owner
+
+        magic, capacity, _, _, _, key_code, value_code, key_size, value_size = _HEADER.unpack_from(self.__buffer)
+        if magic != _MAGIC:
+            raise ValueError(f"Shared memory block '{memory.name}' does not contain a hash table")
+
+        self.capacity = capacity
+        self.key_kind = 'int' if key_code == _KIND_CODES['int'] else 'bytes'
+        self.value_kind = 'int' if value_code == _KIND_CODES['int'] else 'bytes'
+        self.key_size = key_size
+        self.value_size = value_size
+        self.__slot = struct.Struct('<BQ' + self.__field_format(self.key_kind, key_size)
+                                    + self.__field_format(self.value_kind, value_size))
+
+    @classmethod
+    def create(cls, capacity: int, key_kind: Kinds = 'int', value_kind: Kinds = 'int', key_size: int = 8,
+               value_size: int = 8, name: str | None = None) -> 'SharedHashTable':
+        if key_kind not in _KIND_CODES or value_kind not in _KIND_CODES:
+            raise ValueError("Key and value kinds must be 'int' or 'bytes'")
+
+        slot = struct.Struct('<BQ' + cls.__field_format(key_kind, key_size) + cls.__field_format(value_kind, value_size))
+        memory = SharedMemory(name=name, create=True, size=_HEADER_SIZE + capacity * slot.size)
+        _HEADER.pack_into(memory.buf, 0, _MAGIC, capacity, 0, 0, 0, _KIND_CODES[key_kind], _KIND_CODES[value_kind],
+                          key_size, value_size)
+        return cls(memory, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> 'SharedHashTable':
+        if sys.version_info >= (3, 13):
+            memory = SharedMemory(name=name, track=False)
+        else:
+            memory = SharedMemory(name=name)
+            # до 3.13 трекер ресурсов удалил бы блок при выходе читателя
+            resource_tracker.unregister(memory._name, 'shared_memory')
+        return cls(memory, owner=False)
+
+    @property
+    def name(self) -> str:
+        return self.__memory.name
+
+    def put(self, key: Any, value: Any) -> None:
+        self.__check_owner()
+        self.__check(self.key_kind, self.key_size, key)
+        self.__check(self.value_kind, self.value_size, value)
+
+        full_hash = self.__hash(key)
+        index, found = self.__probe(full_hash, key, for_insert=True)
+        count, tombstones = len(self), self.__read_u64(_TOMBSTONES_OFFSET)
+
+        if not found and count + 1 + tombstones > self.capacity * _MAX_LOAD_FACTOR:
+            if count + 1 > self.capacity * _MAX_LOAD_FACTOR:
+                raise ValueError('Shared hash table is full')
+            self.__purge_tombstones()
+            index, found = self.__probe(full_hash, key, for_insert=True)
+            tombstones = 0
+
+        self.__begin_write()
+        if not found:
+            if self.__read_slot(index)[0] == _DELETED:
+                _U64.pack_into(self.__buffer, _TOMBSTONES_OFFSET, tombstones - 1)
+            _U64.pack_into(self.__buffer, _COUNT_OFFSET, count + 1)
+        self.__write_slot(index, _FULL, full_hash, key, value)
+        self.__end_write()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        if not self.__matches_kind(self.key_kind, self.key_size, key):
+            return default
+
+        full_hash = self.__hash(key)
+        while True:
+            version = self.__version()
+            if version & 1:
+                continue
+
+            index, found = self.__probe(full_hash, key)
+            value = self.__read_slot(index)[3] if found else default
+
+            if self.__version() == version:
+                return value
+
+    def delete(self, key: Any) -> bool:
+        self.__check_owner()
+        if not self.__matches_kind(self.key_kind, self.key_size, key):
+            return False
+
+        index, found = self.__probe(self.__hash(key), key)
+        if not found:
+            return False
+
+        self.__begin_write()
+        self.__buffer[self.__offset(index)] = _DELETED
+        _U64.pack_into(self.__buffer, _COUNT_OFFSET, len(self) - 1)
+        _U64.pack_into(self.__buffer, _TOMBSTONES_OFFSET, self.__read_u64(_TOMBSTONES_OFFSET) + 1)
+        self.__end_write()
+        return True
+
+    def load_factor(self) -> float:
+        return len(self) / self.capacity
+
+    def keys(self) -> Iterator[Any]:
+        for key, value in self.items():
+            yield key
+
+    def values(self) -> Iterator[Any]:
+        for key, value in self.items():
+            yield value
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        for index in range(self.capacity):
+            while True:
+                version = self.__version()
+                if version & 1:
+                    continue
+                state, _, key, value = self.__read_slot(index)
+                if self.__version() == version:
+                    break
+            if state == _FULL:
+                yield key, value
+
+    def close(self) -> None:
+        self.__buffer.release()
+        self.__memory.close()
+
+    def unlink(self) -> None:
+        self.__check_owner()
+        if sys.version_info < (3, 13):
+            # читатели, запущенные через fork, делят трекер с писателем и могли снять регистрацию
+            resource_tracker.register(self.__memory._name, 'shared_memory')
+        self.__memory.unlink()
+
+    @staticmethod
+    def __field_format(kind: str, size: int) -> str:
+        return 'q' if kind == 'int' else f'H{size}s'
+
+    @staticmethod
+    def __matches_kind(kind: str, size: int, item: Any) -> bool:
+        if kind == 'int':
+            return isinstance(item, int) and -(1 << 63) <= item < (1 << 63)
+        return isinstance(item, bytes) and len(item) <= size
+
+    def __check(self, kind: str, size: int, item: Any) -> None:
+        if not self.__matches_kind(kind, size, item):
+            limit = 'int64' if kind == 'int' else f'bytes of length <= {size}'
+            raise TypeError(f"Expected {limit}, got {item!r}")
+
+    def __check_owner(self) -> None:
+        if not self.__owner:
+            raise PermissionError('Only the process that created the table can modify it')
+
+    def __hash(self, key: Any) -> int:
+        # hash() для bytes зависит от PYTHONHASHSEED процесса, поэтому хеш считается детерминированно
+        if self.key_kind == 'int':
+            return mix_hash(key, 0)
+        return int.from_bytes(blake2b(key, digest_size=8).digest(), 'little')
+
+    def __offset(self, index: int) -> int:
+        return _HEADER_SIZE + index * self.__slot.size
+
+    def __read_slot(self, index: int) -> tuple[int, int, Any, Any]:
+        fields = self.__slot.unpack_from(self.__buffer, self.__offset(index))
+        state, full_hash = fields[0], fields[1]
+
+        if self.key_kind == 'int':
+            key, rest = fields[2], fields[3:]
+        else:
+            key, rest = fields[3][:fields[2]], fields[4:]
+
+        value = rest[0] if self.value_kind == 'int' else rest[1][:rest[0]]
+        return state, full_hash, key, value
+
+    def __write_slot(self, index: int, state: int, full_hash: int, key: Any, value: Any) -> None:
+        fields = [state, full_hash]
+        fields += [key] if self.key_kind == 'int' else [len(key), key]
+        fields += [value] if self.value_kind == 'int' else [len(value), value]
+        self.__slot.pack_into(self.__buffer, self.__offset(index), *fields)
+
+    def __purge_tombstones(self) -> None:
+        # перестройка на месте: читатели на это время уходят на повтор по seqlock
+        entries = [self.__read_slot(index) for index in range(self.capacity)]
+
+        self.__begin_write()
+        end = self.__offset(self.capacity)
+        self.__buffer[_HEADER_SIZE:end] = bytes(end - _HEADER_SIZE)
+
+        for state, full_hash, key, value in entries:
+            if state == _FULL:
+                index, _ = self.__probe(full_hash, key, for_insert=True)
+                self.__write_slot(index, _FULL, full_hash, key, value)
+
+        _U64.pack_into(self.__buffer, _TOMBSTONES_OFFSET, 0)
+        self.__end_write()
+
+    def __probe(self, full_hash: int, key: Any, for_insert: bool = False) -> tuple[int, bool]:
+        # возвращает (ячейка ключа, True) или (куда вставлять, False)
+        index = full_hash % self.capacity
+        free_index = None
+
+        for _ in range(self.capacity):
+            state, cur_hash, cur_key, _ = self.__read_slot(index)
+            if state == _EMPTY:
+                return (index if free_index is None else free_index), False
+            if state == _DELETED:
+                if for_insert and free_index is None:
+                    free_index = index
+            elif cur_hash == full_hash and cur_key == key:
+                return index, True
+
+            index = (index + 1) % self.capacity
+
+        return free_index if free_index is not None else -1, False
+
+    def __read_u64(self, offset: int) -> int:
+        return _U64.unpack_from(self.__buffer, offset)[0]
+
+    def __version(self) -> int:
+        return self.__read_u64(_VERSION_OFFSET)
+
+    def __begin_write(self) -> None:
+        _U64.pack_into(self.__buffer, _VERSION_OFFSET, self.__version() + 1)
+
+    def __end_write(self) -> None:
+        _U64.pack_into(self.__buffer, _VERSION_OFFSET, self.__version() + 1)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.put(key, value)
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self.get(key, self)
+        if value is self:
+            raise KeyError(f"Key '{key}' not found")
+        return value
+
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key, self) is not self
+
+    def __len__(self) -> int:
+        return self.__read_u64(_COUNT_OFFSET)
+
+    def __str__(self) -> str:
+        items = (f"{key}: {value}" for key, value in self.items())
+        return "shared_hash_table(" + ", ".join(items) + ")"
+
+
+def _lookup(name: str, keys: list[int]) -> list[Any]:
+    table = SharedHashTable.attach(name)
+    try:
+        return [table.get(key) for key in keys]
+    finally:
+        table.close()
+
+
+if __name__ == "__main__":
+    from concurrent.futures import ProcessPoolExecutor
+
+    table = SharedHashTable.create(1024, key_kind='int', value_kind='bytes', value_size=16)
+    try:
+        for i in range(500):
+            table.put(i, f"value{i}".encode())
+        table.delete(7)
+
+        print(f"Количество элементов: {len(table)}, коэффициент заполнения: {table.load_factor():.2f}")
+
+        with ProcessPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(_lookup, [table.name] * 4, [[1, 7, 499], [2, 3], [100], [1000]]))
+
+        print(f"Результаты воркеров: {results}")
+    finally:
+        table.close()
+        table.unlink()
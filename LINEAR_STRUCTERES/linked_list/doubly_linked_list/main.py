@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Iterator
 
 
 class DoublyLinkedList:
@@ -12,6 +12,7 @@ class DoublyLinkedList:
 
     def __init__(self) -> None:
         self.__head = self.__tail = None
+        self.__size = 0
 
     def add_first(self, value: Any) -> __Node:
         new_node = self.__Node(value)
@@ -23,6 +24,7 @@ class DoublyLinkedList:
             self.__head.prev = new_node
             self.__head = new_node
 
+        self.__size += 1
         return new_node
 
     def add_last(self, value: Any) -> __Node:
@@ -34,6 +36,8 @@ class DoublyLinkedList:
             new_node.prev = self.__tail
             self.__tail.next = new_node
             self.__tail = new_node
+
+        self.__size += 1
         return new_node
 
     def remove_fist(self) -> __Node:
@@ -50,6 +54,7 @@ class DoublyLinkedList:
             new_head.prev = None
             self.__head = new_head
 
+        self.__size -= 1
         return removed_node
 
     def remove_last(self) -> __Node:
@@ -66,6 +71,7 @@ class DoublyLinkedList:
             prev_node.next = None
             self.__tail = prev_node
 
+        self.__size -= 1
         return removed_node
 
     def remove(self, linked_list_object: __Node or Any) -> None:
@@ -77,25 +83,29 @@ class DoublyLinkedList:
         else:
             self.__remove_value(linked_list_object)
 
-    def __remove_value(self, value: Any) -> None:
-
-        if self.__head.value == value:
-            self.remove_fist()
+    def move_to_last(self, node: __Node) -> None:
+        if node is self.__tail:
             return
 
-        if self.__tail.value == value:
-            self.remove_last()
-            return
+        if node is self.__head:
+            self.__head = node.next
+            self.__head.prev = None
+        else:
+            node.prev.next = node.next
+            node.next.prev = node.prev
+
+        node.prev = self.__tail
+        node.next = None
+        self.__tail.next = node
+        self.__tail = node
 
+    def __remove_value(self, value: Any) -> None:
         current = self.__head
-        prev = self.__head
 
-        while current.next:
+        while current:
             if current.value == value:
-                current.next = None
-                prev.next = current.next
+                self.__remove_node(current)
                 return
-            prev = prev.next
             current = current.next
 
         raise ValueError('Value not found in the list')
@@ -116,7 +126,9 @@ class DoublyLinkedList:
         node.next = None
 
         prev_node.next = next_node
-        next_node.prev = next_node
+        next_node.prev = prev_node
+
+        self.__size -= 1
 
     def __get_values(self) -> list:
         current = self.__head
@@ -147,9 +159,14 @@ class DoublyLinkedList:
         result = list() if self.__is_empty() else self.__get_values()
         return f'doubly_linked_list({result})'
 
+    def __iter__(self) -> Iterator[Any]:
+        current = self.__head
+        while current:
+            yield current.value
+            current = current.next
+
     def __len__(self) -> int:
-        result = list() if self.__is_empty() else self.__get_values()
-        return len(result)
+        return self.__size
 
 
 if __name__ == "__main__":
@@ -0,0 +1,296 @@
+from math import ceil
+from random import getrandbits
+from typing import Any, Callable, Iterable, Iterator
+
+from ASSOCIATIVE_STRUCTURES.hash_table.main import mix_hash
+
+_EMPTY = object()
+_DELETED = object()
+_MAX_LOAD_FACTOR = 0.7
+_TARGET_LOAD_FACTOR = 0.5
+
+
+class HashSet:
+    # Хеширование как в HashTable: mix_hash с солью, линейное пробирование, надгробия и те же пороги
+    # заполнения. Хранилища HashTable держат массив значений, поэтому пробирование здесь своё:
+    # в ячейке только хеш и ключ в двух параллельных списках, без значений и кортежей
+    def __init__(self, items: Iterable[Any] = (), size: int = 8, hash_function: Callable[[Any], int] = hash,
+                 seed: int | None = None) -> None:
+        self.count = 0
+        self._hash_function = hash_function
+        self._seed = getrandbits(64) if seed is None else seed
+        self._tombstones = 0
+        self._resize(max(size, 1))
+        self.update(items)
+
+    def add(self, key: Any) -> bool:
+        index, is_new = self._insert(self._hash(key), key)
+        return is_new
+
+    def discard(self, key: Any) -> bool:
+        index = self._find(self._hash(key), key)
+        if index == -1:
+            return False
+        self._remove_at(index)
+        return True
+
+    def remove(self, key: Any) -> None:
+        if not self.discard(key):
+            raise KeyError(f"Key '{key}' not found")
+
+    def pop(self) -> Any:
+        if not self.count:
+            raise KeyError('pop from an empty hash set')
+        index = self._next_slot()
+        key = self._keys[index]
+        self._remove_at(index)
+        return key
+
+    def clear(self) -> None:
+        self.count = 0
+        self._hashes, self._keys = [], []
+        self._resize(8)
+
+    def update(self, items: Iterable[Any]) -> None:
+        if hasattr(items, '__len__'):
+            self._reserve(self.count + len(items))
+        for key in items:
+            self.add(key)
+
+    def copy(self) -> 'HashSet':
+        result = self._empty_like()
+        result.count, result._tombstones = self.count, self._tombstones
+        result._hashes, result._keys = self._hashes.copy(), self._keys.copy()
+        return result
+
+    def load_factor(self) -> float:
+        return self.count / self.size
+
+    def union(self, other: Iterable[Any]) -> 'HashSet':
+        # копируем большее множество целиком (копирование списков идёт на C) и добавляем меньшее
+        other = self._as_set(other)
+        larger, smaller = (self, other) if len(self) >= len(other) else (other, self)
+        result = self._copy_of(larger)
+        for key in smaller:
+            result.add(key)
+        return result
+
+    def intersection(self, other: Iterable[Any]) -> 'HashSet':
+        other = self._as_set(other)
+        larger, smaller = (self, other) if len(self) >= len(other) else (other, self)
+        result = self._empty_like()
+        for key in smaller:
+            if key in larger:
+                result.add(key)
+        return result
+
+    def difference(self, other: Iterable[Any]) -> 'HashSet':
+        other = self._as_set(other)
+        if len(other) < len(self):
+            result = self.copy()
+            for key in other:
+                result.discard(key)
+            return result
+
+        result = self._empty_like()
+        for key in self:
+            if key not in other:
+                result.add(key)
+        return result
+
+    def symmetric_difference(self, other: Iterable[Any]) -> 'HashSet':
+        other = self._as_set(other)
+        larger, smaller = (self, other) if len(self) >= len(other) else (other, self)
+        result = self._copy_of(larger)
+        for key in smaller:
+            if not result.discard(key):
+                result.add(key)
+        return result
+
+    def issubset(self, other: Iterable[Any]) -> bool:
+        other = self._as_set(other)
+        return len(self) <= len(other) and all(key in other for key in self)
+
+    def issuperset(self, other: Iterable[Any]) -> bool:
+        return self._as_set(other).issubset(self)
+
+    def isdisjoint(self, other: Iterable[Any]) -> bool:
+        other = self._as_set(other)
+        larger, smaller = (self, other) if len(self) >= len(other) else (other, self)
+        return not any(key in larger for key in smaller)
+
+    @property
+    def size(self) -> int:
+        return len(self._keys)
+
+    def _hash(self, key: Any) -> int:
+        return mix_hash(self._hash_function(key), self._seed)
+
+    def _find(self, full_hash: int, key: Any) -> int:
+        hashes, keys, size = self._hashes, self._keys, len(self._keys)
+        index = full_hash % size
+
+        while True:
+            cur_key = keys[index]
+            if cur_key is _EMPTY:
+                return -1
+            if hashes[index] == full_hash and (cur_key is key or cur_key == key):
+                return index
+
+            index += 1
+            if index == size:
+                index = 0
+
+    def _insert(self, full_hash: int, key: Any) -> tuple[int, bool]:
+        # (ячейка ключа, был ли он добавлен)
+        hashes, keys, size = self._hashes, self._keys, len(self._keys)
+        index = full_hash % size
+        free_index = -1
+
+        while True:
+            cur_key = keys[index]
+            if cur_key is _EMPTY:
+                break
+            if cur_key is _DELETED:
+                if free_index == -1:
+                    free_index = index
+            elif hashes[index] == full_hash and (cur_key is key or cur_key == key):
+                return index, False
+
+            index += 1
+            if index == size:
+                index = 0
+
+        if self.count + 1 + self._tombstones > size * _MAX_LOAD_FACTOR:
+            self._resize(size * 2 if self.count + 1 > size * _TARGET_LOAD_FACTOR else size)
+            return self._insert(full_hash, key)
+
+        if free_index != -1:
+            index = free_index
+            self._tombstones -= 1
+
+        hashes[index] = full_hash
+        keys[index] = key
+        self.count += 1
+        return index, True
+
+    def _remove_at(self, index: int) -> None:
+        self._hashes[index] = None
+        self._keys[index] = _DELETED
+        self.count -= 1
+        self._tombstones += 1
+
+    def _next_slot(self) -> int:
+        # занятая ячейка, начиная с места прошлого pop: освобождённые им ячейки не просматриваются
+        # заново, и опустошение множества повторными pop проходит массив один раз, а не O(n^2)
+        keys, size = self._keys, len(self._keys)
+        index = self._pop_cursor
+
+        while keys[index] is _EMPTY or keys[index] is _DELETED:
+            index += 1
+            if index == size:
+                index = 0
+
+        self._pop_cursor = index
+        return index
+
+    def _slots(self) -> Iterator[int]:
+        for index, key in enumerate(self._keys):
+            if key is not _EMPTY and key is not _DELETED:
+                yield index
+
+    def _reserve(self, count: int) -> None:
+        if count + self._tombstones > self.size * _MAX_LOAD_FACTOR:
+            self._resize(max(ceil(count / _TARGET_LOAD_FACTOR), self.size))
+
+    def _resize(self, size: int) -> list[tuple[int, int]]:
+        # возвращает переезды (старая ячейка, новая ячейка), чтобы наследники могли перенести свои данные
+        old_hashes, old_keys = getattr(self, '_hashes', []), getattr(self, '_keys', [])
+        self._hashes = hashes = [None] * size
+        self._keys = keys = [_EMPTY] * size
+        self._tombstones = 0
+        self._pop_cursor = 0
+        moves = []
+
+        for old_index, (full_hash, key) in enumerate(zip(old_hashes, old_keys)):
+            if key is _EMPTY or key is _DELETED:
+                continue
+            index = full_hash % size
+            while keys[index] is not _EMPTY:
+                index += 1
+                if index == size:
+                    index = 0
+            hashes[index] = full_hash
+            keys[index] = key
+            moves.append((old_index, index))
+
+        return moves
+
+    def _empty_like(self) -> 'HashSet':
+        return type(self)(hash_function=self._hash_function, seed=self._seed)
+
+    def _copy_of(self, other: 'HashSet | set | frozenset') -> 'HashSet':
+        if isinstance(other, HashSet):
+            return other.copy()
+        result = self._empty_like()
+        result.update(other)
+        return result
+
+    def _as_set(self, other: Iterable[Any]) -> 'HashSet':
+        # множества Python и наши отвечают на in и len быстро, остальное собираем в HashSet
+        if isinstance(other, (HashSet, set, frozenset)):
+            return other
+        return type(self)(other, hash_function=self._hash_function, seed=self._seed)
+
+    def __contains__(self, key: Any) -> bool:
+        return self._find(self._hash(key), key) != -1
+
+    def __iter__(self) -> Iterator[Any]:
+        for key in self._keys:
+            if key is not _EMPTY and key is not _DELETED:
+                yield key
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (HashSet, set, frozenset)):
+            return NotImplemented
+        return len(self) == len(other) and all(key in other for key in self)
+
+    def __le__(self, other: Iterable[Any]) -> bool:
+        return self.issubset(other)
+
+    def __ge__(self, other: Iterable[Any]) -> bool:
+        return self.issuperset(other)
+
+    def __or__(self, other: Iterable[Any]) -> 'HashSet':
+        return self.union(other)
+
+    def __and__(self, other: Iterable[Any]) -> 'HashSet':
+        return self.intersection(other)
+
+    def __sub__(self, other: Iterable[Any]) -> 'HashSet':
+        return self.difference(other)
+
+    def __xor__(self, other: Iterable[Any]) -> 'HashSet':
+        return self.symmetric_difference(other)
+
+    def __str__(self) -> str:
+        return "hash_set(" + ", ".join(str(key) for key in self) + ")"
+
+
+if __name__ == "__main__":
+    first = HashSet(["apple", "banana", "orange"])
+    second = HashSet(["banana", "kiwi"])
+
+    first.add("grape")
+    first.discard("orange")
+
+    print(f"Множество: {first}, элементов: {len(first)}")
+    print(f"Есть 'apple'? {'apple' in first}, есть 'orange'? {'orange' in first}")
+    print(f"Объединение: {first | second}")
+    print(f"Пересечение: {first & second}")
+    print(f"Разность: {first - second}")
+    print(f"Симметрическая разность: {first ^ second}")
+    print(f"{{'banana'}} подмножество? {HashSet(['banana']) <= first}")
@@ -0,0 +1,192 @@
+from heapq import nlargest
+from operator import itemgetter
+from typing import Any, Callable, Iterable, Iterator
+
+from SET_STRUCTURES.hash_set.main import HashSet
+
+
+class Multiset(HashSet):
+    # Ячейки HashSet плюс параллельный список кратностей: ни значений, ни кортежей на элемент.
+    # Как и у Counter, len - число различных элементов, total() - число элементов с повторами.
+    def __init__(self, items: Iterable[Any] = (), size: int = 8, hash_function: Callable[[Any], int] = hash,
+                 seed: int | None = None) -> None:
+        self.__total = 0
+        super().__init__(items, size, hash_function, seed)
+
+    def add(self, key: Any, times: int = 1) -> bool:
+        if times < 1:
+            raise ValueError('Times must be positive')
+
+        index, is_new = self._insert(self._hash(key), key)
+        self._counts[index] += times
+        self.__total += times
+        return is_new
+
+    def discard(self, key: Any, times: int = 1) -> bool:
+        if times < 1:
+            raise ValueError('Times must be positive')
+
+        index = self._find(self._hash(key), key)
+        if index == -1:
+            return False
+
+        if self._counts[index] > times:
+            self._counts[index] -= times
+            self.__total -= times
+        else:
+            self._remove_at(index)
+        return True
+
+    def remove(self, key: Any, times: int = 1) -> None:
+        if not self.discard(key, times):
+            raise KeyError(f"Key '{key}' not found")
+
+    def pop(self) -> Any:
+        if not self.count:
+            raise KeyError('pop from an empty multiset')
+        key = self._keys[self._next_slot()]
+        self.discard(key)
+        return key
+
+    def clear(self) -> None:
+        super().clear()
+        self.__total = 0
+
+    def update(self, items: Iterable[Any]) -> None:
+        # словарь (в том числе Counter) задаёт кратности, иначе каждое вхождение считается отдельно
+        if hasattr(items, 'items'):
+            self._reserve(self.count + len(items))
+            for key, times in items.items():
+                if times > 0:
+                    self.add(key, times)
+            return
+        super().update(items)
+
+    def copy(self) -> 'Multiset':
+        result = super().copy()
+        result._counts = self._counts.copy()
+        result.__total = self.__total
+        return result
+
+    def multiplicity(self, key: Any) -> int:
+        index = self._find(self._hash(key), key)
+        return 0 if index == -1 else self._counts[index]
+
+    def total(self) -> int:
+        return self.__total
+
+    def items(self) -> Iterator[tuple[Any, int]]:
+        for index in self._slots():
+            yield self._keys[index], self._counts[index]
+
+    def elements(self) -> Iterator[Any]:
+        for key, times in self.items():
+            for _ in range(times):
+                yield key
+
+    def most_common(self, k: int | None = None) -> list[tuple[Any, int]]:
+        # куча из k элементов: O(n log k) вместо сортировки всех различных элементов
+        if k is None:
+            return sorted(self.items(), key=itemgetter(1), reverse=True)
+        return nlargest(k, self.items(), key=itemgetter(1))
+
+    def union(self, other: Iterable[Any]) -> 'Multiset':
+        # кратность в объединении - максимум из двух
+        other = self._as_set(other)
+        larger, smaller = (self, other) if len(self) >= len(other) else (other, self)
+        result = larger.copy()
+        for key, times in smaller.items():
+            extra = times - result.multiplicity(key)
+            if extra > 0:
+                result.add(key, extra)
+        return result
+
+    def intersection(self, other: Iterable[Any]) -> 'Multiset':
+        # кратность в пересечении - минимум из двух
+        other = self._as_set(other)
+        larger, smaller = (self, other) if len(self) >= len(other) else (other, self)
+        result = self._empty_like()
+        for key, times in smaller.items():
+            times = min(times, larger.multiplicity(key))
+            if times:
+                result.add(key, times)
+        return result
+
+    def difference(self, other: Iterable[Any]) -> 'Multiset':
+        other = self._as_set(other)
+        if len(other) < len(self):
+            result = self.copy()
+            for key, times in other.items():
+                result.discard(key, times)
+            return result
+
+        result = self._empty_like()
+        for key, times in self.items():
+            times -= other.multiplicity(key)
+            if times > 0:
+                result.add(key, times)
+        return result
+
+    def symmetric_difference(self, other: Iterable[Any]) -> 'Multiset':
+        other = self._as_set(other)
+        return self.difference(other).sum(other.difference(self))
+
+    def sum(self, other: Iterable[Any]) -> 'Multiset':
+        other = self._as_set(other)
+        larger, smaller = (self, other) if len(self) >= len(other) else (other, self)
+        result = larger.copy()
+        for key, times in smaller.items():
+            result.add(key, times)
+        return result
+
+    def issubset(self, other: Iterable[Any]) -> bool:
+        other = self._as_set(other)
+        return len(self) <= len(other) and all(times <= other.multiplicity(key) for key, times in self.items())
+
+    def _remove_at(self, index: int) -> None:
+        self.__total -= self._counts[index]
+        self._counts[index] = 0
+        super()._remove_at(index)
+
+    def _resize(self, size: int) -> list[tuple[int, int]]:
+        old_counts = getattr(self, '_counts', [])
+        moves = super()._resize(size)
+        self._counts = counts = [0] * size
+        for old_index, index in moves:
+            counts[index] = old_counts[old_index]
+        return moves
+
+    def _as_set(self, other: Iterable[Any]) -> 'Multiset':
+        if isinstance(other, Multiset):
+            return other
+        return type(self)(other, hash_function=self._hash_function, seed=self._seed)
+
+    def __getitem__(self, key: Any) -> int:
+        return self.multiplicity(key)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Multiset):
+            return NotImplemented
+        return len(self) == len(other) and all(times == other.multiplicity(key) for key, times in self.items())
+
+    def __add__(self, other: Iterable[Any]) -> 'Multiset':
+        return self.sum(other)
+
+    def __str__(self) -> str:
+        return "multiset(" + ", ".join(f"{key}: {times}" for key, times in self.items()) + ")"
+
+
+if __name__ == "__main__":
+    words = Multiset("the cat and the dog and the bird".split())
+
+    print(f"Мультимножество: {words}")
+    print(f"Различных: {len(words)}, всего: {words.total()}, 'the' x{words['the']}")
+    print(f"Два самых частых: {words.most_common(2)}")
+
+    words.remove("the", 2)
+    other = Multiset(["cat", "cat", "fish"])
+    print(f"После удаления двух 'the': {words}")
+    print(f"Объединение: {words | other}")
+    print(f"Пересечение: {words & other}")
+    print(f"Разность: {words - other}")
+    print(f"Сумма: {words + other}")
@@ -0,0 +1,192 @@
+from typing import Any, Callable
+
+from ASSOCIATIVE_STRUCTURES.hash_table.main import HashTable
+from LINEAR_STRUCTERES.linked_list.doubly_linked_list.main import DoublyLinkedList
+
+_MISSING = object()
+
+
+class LFUCache:
+    # Индекс HashTable: ключ -> запись; корзины HashTable: частота -> двусвязный список записей
+    # с этой частотой (в голове - самая давняя). Вытесняется голова корзины с минимальной частотой.
+    class __Entry:
+        def __init__(self, key: Any, value: Any) -> None:
+            self.key = key
+            self.value = value
+            self.frequency = 1
+            self.node = None
+
+        def __repr__(self) -> str:
+            return f'entry({self.key}: {self.value}, x{self.frequency})'
+
+    def __init__(self, max_entries: int = 128, aging_interval: int | None = None, decay: float = 0.5,
+                 on_evict: Callable[[Any, Any], None] | None = None) -> None:
+        if max_entries < 1:
+            raise ValueError('Cache must hold at least one entry')
+        if not 0 < decay < 1:
+            raise ValueError('Decay must be between 0 and 1')
+
+        self.max_entries = max_entries
+        self.aging_interval = aging_interval
+        self.decay = decay
+        self.__on_evict = on_evict
+
+        self.__index = HashTable(16)
+        self.__buckets = HashTable(16)
+        self.__min_frequency = 0
+        self.__operations = 0
+
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        self.__tick()
+
+        entry = self.__index.get(key, _MISSING)
+        if entry is _MISSING:
+            self.misses += 1
+            return default
+
+        self.__touch(entry)
+        self.hits += 1
+        return entry.value
+
+    def peek(self, key: Any, default: Any = None) -> Any:
+        entry = self.__index.get(key, _MISSING)
+        return default if entry is _MISSING else entry.value
+
+    def put(self, key: Any, value: Any) -> None:
+        self.__tick()
+
+        entry = self.__index.get(key, _MISSING)
+        if entry is not _MISSING:
+            entry.value = value
+            self.__touch(entry)
+            return
+
+        if len(self.__index) >= self.max_entries:
+            self.__evict()
+
+        entry = self.__Entry(key, value)
+        self.__link(entry)
+        self.__index.put(key, entry)
+        self.__min_frequency = 1
+
+    def delete(self, key: Any) -> bool:
+        entry = self.__index.get(key, _MISSING)
+        if entry is _MISSING:
+            return False
+
+        self.__unlink(entry)
+        self.__index.delete(key)
+        return True
+
+    def frequency(self, key: Any) -> int:
+        entry = self.__index.get(key, _MISSING)
+        return 0 if entry is _MISSING else entry.frequency
+
+    def age(self) -> None:
+        # старение: частоты всех записей уменьшаются в 1 / decay раз,
+        # так бывшие популярные ключи со временем становятся кандидатами на вытеснение
+        entries = []
+        for frequency in sorted(self.__buckets.keys()):
+            entries.extend(self.__buckets[frequency])
+
+        self.__buckets = HashTable(16)
+        for entry in entries:
+            entry.frequency = max(1, int(entry.frequency * self.decay))
+            self.__link(entry)
+
+        self.__min_frequency = min((entry.frequency for entry in entries), default=0)
+
+    def stats(self) -> dict[str, Any]:
+        requests = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / requests if requests else 0.0,
+            'evictions': self.evictions,
+            'entries': len(self),
+        }
+
+    def __tick(self) -> None:
+        # O(n) старение раз в aging_interval операций: при интервале не меньше размера кэша - O(1) амортизированно
+        if self.aging_interval is None:
+            return
+
+        self.__operations += 1
+        if self.__operations >= self.aging_interval:
+            self.__operations = 0
+            self.age()
+
+    def __touch(self, entry: __Entry) -> None:
+        frequency = entry.frequency
+        self.__unlink(entry)
+        if frequency == self.__min_frequency and frequency not in self.__buckets:
+            self.__min_frequency = frequency + 1
+
+        entry.frequency = frequency + 1
+        self.__link(entry)
+
+    def __link(self, entry: __Entry) -> None:
+        bucket = self.__buckets.get(entry.frequency)
+        if bucket is None:
+            bucket = DoublyLinkedList()
+            self.__buckets.put(entry.frequency, bucket)
+        entry.node = bucket.add_last(entry)
+
+    def __unlink(self, entry: __Entry) -> None:
+        bucket = self.__buckets[entry.frequency]
+        bucket.remove(entry.node)
+        entry.node = None
+        if not len(bucket):
+            self.__buckets.delete(entry.frequency)
+
+    def __evict(self) -> None:
+        bucket = self.__buckets[self.__min_frequency]
+        entry = bucket.remove_fist().value
+        if not len(bucket):
+            self.__buckets.delete(self.__min_frequency)
+
+        self.__index.delete(entry.key)
+        self.evictions += 1
+
+        if self.__on_evict is not None:
+            self.__on_evict(entry.key, entry.value)
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(f"Key '{key}' not found")
+        return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.put(key, value)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self.__index
+
+    def __len__(self) -> int:
+        return len(self.__index)
+
+    def __str__(self) -> str:
+        entries = (entry for frequency in sorted(self.__buckets.keys()) for entry in self.__buckets[frequency])
+        return f'lfu_cache({list(entries)})'
+
+
+if __name__ == "__main__":
+    cache = LFUCache(max_entries=3, on_evict=lambda key, value: print(f"Вытеснен {key}: {value}"))
+
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("c", 3)
+    for _ in range(3):
+        cache.get("a")
+    cache.get("b")
+    cache.put("d", 4)
+
+    print(f"Кэш: {cache}")
+    print(f"Частота a: {cache.frequency('a')}")
+    print(f"Статистика: {cache.stats()}")
+
+    cache.age()
+    print(f"После старения: {cache}")
@@ -0,0 +1,198 @@
+from functools import wraps
+from time import monotonic
+from typing import Any, Callable
+
+from ASSOCIATIVE_STRUCTURES.hash_table.main import HashTable
+from LINEAR_STRUCTERES.linked_list.doubly_linked_list.main import DoublyLinkedList
+
+_MISSING = object()
+_KWARGS_MARK = object()
+
+
+class LRUCache:
+    # Индекс HashTable: ключ -> узел двусвязного списка; список упорядочен по давности обращения,
+    # в голове - самый давно использованный элемент, поэтому все операции O(1)
+    class __Entry:
+        def __init__(self, key: Any, value: Any, weight: float, expires_at: float | None) -> None:
+            self.key = key
+            self.value = value
+            self.weight = weight
+            self.expires_at = expires_at
+
+        def __repr__(self) -> str:
+            return f'entry({self.key}: {self.value})'
+
+    def __init__(self, max_entries: int = 128, max_weight: float | None = None, ttl: float | None = None,
+                 on_evict: Callable[[Any, Any], None] | None = None, clock: Callable[[], float] = monotonic) -> None:
+        if max_entries < 1:
+            raise ValueError('Cache must hold at least one entry')
+
+        self.max_entries = max_entries
+        self.max_weight = max_weight
+        self.ttl = ttl
+        self.__on_evict = on_evict
+        self.__clock = clock
+
+        self.__index = HashTable(16)
+        self.__order = DoublyLinkedList()
+        self.__weight = 0
+
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        node = self.__index.get(key, _MISSING)
+        if node is _MISSING:
+            self.misses += 1
+            return default
+
+        entry = node.value
+        if entry.expires_at is not None and entry.expires_at <= self.__clock():
+            self.__discard(node)
+            self.expirations += 1
+            self.misses += 1
+            return default
+
+        self.__order.move_to_last(node)
+        self.hits += 1
+        return entry.value
+
+    def peek(self, key: Any, default: Any = None) -> Any:
+        # чтение без обновления порядка и статистики
+        node = self.__index.get(key, _MISSING)
+        if node is _MISSING or self.__is_expired(node.value):
+            return default
+        return node.value.value
+
+    def put(self, key: Any, value: Any, weight: float = 1, ttl: float | None = None) -> None:
+        # такой элемент не поместился бы даже в пустой кэш: отказываем до вытеснения остальных
+        if self.max_weight is not None and weight > self.max_weight:
+            raise ValueError(f'Entry weight {weight} exceeds max_weight {self.max_weight}')
+
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = None if ttl is None else self.__clock() + ttl
+
+        node = self.__index.get(key, _MISSING)
+        if node is _MISSING:
+            node = self.__order.add_last(self.__Entry(key, value, weight, expires_at))
+            self.__index.put(key, node)
+        else:
+            entry = node.value
+            self.__weight -= entry.weight
+            entry.value, entry.weight, entry.expires_at = value, weight, expires_at
+            self.__order.move_to_last(node)
+
+        self.__weight += weight
+        self.__evict()
+
+    def delete(self, key: Any) -> bool:
+        node = self.__index.get(key, _MISSING)
+        if node is _MISSING:
+            return False
+
+        self.__order.remove(node)
+        self.__index.delete(key)
+        self.__weight -= node.value.weight
+        return True
+
+    def clear(self) -> None:
+        self.__index = HashTable(16)
+        self.__order = DoublyLinkedList()
+        self.__weight = 0
+
+    def total_weight(self) -> float:
+        return self.__weight
+
+    def stats(self) -> dict[str, Any]:
+        requests = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / requests if requests else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'entries': len(self),
+            'weight': self.__weight,
+        }
+
+    def __is_expired(self, entry: __Entry) -> bool:
+        return entry.expires_at is not None and entry.expires_at <= self.__clock()
+
+    def __evict(self) -> None:
+        while len(self.__index) > self.max_entries or (
+                self.max_weight is not None and self.__weight > self.max_weight and len(self.__index)):
+            self.__discard(self.__order.remove_fist(), unlinked=True)
+            self.evictions += 1
+
+    def __discard(self, node: Any, unlinked: bool = False) -> None:
+        # удаление по решению самого кэша (вытеснение или истёкший TTL) - с вызовом on_evict
+        entry = node.value
+        if not unlinked:
+            self.__order.remove(node)
+        self.__index.delete(entry.key)
+        self.__weight -= entry.weight
+
+        if self.__on_evict is not None:
+            self.__on_evict(entry.key, entry.value)
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(f"Key '{key}' not found")
+        return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.put(key, value)
+
+    def __contains__(self, key: Any) -> bool:
+        return self.peek(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self.__index)
+
+    def __str__(self) -> str:
+        return f'lru_cache({self.__order})'
+
+
+def memoize(max_entries: int = 128, ttl: float | None = None) -> Callable[[Callable], Callable]:
+    def decorator(function: Callable) -> Callable:
+        cache = LRUCache(max_entries=max_entries, ttl=ttl)
+
+        @wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = (args, _KWARGS_MARK, tuple(sorted(kwargs.items()))) if kwargs else args
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = function(*args, **kwargs)
+                cache.put(key, value)
+            return value
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
+if __name__ == "__main__":
+    cache = LRUCache(max_entries=3, on_evict=lambda key, value: print(f"Вытеснен {key}: {value}"))
+
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("c", 3)
+    cache.get("a")
+    cache.put("d", 4)
+
+    print(f"Кэш: {cache}")
+    print(f"b -> {cache.get('b', 'Нет в кэше')}, a -> {cache['a']}")
+    print(f"Статистика: {cache.stats()}")
+
+    weighted = LRUCache(max_entries=100, max_weight=10)
+    weighted.put("small", "x", weight=3)
+    weighted.put("big", "y", weight=8)
+    print(f"Ограничение по весу: {weighted}, вес {weighted.total_weight()}")
+
+    @memoize(max_entries=256)
+    def fibonacci(n: int) -> int:
+        return n if n < 2 else fibonacci(n - 1) + fibonacci(n - 2)
+
+    print(f"fibonacci(100) = {fibonacci(100)}")
+    print(f"Статистика memoize: {fibonacci.cache.stats()}")
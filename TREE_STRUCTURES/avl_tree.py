@@ -1,5 +1,17 @@
+import sys
 from collections import deque
-from typing import Optional, Self
+from pathlib import Path
+from itertools import groupby
+from operator import gt
+from typing import Iterable, Iterator, Optional, Self
+
+if not __package__:
+    # запуск файлом (python TREE_STRUCTURES/avl_tree.py): корень репозитория нужен для абсолютных импортов
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from TREE_STRUCTURES.traversal import (collect_inorder, collect_postorder, collect_preorder, find_bound,
+                                       iter_inorder, iter_level_order, iter_postorder, iter_preorder, iter_range,
+                                       morris_inorder)
 
 
 class TreeNode:
@@ -8,6 +20,7 @@ class TreeNode:
         self.right = None
         self.value = value
         self.height = 1
+        self.size = 1
 
     def __str__(self) -> str:
         return f'TreeNode({self.value})'
@@ -16,8 +29,8 @@ class TreeNode:
 class AVLTree:
     def __init__(self, value: Optional[int | list[int]] = None) -> None:
         self._root = None
+        self._version = 0
         self._create_tree(value)
-        self._current = 0
 
     def __str__(self) -> str:
         if self._root is None:
@@ -26,21 +39,13 @@ class AVLTree:
         return f'AVLTree({result})'
 
     def __len__(self) -> int:
-        result = self._get_items()
-        return len(result)
-
-    def __iter__(self) -> Self:
-        self._current = 0
-        return self
-
-    def __next__(self) -> int:
-        items = self._get_items()
-        if self._current < len(items):
-            cur_value = items[self._current]
-            self._current += 1
-            return cur_value
-        else:
-            raise StopIteration
+        return self._node_size(self._root)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter_inorder(self)
+
+    def __reversed__(self) -> Iterator[int]:
+        return iter_inorder(self, reverse=True)
 
     def _create_tree(self, value: Optional[int | list[int]]) -> None:
         if value is not None:
@@ -53,13 +58,58 @@ class AVLTree:
         self._root = TreeNode(value)
 
     def _create_full_tree(self, value: list[int]) -> None:
-        for number in value:
-            self.append(number)
+        self._root = self._build(self._sorted_unique(sorted(value)))
+
+    @staticmethod
+    def _sorted_unique(values: list[int]) -> list[int]:
+        # дубликаты в AVLTree не хранятся, как и при append
+        return [value for value, _ in groupby(values)]
+
+    def _build(self, values: list[int]) -> Optional[TreeNode]:
+        # середина отрезка - корень, половины - поддеревья: размеры соседних поддеревьев отличаются
+        # не больше чем на 1, поэтому дерево сразу сбалансировано и ни одного поворота не нужно. O(n).
+        # Такое поддерево из k узлов имеет минимальную высоту k.bit_length(), считать её по детям не нужно.
+        def build(low: int, high: int) -> Optional[TreeNode]:
+            if low >= high:
+                return None
+            middle = (low + high) // 2
+            node = TreeNode(values[middle])
+            node.left = build(low, middle)
+            node.right = build(middle + 1, high)
+            node.size = high - low
+            node.height = node.size.bit_length()
+            return node
+
+        return build(0, len(values))
+
+    @classmethod
+    def from_sorted(cls, values: Iterable[int]) -> Self:
+        """Дерево из отсортированных значений за O(n)"""
+        values = list(values)
+        if any(map(gt, values, values[1:])):
+            raise ValueError('Values must be sorted')
+
+        tree = cls()
+        tree._root = tree._build(tree._sorted_unique(values))
+        return tree
+
+    @classmethod
+    def bulk_load(cls, values: Iterable[int]) -> Self:
+        """Дерево из произвольных значений: сортировка за O(n log n) и построение за O(n)"""
+        return cls.from_sorted(sorted(values))
 
     @staticmethod
     def _node_height(node: Optional[TreeNode]) -> int:
         return node.height if node else 0
 
+    @staticmethod
+    def _node_size(node: Optional[TreeNode]) -> int:
+        return node.size if node else 0
+
+    def _update(self, node: TreeNode) -> None:
+        node.height = 1 + max(self._node_height(node.left), self._node_height(node.right))
+        node.size = 1 + self._node_size(node.left) + self._node_size(node.right)
+
     def _get_balance(self, node: Optional[TreeNode]) -> int:
         if not node:
             return 0
@@ -73,8 +123,8 @@ class AVLTree:
         x.right = y
         y.left = t2
 
-        y.height = 1 + max(self._node_height(y.left), self._node_height(y.right))
-        x.height = 1 + max(self._node_height(x.left), self._node_height(x.right))
+        self._update(y)
+        self._update(x)
 
         return x
 
@@ -86,44 +136,145 @@ class AVLTree:
         y.left = x
         x.right = t2
 
-        x.height = 1 + max(self._node_height(x.left), self._node_height(x.right))
-        y.height = 1 + max(self._node_height(y.left), self._node_height(y.right))
+        self._update(x)
+        self._update(y)
 
         return y
 
-    def _append_recursive(self, node: Optional[TreeNode], value: int) -> TreeNode:
-        if node is None:
-            return TreeNode(value)
-
-        if value < node.value:
-            node.left = self._append_recursive(node.left, value)
-        elif value > node.value:
-            node.right = self._append_recursive(node.right, value)
-        else:
-            return node
-
-        node.height = 1 + max(self._node_height(node.left), self._node_height(node.right))
+    def _balance(self, node: TreeNode) -> TreeNode:
+        self._update(node)
 
         balance = self._get_balance(node)
 
-        if balance > 1 and value < node.left.value:
+        if balance > 1 and self._get_balance(node.left) >= 0:
             return self._rotate_right(node)
 
-        if balance < -1 and value > node.right.value:
-            return self._rotate_left(node)
-
-        if balance > 1 and value > node.left.value:
+        if balance > 1 and self._get_balance(node.left) < 0:
             node.left = self._rotate_left(node.left)
             return self._rotate_right(node)
 
-        if balance < -1 and value < node.right.value:
+        if balance < -1 and self._get_balance(node.right) <= 0:
+            return self._rotate_left(node)
+
+        if balance < -1 and self._get_balance(node.right) > 0:
             node.right = self._rotate_right(node.right)
             return self._rotate_left(node)
 
         return node
 
+    def _rebalance_path(self, path: list[TreeNode], delta: int) -> None:
+        # подъём от места изменения к корню; повёрнутое поддерево подвешивается обратно к родителю.
+        # Как только высота поддерева не изменилась, выше балансировать нечего - остаётся поправить размеры
+        for index in range(len(path) - 1, -1, -1):
+            node = path[index]
+            height = node.height
+            new_node = self._balance(node)
+
+            if new_node is not node:
+                if index == 0:
+                    self._root = new_node
+                elif path[index - 1].left is node:
+                    path[index - 1].left = new_node
+                else:
+                    path[index - 1].right = new_node
+
+            if new_node.height == height:
+                for ancestor in path[:index]:
+                    ancestor.size += delta
+                return
+
+    def _join(self, left: Optional[TreeNode], middle: TreeNode, right: Optional[TreeNode]) -> TreeNode:
+        # все значения left < middle < все значения right; middle спускается по краю более высокого
+        # дерева до поддерева сравнимой высоты, после чего край балансируется снизу вверх
+        left_height, right_height = self._node_height(left), self._node_height(right)
+        if abs(left_height - right_height) <= 1:
+            middle.left, middle.right = left, right
+            self._update(middle)
+            return middle
+
+        path = []
+        if left_height > right_height:
+            node = left
+            while self._node_height(node) > right_height + 1:
+                path.append(node)
+                node = node.right
+            middle.left, middle.right = node, right
+            self._update(middle)
+            path[-1].right = middle
+        else:
+            node = right
+            while self._node_height(node) > left_height + 1:
+                path.append(node)
+                node = node.left
+            middle.left, middle.right = left, node
+            self._update(middle)
+            path[-1].left = middle
+
+        for index in range(len(path) - 1, 0, -1):
+            node = path[index]
+            new_node = self._balance(node)
+            if path[index - 1].left is node:
+                path[index - 1].left = new_node
+            else:
+                path[index - 1].right = new_node
+        return self._balance(path[0])
+
+    def _split(self, node: Optional[TreeNode], value: int) -> tuple[Optional[TreeNode], Optional[TreeNode]]:
+        # (значения < value, значения >= value): куски по сторонам пути поиска склеиваются снизу вверх,
+        # сумма разностей высот при склейках - O(log n)
+        path = []
+        while node is not None:
+            path.append(node)
+            node = node.right if node.value < value else node.left
+
+        left = right = None
+        for node in reversed(path):
+            if node.value < value:
+                left = self._join(node.left, node, left)
+            else:
+                right = self._join(right, node, node.right)
+        return left, right
+
+    def _join_trees(self, left: Optional[TreeNode], right: Optional[TreeNode]) -> Optional[TreeNode]:
+        if left is None or right is None:
+            return right if left is None else left
+
+        # минимум правого дерева становится связующим узлом
+        path = []
+        node = right
+        while node.left is not None:
+            path.append(node)
+            node = node.left
+
+        if not path:
+            return self._join(left, node, node.right)
+
+        path[-1].left = node.right
+        for index in range(len(path) - 1, 0, -1):
+            child = path[index]
+            path[index - 1].left = self._balance(child)
+        return self._join(left, node, self._balance(path[0]))
+
     def append(self, value: int) -> None:
-        self._root = self._append_recursive(self._root, value)
+        path = []
+        node = self._root
+        while node is not None:
+            if value == node.value:
+                return
+            path.append(node)
+            node = node.left if value < node.value else node.right
+
+        # версия меняется, только когда узел действительно добавляется или удаляется
+        self._version += 1
+        if not path:
+            self._root = TreeNode(value)
+            return
+
+        if value < path[-1].value:
+            path[-1].left = TreeNode(value)
+        else:
+            path[-1].right = TreeNode(value)
+        self._rebalance_path(path, 1)
 
     def _get_items(self) -> list[int]:
         if self._root is None:
@@ -139,92 +290,35 @@ class AVLTree:
                 queue.append(node.right)
         return result
 
-    def _preorder_recursive(self, node: TreeNode, result: list[int]) -> list[int]:
-        if not node:
-            return result
-        result.append(node.value)
-        if node.left:
-            result = self._preorder_recursive(node.left, result)
-        if node.right:
-            result = self._preorder_recursive(node.right, result)
-        return result
-
-    def _inorder_recursive(self, node: TreeNode, result: list[int]) -> list[int]:
-        if not node:
-            return result
-        if node.left is not None:
-            result = self._inorder_recursive(node.left, result)
-        result.append(node.value)
-        if node.right is not None:
-            result = self._inorder_recursive(node.right, result)
-        return result
-
-    def _postorder_recursive(self, node: TreeNode, result: list[int]) -> list[int]:
-        if not node:
-            return result
-        if node.left is not None:
-            result = self._postorder_recursive(node.left, result)
-        if node.right is not None:
-            result = self._postorder_recursive(node.right, result)
-        result.append(node.value)
-        return result
-
-    @staticmethod
-    def _get_min_value_node(node: TreeNode) -> TreeNode:
-        current = node
-        while current.left is not None:
-            current = current.left
-        return current
+    def delete(self, value: int) -> None:
+        path = []
+        node = self._root
+        while node is not None and node.value != value:
+            path.append(node)
+            node = node.left if value < node.value else node.right
 
-    def _delete_recursive(self, node: Optional[TreeNode], value: int) -> Optional[TreeNode]:
         if node is None:
-            return node
-
-        if value < node.value:
-            node.left = self._delete_recursive(node.left, value)
-        elif value > node.value:
-            node.right = self._delete_recursive(node.right, value)
+            return
+
+        self._version += 1
+        if node.left is not None and node.right is not None:
+            # значение заменяется минимальным из правого поддерева, удаляется узел минимума
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.value = successor.value
+            node = successor
+
+        child = node.left if node.left is not None else node.right
+        if not path:
+            self._root = child
+        elif path[-1].left is node:
+            path[-1].left = child
         else:
-            if node.left is None:
-                temp = node.right
-                node = None
-                return temp
-            elif node.right is None:
-                temp = node.left
-                node = None
-                return temp
-
-            temp = self._get_min_value_node(node.right)
-
-            node.value = temp.value
-
-            node.right = self._delete_recursive(node.right, temp.value)
-
-        if node is None:
-            return node
-
-        node.height = 1 + max(self._node_height(node.left), self._node_height(node.right))
-
-        balance = self._get_balance(node)
-
-        if balance > 1 and self._get_balance(node.left) >= 0:
-            return self._rotate_right(node)
-
-        if balance > 1 and self._get_balance(node.left) < 0:
-            node.left = self._rotate_left(node.left)
-            return self._rotate_right(node)
-
-        if balance < -1 and self._get_balance(node.right) <= 0:
-            return self._rotate_left(node)
-
-        if balance < -1 and self._get_balance(node.right) > 0:
-            node.right = self._rotate_right(node.right)
-            return self._rotate_left(node)
-
-        return node
-
-    def delete(self, value: int) -> None:
-        self._root = self._delete_recursive(self._root, value)
+            path[-1].right = child
+        self._rebalance_path(path, -1)
 
     def search(self, value: int) -> TreeNode:
         cur_node = self._root
@@ -238,18 +332,105 @@ class AVLTree:
     def height(self) -> int:
         return self._node_height(self._root)
 
+    def rank(self, value: int) -> int:
+        """Количество элементов меньше value"""
+        result = 0
+        node = self._root
+        while node is not None:
+            if value <= node.value:
+                node = node.left
+            else:
+                result += self._node_size(node.left) + 1
+                node = node.right
+        return result
+
+    def select(self, index: int) -> int:
+        """Элемент с индексом index в отсортированном порядке"""
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("Index out of range")
+
+        node = self._root
+        while True:
+            left_size = self._node_size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index == left_size:
+                return node.value
+            else:
+                index -= left_size + 1
+                node = node.right
+
+    def count_range(self, low: int, high: int) -> int:
+        """Количество элементов в полуинтервале [low, high)"""
+        return max(self.rank(high) - self.rank(low), 0)
+
+    def median(self) -> float:
+        count = len(self)
+        if not count:
+            raise ValueError('Cannot find median of empty tree')
+        if count % 2:
+            return self.select(count // 2)
+        return (self.select(count // 2 - 1) + self.select(count // 2)) / 2
+
+    def irange(self, low: Optional[int] = None, high: Optional[int] = None, reverse: bool = False) -> Iterator[int]:
+        """Ленивый обход значений из [low, high)"""
+        return iter_range(self, low, high, reverse)
+
+    def floor(self, value: int) -> Optional[int]:
+        """Наибольшее значение <= value"""
+        node, _ = find_bound(self._root, value, below=True, inclusive=True)
+        return node.value if node else None
+
+    def ceiling(self, value: int) -> Optional[int]:
+        """Наименьшее значение >= value"""
+        node, _ = find_bound(self._root, value, below=False, inclusive=True)
+        return node.value if node else None
+
+    def lower(self, value: int) -> Optional[int]:
+        """Наибольшее значение < value"""
+        node, _ = find_bound(self._root, value, below=True, inclusive=False)
+        return node.value if node else None
+
+    def higher(self, value: int) -> Optional[int]:
+        """Наименьшее значение > value"""
+        node, _ = find_bound(self._root, value, below=False, inclusive=False)
+        return node.value if node else None
+
+    def delete_range(self, low: Optional[int] = None, high: Optional[int] = None) -> int:
+        """Удаляет значения из [low, high) за O(log n): дерево разрезается по границам и склеивается без середины"""
+        self._version += 1
+        left, rest = (None, self._root) if low is None else self._split(self._root, low)
+        middle, right = (rest, None) if high is None else self._split(rest, high)
+        self._root = self._join_trees(left, right)
+        return self._node_size(middle)
+
     def preorder(self) -> list[int]:
-        return self._preorder_recursive(self._root, [])
+        return collect_preorder(self._root)
 
-    def inorder(self) -> list[int]:
-        return self._inorder_recursive(self._root, [])
+    def inorder(self, morris: bool = False) -> list[int]:
+        return morris_inorder(self._root) if morris else collect_inorder(self._root)
 
     def postorder(self) -> list[int]:
-        return self._postorder_recursive(self._root, [])
+        return collect_postorder(self._root)
 
     def level_order(self) -> list[int]:
         return self._get_items()
 
+    def iter_preorder(self, mirror: bool = False) -> Iterator[int]:
+        return iter_preorder(self, mirror)
+
+    def iter_inorder(self, reverse: bool = False) -> Iterator[int]:
+        return iter_inorder(self, reverse)
+
+    def iter_postorder(self, mirror: bool = False) -> Iterator[int]:
+        return iter_postorder(self, mirror)
+
+    def iter_level_order(self, mirror: bool = False) -> Iterator[int]:
+        return iter_level_order(self, mirror)
+
 
 if __name__ == "__main__":
     avl_tree = AVLTree([10, 8, 7, 6, 5])
@@ -263,6 +444,10 @@ if __name__ == "__main__":
     print(avl_tree)
 
     print(f'HEIGHT of tree:\t {avl_tree.height()}')
+    print(f'IRANGE [6, 10):\t {list(avl_tree.irange(6, 10))}, FLOOR(9):\t {avl_tree.floor(9)}, '
+          f'HIGHER(8):\t {avl_tree.higher(8)}')
+    print(f'SIZE:\t {len(avl_tree)}, RANK(9):\t {avl_tree.rank(9)}, SELECT(0):\t {avl_tree.select(0)}, '
+          f'COUNT [6, 10):\t {avl_tree.count_range(6, 10)}, MEDIAN:\t {avl_tree.median()}')
 
     print(f'PREORDER TRAVERSAL:\t {avl_tree.preorder()}')
     print(f'INORDER TRAVERSAL:\t {avl_tree.inorder()}')
@@ -0,0 +1,122 @@
+import gc
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from random import Random
+from time import perf_counter
+
+if not __package__:
+    # запуск файлом (python TREE_STRUCTURES/benchmark.py): корень репозитория нужен для абсолютных импортов
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ASSOCIATIVE_STRUCTURES.Tree.avl_tree.main import AVLTree as SetAVLTree
+from ASSOCIATIVE_STRUCTURES.Tree.red_black_tree.main import RedBlackTree
+from TREE_STRUCTURES.avl_tree import AVLTree, TreeNode
+from TREE_STRUCTURES.binary_search_tree import BinarySearchTree
+
+SIZES = (125_000, 250_000, 500_000, 1_000_000)
+# прежний __next__ строил полный список обходом в ширину на каждом шаге - только небольшие размеры
+OLD_SIZES = (1_000, 2_000, 4_000)
+WALKS = ('iter_inorder', 'iter_preorder', 'iter_postorder', 'iter_level_order', '__reversed__')
+UPDATES = 200_000
+# вставка возрастающих ключей в несбалансированное дерево даёт глубину, равную числу ключей
+DEGENERATE = 5_000
+
+
+def balanced_tree(count: int) -> AVLTree:
+    return AVLTree.from_sorted(range(count))
+
+
+def per_node(count: int, walk) -> float:
+    start = perf_counter()
+    for _ in walk():
+        pass
+    return (perf_counter() - start) / count * 1e9
+
+
+def recursive_inorder(node: TreeNode | None, result: list[int]) -> list[int]:
+    # прежний рекурсивный обход - для сравнения
+    if node is not None:
+        recursive_inorder(node.left, result)
+        result.append(node.value)
+        recursive_inorder(node.right, result)
+    return result
+
+
+def seconds(action) -> float:
+    start = perf_counter()
+    action()
+    return perf_counter() - start
+
+
+def updates(tree, insert, delete, keys: list[int]) -> tuple[float, float]:
+    return (seconds(lambda: [insert(tree, key) for key in keys]),
+            seconds(lambda: [delete(tree, key) for key in keys]))
+
+
+@contextmanager
+def paused_gc():
+    # глобальное состояние сборщика мусора решает вызывающий код, а не конструктор дерева:
+    # при крупном построении проходы сборщика по растущему поколению занимают заметную долю времени
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def without_gc(action):
+    def run():
+        with paused_gc():
+            action()
+    return run
+
+
+def old_per_node(tree: AVLTree, count: int) -> float:
+    start = perf_counter()
+    for index in range(count):
+        tree._get_items()[index]
+    return (perf_counter() - start) / count * 1e9
+
+
+if __name__ == "__main__":
+    print(f"{'узлов':>10}" + "".join(f"{walk.strip('_').removeprefix('iter_'):>16}" for walk in WALKS) + "   (нс на узел)")
+    for count in SIZES:
+        tree = balanced_tree(count)
+        columns = [f"{per_node(count, getattr(tree, walk)):>16.0f}" for walk in WALKS]
+        print(f"{count:>10}" + "".join(columns))
+
+    print("\nпрежний __next__ (полный обход в ширину на каждом шаге):")
+    for count in OLD_SIZES:
+        print(f"{count:>10}{old_per_node(balanced_tree(count), count):>16.0f} нс на узел")
+
+    tree = balanced_tree(SIZES[-1])
+    print(f"\ninorder() на {SIZES[-1]} узлах, с:")
+    print(f"{'рекурсия':>24}{seconds(lambda: recursive_inorder(tree._root, [])):>10.3f}")
+    print(f"{'стек':>24}{seconds(tree.inorder):>10.3f}")
+    print(f"{'Morris, O(1) памяти':>24}{seconds(lambda: tree.inorder(morris=True)):>10.3f}")
+
+    keys = Random(1).sample(range(UPDATES * 10), UPDATES)
+    print(f"\n{UPDATES} случайных ключей, с:{'вставка':>12}{'удаление':>12}")
+    for name, tree, insert, delete in (("AVLTree", AVLTree(), AVLTree.append, AVLTree.delete),
+                                       ("ASSOCIATIVE AVLTree", SetAVLTree(), SetAVLTree.insert, SetAVLTree.delete)):
+        print(f"{name:>24}" + "".join(f"{value:>12.3f}" for value in updates(tree, insert, delete, keys)))
+
+    degenerate = BinarySearchTree()
+    elapsed = seconds(lambda: [degenerate.append(key) for key in range(DEGENERATE)])
+    print(f"\n{DEGENERATE} возрастающих ключей в BinarySearchTree: {elapsed:.2f} с, высота {degenerate.height()}")
+
+    ordered = sorted(keys)
+    print(f"\nпостроение из {UPDATES} ключей, с:{'по одному':>12}{'bulk_load':>12}{'from_sorted':>12}"
+          f"{'без GC':>12}")
+    for name, cls, insert in (("AVLTree", AVLTree, AVLTree.append),
+                              ("ASSOCIATIVE AVLTree", SetAVLTree, SetAVLTree.insert),
+                              ("RedBlackTree", RedBlackTree, RedBlackTree.insert)):
+        tree = cls()
+        timings = (seconds(lambda: [insert(tree, key) for key in keys]),
+                   seconds(lambda: cls.bulk_load(keys)),
+                   seconds(lambda: cls.from_sorted(ordered)),
+                   seconds(without_gc(lambda: cls.from_sorted(ordered))))
+        print(f"{name:>24}" + "".join(f"{value:>12.3f}" for value in timings))
@@ -1,7 +1,17 @@
+import sys
 from collections import deque
-from typing import Optional, Self
+from pathlib import Path
+from typing import Iterator, Optional
 from multipledispatch import dispatch
 
+if not __package__:
+    # запуск файлом (python TREE_STRUCTURES/binary_search_tree.py): корень репозитория нужен для абсолютных импортов
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from TREE_STRUCTURES.traversal import (collect_inorder, collect_postorder, collect_preorder, find_bound,
+                                       iter_inorder, iter_level_order, iter_postorder, iter_preorder, iter_range,
+                                       morris_inorder, subtree_height)
+
 
 class TreeNode:
     def __init__(self, value: int) -> None:
@@ -16,8 +26,9 @@ class TreeNode:
 class BinarySearchTree:
     def __init__(self, value: Optional[int | list[int]] = None) -> None:
         self._root = None
+        self._version = 0
+        self._count = 0
         self._create_root(value)
-        self._current = 0
 
     def __str__(self) -> str:
         if self._root is None:
@@ -27,23 +38,18 @@ class BinarySearchTree:
 
         return f'BinarySearchTree({result})'
 
-    def __iter__(self) -> Self:
-        self._current = 0
-        return self
+    def __iter__(self) -> Iterator[int]:
+        return iter_inorder(self)
 
-    def __next__(self) -> int:
-        items = self._get_items()
-        if self._current < len(items):
-            cur_value = items[self._current]
-            self._current += 1
-            return cur_value
-        else:
-            raise StopIteration
+    def __reversed__(self) -> Iterator[int]:
+        return iter_inorder(self, reverse=True)
 
     def __len__(self) -> int:
         return self.size()
 
     def _get_items(self) -> list[int]:
+        if self._root is None:
+            return []
         result = []
         queue = deque([self._root])
 
@@ -58,28 +64,27 @@ class BinarySearchTree:
 
         return result
 
-    def _add_recursive(self, node: TreeNode, value: int) -> None:
-        if value < node.value:
-            if node.left is None:
-                node.left = TreeNode(value)
-            else:
-                self._add_recursive(node.left, value)
-        else:
-            if node.right is None:
-                node.right = TreeNode(value)
+    def _add(self, node: TreeNode, value: int) -> None:
+        while True:
+            if value < node.value:
+                if node.left is None:
+                    node.left = TreeNode(value)
+                    return
+                node = node.left
             else:
-                self._add_recursive(node.right, value)
+                if node.right is None:
+                    node.right = TreeNode(value)
+                    return
+                node = node.right
 
     def _create_root(self, value: Optional[int | list[int]]) -> None:
         if value is None:
             return
 
         if type(value) == int:
-            self._root = TreeNode(value)
-            return
+            value = [value]
 
-        self._root = TreeNode(value[0])
-        for cur_value in value[1:]:
+        for cur_value in value:
             self.append(cur_value)
 
     @staticmethod
@@ -100,6 +105,48 @@ class BinarySearchTree:
 
         return current
 
+    @staticmethod
+    def _split(node: Optional[TreeNode], value: int) -> tuple[Optional[TreeNode], Optional[TreeNode]]:
+        # (значения < value, значения >= value) за один проход по пути поиска: узлы пути
+        # вместе с поддеревьями по нужную сторону подвешиваются к краю своей половины
+        left_root = right_root = None
+        left_tail = right_tail = None
+
+        while node is not None:
+            if node.value < value:
+                if left_tail is None:
+                    left_root = node
+                else:
+                    left_tail.right = node
+                left_tail = node
+                node = node.right
+            else:
+                if right_tail is None:
+                    right_root = node
+                else:
+                    right_tail.left = node
+                right_tail = node
+                node = node.left
+
+        if left_tail is not None:
+            left_tail.right = None
+        if right_tail is not None:
+            right_tail.left = None
+        return left_root, right_root
+
+    @staticmethod
+    def _count_nodes(node: Optional[TreeNode]) -> int:
+        count = 0
+        stack = [node] if node is not None else []
+        while stack:
+            node = stack.pop()
+            count += 1
+            if node.left is not None:
+                stack.append(node.left)
+            if node.right is not None:
+                stack.append(node.right)
+        return count
+
     def _fined(self, value: int) -> tuple[TreeNode, TreeNode]:
         parent = None
         current = self._root
@@ -114,52 +161,6 @@ class BinarySearchTree:
 
         return parent, current
 
-    def _recursive_size(self, node: TreeNode, level: int) -> int:
-        if node.left is None and node.right is None:
-            return level
-
-        left_size = 0
-        right_size = 0
-
-        if node.left:
-            left_size = self._recursive_size(node.left, level + 1)
-        if node.right:
-            right_size = self._recursive_size(node.right, level + 1)
-
-        return max(left_size, right_size)
-
-    def _preorder_recursive(self, node: TreeNode, result: list[int]) -> list[int]:
-        result.append(node.value)
-
-        if node.left:
-            result = self._preorder_recursive(node.left, result)
-        if node.right:
-            result = self._preorder_recursive(node.right, result)
-
-        return result
-
-    def _inorder_recursive(self, node: TreeNode, result: list[int]) -> list[int]:
-        if node.left is not None:
-            result = self._inorder_recursive(node.left, result)
-
-        result.append(node.value)
-
-        if node.right is not None:
-            result = self._inorder_recursive(node.right, result)
-
-        return result
-
-    def _postorder_recursive(self, node: TreeNode, result: list[int]) -> list[int]:
-
-        if node.left is not None:
-            result = self._postorder_recursive(node.left, result)
-        if node.right is not None:
-            result = self._postorder_recursive(node.right, result)
-
-        result.append(node.value)
-
-        return result
-
     def min(self) -> int:
         node = self._find_min(self._root)
         return node.value
@@ -169,14 +170,26 @@ class BinarySearchTree:
         return node.value
 
     def append(self, value: int) -> None:
+        self._version += 1
+        self._count += 1
         if self._root is None:
             self._root = TreeNode(value)
         else:
-            self._add_recursive(self._root, value)
+            self._add(self._root, value)
 
     def delete(self, value: int) -> None:
-        if self._root.value == value:
-            self._root = None
+        # счётчики меняются только после того, как узел найден и отцеплен
+        self._unlink(value)
+        self._version += 1
+        self._count -= 1
+
+    def _unlink(self, value: int) -> None:
+        root = self._root
+        if root.value == value:
+            # левое поддерево подвешивается к минимуму правого, как и для внутренних узлов
+            if root.left is not None and root.right is not None:
+                self._find_min(root.right).left = root.left
+            self._root = root.right if root.right is not None else root.left
             return
 
         parent_node, cur_node = self._fined(value)
@@ -222,17 +235,16 @@ class BinarySearchTree:
                 parent_node.left = cur_node.left
 
     def size(self) -> int:
-        items = self._get_items()
-        return len(items)
+        return self._count
 
     def height(self) -> int:
         if self.is_empty():
             return 0
 
-        return self._recursive_size(self._root, 1)
+        return subtree_height(self._root)
 
     def depth(self, node) -> int:
-        return self._recursive_size(node, 1)
+        return subtree_height(node)
 
     def is_empty(self) -> bool:
         if self._root is None:
@@ -256,17 +268,64 @@ class BinarySearchTree:
         return current
 
     def preorder(self) -> list[int]:
-        return self._preorder_recursive(self._root, [])
+        return collect_preorder(self._root)
 
-    def inorder(self) -> list[int]:
-        return self._inorder_recursive(self._root, [])
+    def inorder(self, morris: bool = False) -> list[int]:
+        return morris_inorder(self._root) if morris else collect_inorder(self._root)
 
     def postorder(self) -> list[int]:
-        return self._postorder_recursive(self._root, [])
+        return collect_postorder(self._root)
 
     def level_order(self) -> list[int]:
         return self._get_items()
 
+    def irange(self, low: Optional[int] = None, high: Optional[int] = None, reverse: bool = False) -> Iterator[int]:
+        return iter_range(self, low, high, reverse)
+
+    def floor(self, value: int) -> Optional[int]:
+        node, _ = find_bound(self._root, value, below=True, inclusive=True)
+        return node.value if node else None
+
+    def ceiling(self, value: int) -> Optional[int]:
+        node, _ = find_bound(self._root, value, below=False, inclusive=True)
+        return node.value if node else None
+
+    def lower(self, value: int) -> Optional[int]:
+        node, _ = find_bound(self._root, value, below=True, inclusive=False)
+        return node.value if node else None
+
+    def higher(self, value: int) -> Optional[int]:
+        node, _ = find_bound(self._root, value, below=False, inclusive=False)
+        return node.value if node else None
+
+    def delete_range(self, low: Optional[int] = None, high: Optional[int] = None) -> int:
+        # разрез по двум границам и склейка крайних частей: O(высоты) плюс подсчёт удалённых узлов
+        self._version += 1
+        left, rest = (None, self._root) if low is None else self._split(self._root, low)
+        middle, right = (rest, None) if high is None else self._split(rest, high)
+
+        if left is None:
+            self._root = right
+        else:
+            self._find_max(left).right = right
+            self._root = left
+
+        removed = self._count_nodes(middle)
+        self._count -= removed
+        return removed
+
+    def iter_preorder(self, mirror: bool = False) -> Iterator[int]:
+        return iter_preorder(self, mirror)
+
+    def iter_inorder(self, reverse: bool = False) -> Iterator[int]:
+        return iter_inorder(self, reverse)
+
+    def iter_postorder(self, mirror: bool = False) -> Iterator[int]:
+        return iter_postorder(self, mirror)
+
+    def iter_level_order(self, mirror: bool = False) -> Iterator[int]:
+        return iter_level_order(self, mirror)
+
 
 if __name__ == "__main__":
     tree = BinarySearchTree([2, 1, 6, 4, 3, 8, 7, 5, 10, 20, 25])
@@ -294,3 +353,5 @@ if __name__ == "__main__":
     print(f'inorder - {tree.inorder()}')
     print(f'postorder - {tree.postorder()}')
     print(f'level_order - {tree.level_order()}')
+    print(f'irange(4, 10) - {list(tree.irange(4, 10))}, floor(9) - {tree.floor(9)}, ceiling(9) - {tree.ceiling(9)}')
+    print(f'delete_range(5, 20) удалил {tree.delete_range(5, 20)} - {tree.inorder()}')
@@ -1,8 +1,18 @@
+import sys
 from collections import deque
-from typing import Optional, Self
+from pathlib import Path
+from typing import Iterator, Optional
 from multipledispatch import dispatch
 from math import log2, floor
 
+if not __package__:
+    # запуск файлом (python TREE_STRUCTURES/binary_tree.py): корень репозитория нужен для абсолютных импортов
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from TREE_STRUCTURES.traversal import (collect_inorder, collect_postorder, collect_preorder, iter_inorder,
+                                       iter_level_order, iter_level_order_backward, iter_postorder, iter_preorder,
+                                       morris_inorder, subtree_height)
+
 
 class TreeNode:
     def __init__(self, value: int) -> None:
@@ -17,8 +27,9 @@ class TreeNode:
 class BinaryTree:
     def __init__(self, value: Optional[int | list[int]] = None) -> None:
         self._root = None
+        self._version = 0
+        self._count = 0
         self._create_root(value)
-        self._current = 0
 
     def __str__(self) -> str:
         if self._root is None:
@@ -31,29 +42,20 @@ class BinaryTree:
     def __len__(self) -> int:
         return self.size()
 
-    def __iter__(self) -> Self:
-        self._current = 0
-        return self
+    def __iter__(self) -> Iterator[int]:
+        return iter_level_order(self)
 
-    def __next__(self) -> int:
-        items = self._get_items(self._root)
-        if self._current < len(items):
-            cur_value = items[self._current]
-            self._current += 1
-            return cur_value
-        else:
-            raise StopIteration
+    def __reversed__(self) -> Iterator[int]:
+        return iter_level_order_backward(self)
 
     def _create_root(self, value: Optional[int | list[int]]) -> None:
         if value is None:
             return
 
         if type(value) == int:
-            self._root = TreeNode(value)
-            return
+            value = [value]
 
-        self._root = TreeNode(value[0])
-        for cur_value in value[1:]:
+        for cur_value in value:
             self.append(cur_value)
 
     def _get_node_to_add(self) -> TreeNode:
@@ -72,7 +74,9 @@ class BinaryTree:
         return (node.left is None) ^ (node.right is None)
 
     @staticmethod
-    def _get_items(node: TreeNode) -> list[int]:
+    def _get_items(node: Optional[TreeNode]) -> list[int]:
+        if node is None:
+            return []
         result = []
         queue = deque([node])
 
@@ -87,61 +91,15 @@ class BinaryTree:
 
         return result
 
-    def _recursive_size(self, node: TreeNode, level: int) -> int:
-        if node.left is None and node.right is None:
-            return level
-
-        left_size = 0
-        right_size = 0
-
-        if node.left:
-            left_size = self._recursive_size(node.left, level + 1)
-        if node.right:
-            right_size = self._recursive_size(node.right, level + 1)
-
-        return max(left_size, right_size)
-
-    def _preorder_recursive(self, node: TreeNode, result: list[int]) -> list[int]:
-        result.append(node.value)
-
-        if node.left:
-            result = self._preorder_recursive(node.left, result)
-        if node.right:
-            result = self._preorder_recursive(node.right, result)
-
-        return result
-
-    def _inorder_recursive(self, node: TreeNode, result: list[int]) -> list[int]:
-        if node.left is not None:
-            result = self._inorder_recursive(node.left, result)
-
-        result.append(node.value)
-
-        if node.right is not None:
-            result = self._inorder_recursive(node.right, result)
-
-        return result
-
-    def _postorder_recursive(self, node: TreeNode, result: list[int]) -> list[int]:
-
-        if node.left is not None:
-            result = self._postorder_recursive(node.left, result)
-        if node.right is not None:
-            result = self._postorder_recursive(node.right, result)
-
-        result.append(node.value)
-
-        return result
-
     def _fined(self, value: int) -> tuple[TreeNode, TreeNode]:
         queue = deque([self._root])
 
         while queue:
             node = queue.popleft()
 
-            if node.left.value == value:
+            if node.left is not None and node.left.value == value:
                 return node, node.left
-            if node.right.value == value:
+            if node.right is not None and node.right.value == value:
                 return node, node.right
 
             if node.left:
@@ -156,6 +114,8 @@ class BinaryTree:
         return max(self._get_items(self._root))
 
     def append(self, value: int) -> None:
+        self._version += 1
+        self._count += 1
         if self._root is None:
             self._root = TreeNode(value)
             return
@@ -168,26 +128,41 @@ class BinaryTree:
 
     def delete(self, value: int) -> None:
         if self._root.value == value:
+            # остальные элементы добавляются заново, как при удалении узла с двумя детьми
+            self._version += 1
+            items = self._get_items(self._root)
             self._root = None
+            self._count = 0
+            for item in items[1:]:
+                self.append(item)
             return
 
         parent, node = self._fined(value)
 
+        self._version += 1
+        self._count -= 1
         if self.is_leaf(node):
-            if parent.left.value == node.value:
+            if parent.left is node:
                 parent.left = None
             else:
                 parent.right = None
             return
 
         if self._has_one_child(node):
-            parent.left = node.left
+            # единственный ребёнок встаёт на место node с той же стороны родителя
+            child = node.left if node.left is not None else node.right
+            if parent.left is node:
+                parent.left = child
+            else:
+                parent.right = child
             return
 
         if node.left is not None and node.right is not None:
             items = self._get_items(node)
+            # поддерево отрезается целиком (сам node уже вычтен), остальные его элементы добавляются заново
+            self._count -= len(items) - 1
 
-            if parent.left.value == node.value:
+            if parent.left is node:
                 parent.left = None
             else:
                 parent.right = None
@@ -198,15 +173,15 @@ class BinaryTree:
             return
 
     def size(self) -> int:
-        items = self._get_items(self._root)
-        return len(items)
+        return self._count
 
     def height(self) -> int:
-        size = self.size()
-        return floor(log2(size)) + 1
+        if not self._count:
+            return 0
+        return floor(log2(self._count)) + 1
 
     def depth(self, node: TreeNode) -> int:
-        return self._recursive_size(node, 1)
+        return subtree_height(node)
 
     def is_empty(self) -> bool:
         return self._root is None
@@ -225,17 +200,29 @@ class BinaryTree:
         return node
 
     def preorder(self) -> list[int]:
-        return self._preorder_recursive(self._root, [])
+        return collect_preorder(self._root)
 
-    def inorder(self) -> list[int]:
-        return self._inorder_recursive(self._root, [])
+    def inorder(self, morris: bool = False) -> list[int]:
+        return morris_inorder(self._root) if morris else collect_inorder(self._root)
 
     def postorder(self) -> list[int]:
-        return self._postorder_recursive(self._root, [])
+        return collect_postorder(self._root)
 
     def level_order(self) -> list[int]:
         return self._get_items(self._root)
 
+    def iter_preorder(self, mirror: bool = False) -> Iterator[int]:
+        return iter_preorder(self, mirror)
+
+    def iter_inorder(self, reverse: bool = False) -> Iterator[int]:
+        return iter_inorder(self, reverse)
+
+    def iter_postorder(self, mirror: bool = False) -> Iterator[int]:
+        return iter_postorder(self, mirror)
+
+    def iter_level_order(self, mirror: bool = False) -> Iterator[int]:
+        return iter_level_order(self, mirror)
+
 
 if __name__ == "__main__":
     tree = BinaryTree([1, 2, 3, 4, 5, 6, 7, 8, 9])
@@ -263,3 +250,11 @@ if __name__ == "__main__":
     print(f'inorder - {tree.inorder()}')
     print(f'postorder - {tree.postorder()}')
     print(f'level_order - {tree.level_order()}')
+
+    # удаление узла с одним ребёнком сохраняет этого ребёнка и не расходится с len()
+    tree = BinaryTree([1, 2, 3, 4, 5])
+    tree.delete(4)
+    tree.delete(2)
+    assert list(tree) == [1, 5, 3] and len(tree) == 3, (list(tree), len(tree))
+    tree.delete(5)
+    assert list(tree) == [1, 3] and len(tree) == 2, (list(tree), len(tree))
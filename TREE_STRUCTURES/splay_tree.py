@@ -1,5 +1,14 @@
+import sys
 from collections import deque
-from typing import Self, Optional
+from pathlib import Path
+from typing import Iterator, Optional
+
+if not __package__:
+    # запуск файлом (python TREE_STRUCTURES/splay_tree.py): корень репозитория нужен для абсолютных импортов
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from TREE_STRUCTURES.traversal import (find_bound, iter_inorder, iter_level_order, iter_postorder, iter_preorder,
+                                       iter_range)
 
 
 class TreeNode:
@@ -16,6 +25,7 @@ class TreeNode:
 class SplayTree:
     def __init__(self, value: Optional[int | list[int]] = None) -> None:
         self._root = None
+        self._version = 0
 
         if value:
             self._create_tree(value)
@@ -30,18 +40,11 @@ class SplayTree:
         result = self._get_items()
         return len(result)
 
-    def __iter__(self) -> Self:
-        self._current = 0
-        return self
+    def __iter__(self) -> Iterator[int]:
+        return iter_inorder(self)
 
-    def __next__(self) -> int:
-        items = self._get_items()
-        if self._current < len(items):
-            cur_value = items[self._current]
-            self._current += 1
-            return cur_value
-        else:
-            raise StopIteration
+    def __reversed__(self) -> Iterator[int]:
+        return iter_inorder(self, reverse=True)
 
     def _create_tree(self, value: int | list[int]) -> None:
         if type(value) == int:
@@ -66,6 +69,7 @@ class SplayTree:
 
     def _rotate_left(self, x: TreeNode) -> None:
         """Малое левое вращение"""
+        self._version += 1
         y = x.right
         x.right = y.left
         if y.left:
@@ -82,6 +86,7 @@ class SplayTree:
 
     def _rotate_right(self, x: TreeNode) -> None:
         """Малое правое вращение"""
+        self._version += 1
         y = x.left
         x.left = y.right
         if y.right:
@@ -119,6 +124,7 @@ class SplayTree:
                 self._rotate_left(g)
 
     def append(self, value: int) -> None:
+        self._version += 1
         new_node = TreeNode(value)
         if not self._root:
             self._root = new_node
@@ -172,6 +178,7 @@ class SplayTree:
         if self._root.value != value:
             return False
 
+        self._version += 1
         left_tree = self._root.left
         right_tree = self._root.right
 
@@ -195,6 +202,86 @@ class SplayTree:
                 right_tree.parent = self._root
         return True
 
+    def irange(self, low: Optional[int] = None, high: Optional[int] = None, reverse: bool = False) -> Iterator[int]:
+        return iter_range(self, low, high, reverse)
+
+    def floor(self, value: int) -> Optional[int]:
+        return self._bound(value, below=True, inclusive=True)
+
+    def ceiling(self, value: int) -> Optional[int]:
+        return self._bound(value, below=False, inclusive=True)
+
+    def lower(self, value: int) -> Optional[int]:
+        return self._bound(value, below=True, inclusive=False)
+
+    def higher(self, value: int) -> Optional[int]:
+        return self._bound(value, below=False, inclusive=False)
+
+    def delete_range(self, low: Optional[int] = None, high: Optional[int] = None) -> int:
+        # предшественник low поднимается в корень - справа от него всё >= low; в этом правом поддереве
+        # в корень поднимается первый узел >= high - слева от него ровно [low, high), это поддерево отрезается
+        if not self._root:
+            return 0
+
+        left = None
+        rest = self._root
+        if low is not None:
+            node, _ = find_bound(self._root, low, below=True, inclusive=False)
+            if node:
+                self._splay(node)
+                left, rest = node, node.right
+                left.right = None
+                if rest:
+                    rest.parent = None
+
+        right = None
+        middle = rest
+        if high is not None and rest:
+            node, _ = find_bound(rest, high, below=False, inclusive=True)
+            if node:
+                self._root = rest
+                self._splay(node)
+                right, middle = node, node.left
+                right.left = None
+
+        self._version += 1
+        if left:
+            left.right = right
+            if right:
+                right.parent = left
+            self._root = left
+        else:
+            self._root = right
+            if right:
+                right.parent = None
+
+        removed = 0
+        stack = [middle] if middle else []
+        while stack:
+            node = stack.pop()
+            removed += 1
+            stack.extend(child for child in (node.left, node.right) if child)
+        return removed
+
+    def _bound(self, value: int, below: bool, inclusive: bool) -> Optional[int]:
+        # как и search, поднимает в корень последний посещённый узел
+        node, last = find_bound(self._root, value, below, inclusive)
+        if last:
+            self._splay(last)
+        return node.value if node else None
+
+    def iter_preorder(self, mirror: bool = False) -> Iterator[int]:
+        return iter_preorder(self, mirror)
+
+    def iter_inorder(self, reverse: bool = False) -> Iterator[int]:
+        return iter_inorder(self, reverse)
+
+    def iter_postorder(self, mirror: bool = False) -> Iterator[int]:
+        return iter_postorder(self, mirror)
+
+    def iter_level_order(self, mirror: bool = False) -> Iterator[int]:
+        return iter_level_order(self, mirror)
+
 
 if __name__ == "__main__":
     tree = SplayTree([10, 20, 5, 15])
@@ -208,3 +295,5 @@ if __name__ == "__main__":
     tree.delete(5)
 
     print(tree)
+    print(f'[12, 30): {list(tree.irange(12, 30))}, floor(14) = {tree.floor(14)}, higher(15) = {tree.higher(15)}')
+    print(f'delete_range(11, 16) удалил {tree.delete_range(11, 16)}: {tree}')
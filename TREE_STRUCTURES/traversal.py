@@ -0,0 +1,263 @@
+from collections import deque
+from typing import Any, Iterator, Optional
+
+# Ленивые обходы для деревьев этого каталога. Дерево хранит корень в _root и счётчик изменений
+# в _version; генераторы держат только стек пути (O(высоты) памяти, у обхода в ширину - очередь уровня)
+# и после каждого возврата значения проверяют, что дерево не менялось.
+
+
+def _check_version(tree: Any, version: int) -> None:
+    if tree._version != version:
+        raise RuntimeError('Tree changed during iteration')
+
+
+def iter_inorder(tree: Any, reverse: bool = False) -> Iterator[int]:
+    version = tree._version
+    stack = []
+    node = tree._root
+
+    while stack or node is not None:
+        while node is not None:
+            stack.append(node)
+            node = node.right if reverse else node.left
+
+        node = stack.pop()
+        yield node.value
+        _check_version(tree, version)
+        node = node.left if reverse else node.right
+
+
+# mirror у обходов ниже - зеркальный обход (правый ребёнок раньше левого), а не исходный порядок
+# с конца. Развёрнутым оказывается только in-order: для него reverse даёт убывание.
+
+
+def iter_preorder(tree: Any, mirror: bool = False) -> Iterator[int]:
+    version = tree._version
+    stack = [tree._root] if tree._root is not None else []
+
+    while stack:
+        node = stack.pop()
+        yield node.value
+        _check_version(tree, version)
+
+        first, second = (node.left, node.right) if mirror else (node.right, node.left)
+        if first is not None:
+            stack.append(first)
+        if second is not None:
+            stack.append(second)
+
+
+def iter_postorder(tree: Any, mirror: bool = False) -> Iterator[int]:
+    # узел выдаётся, когда из него вернулись через последнего ребёнка
+    version = tree._version
+    stack = []
+    node = tree._root
+    last = None
+
+    while stack or node is not None:
+        if node is not None:
+            stack.append(node)
+            node = node.right if mirror else node.left
+            continue
+
+        top = stack[-1]
+        second = top.left if mirror else top.right
+        if second is not None and second is not last:
+            node = second
+        else:
+            last = stack.pop()
+            yield last.value
+            _check_version(tree, version)
+
+
+def iter_level_order(tree: Any, mirror: bool = False) -> Iterator[int]:
+    version = tree._version
+    queue = deque([tree._root] if tree._root is not None else [])
+
+    while queue:
+        node = queue.popleft()
+        yield node.value
+        _check_version(tree, version)
+
+        first, second = (node.right, node.left) if mirror else (node.left, node.right)
+        if first is not None:
+            queue.append(first)
+        if second is not None:
+            queue.append(second)
+
+
+def iter_level_order_backward(tree: Any) -> Iterator[int]:
+    # обход в ширину с конца: уровни собираются заранее (O(n) памяти) и выдаются
+    # от нижнего к корню, каждый - справа налево
+    version = tree._version
+    levels = []
+    level = [tree._root] if tree._root is not None else []
+
+    while level:
+        levels.append(level)
+        level = [child for node in level for child in (node.left, node.right) if child is not None]
+
+    for level in reversed(levels):
+        for node in reversed(level):
+            yield node.value
+            _check_version(tree, version)
+
+
+def iter_range(tree: Any, low: Optional[int] = None, high: Optional[int] = None,
+               reverse: bool = False) -> Iterator[int]:
+    # значения из [low, high) по возрастанию (или убыванию); None - граница не задана.
+    # При спуске в стек попадают только узлы внутри ближней границы, поэтому до первого значения
+    # проходится один путь, а дальше - только выдаваемые узлы и их соседи
+    version = tree._version
+    stack = []
+    node = tree._root
+
+    while node is not None:
+        if not reverse and low is not None and node.value < low:
+            node = node.right
+        elif reverse and high is not None and node.value >= high:
+            node = node.left
+        else:
+            stack.append(node)
+            node = node.right if reverse else node.left
+
+    while stack:
+        node = stack.pop()
+        if not reverse and high is not None and node.value >= high:
+            return
+        if reverse and low is not None and node.value < low:
+            return
+
+        yield node.value
+        _check_version(tree, version)
+
+        node = node.left if reverse else node.right
+        while node is not None:
+            stack.append(node)
+            node = node.right if reverse else node.left
+
+
+def find_bound(root: Any, value: int, below: bool, inclusive: bool) -> tuple[Any, Any]:
+    # ближайший к value узел снизу (below) или сверху, включая сам value при inclusive;
+    # вторым возвращается последний посещённый узел - его поднимает наверх SplayTree
+    best = None
+    last = None
+    node = root
+
+    while node is not None:
+        last = node
+        if node.value == value and inclusive:
+            return node, node
+
+        if (node.value < value) == below and node.value != value:
+            best = node
+            node = node.right if below else node.left
+        else:
+            node = node.left if below else node.right
+
+    return best, last
+
+
+# Списочные обходы без рекурсии: стек пути вместо стека вызовов, поэтому вырожденное дерево
+# любой глубины не упирается в лимит рекурсии. Методы списков и стека связаны с локальными именами -
+# в горячем цикле это заметно быстрее поиска атрибута на каждом узле.
+
+
+def collect_preorder(root: Any) -> list[int]:
+    # спуск по левой ветке, правые дети откладываются в стек
+    result = []
+    append = result.append
+    stack = []
+    push, pop = stack.append, stack.pop
+    node = root
+
+    while True:
+        while node is not None:
+            append(node.value)
+            if node.right is not None:
+                push(node.right)
+            node = node.left
+        if not stack:
+            return result
+        node = pop()
+
+
+def collect_inorder(root: Any) -> list[int]:
+    result = []
+    append = result.append
+    stack = []
+    push, pop = stack.append, stack.pop
+    node = root
+
+    while True:
+        while node is not None:
+            push(node)
+            node = node.left
+        if not stack:
+            return result
+        node = pop()
+        append(node.value)
+        node = node.right
+
+
+def collect_postorder(root: Any) -> list[int]:
+    # зеркальный прямой обход (корень -> правый -> левый), развёрнутый в обратном порядке,
+    # даёт левый -> правый -> корень
+    result = []
+    append = result.append
+    stack = []
+    push, pop = stack.append, stack.pop
+    node = root
+
+    while True:
+        while node is not None:
+            append(node.value)
+            if node.left is not None:
+                push(node.left)
+            node = node.right
+        if not stack:
+            break
+        node = pop()
+
+    result.reverse()
+    return result
+
+
+def morris_inorder(root: Any) -> list[int]:
+    # O(1) дополнительной памяти: правый указатель предшественника временно ведёт обратно в узел,
+    # к концу обхода все такие нити сняты и дерево восстановлено
+    result = []
+    append = result.append
+    node = root
+
+    while node is not None:
+        if node.left is None:
+            append(node.value)
+            node = node.right
+            continue
+
+        predecessor = node.left
+        while predecessor.right is not None and predecessor.right is not node:
+            predecessor = predecessor.right
+
+        if predecessor.right is None:
+            predecessor.right = node
+            node = node.left
+        else:
+            predecessor.right = None
+            append(node.value)
+            node = node.right
+
+    return result
+
+
+def subtree_height(node: Any) -> int:
+    # количество уровней: обход в ширину по одному уровню за шаг
+    height = 0
+    level = [node] if node is not None else []
+
+    while level:
+        height += 1
+        level = [child for cur_node in level for child in (cur_node.left, cur_node.right) if child is not None]
+
+    return height